@@ -1,153 +1,13 @@
-from startup_watch.adapters.a16z import A16zAdapter
-from startup_watch.adapters.agdaily import AgdailyAdapter
-from startup_watch.adapters.agfunder_news import AgfunderNewsAdapter
-from startup_watch.adapters.agfunder import AgfunderAdapter
-from startup_watch.adapters.agfunder_pod import AgfunderPodAdapter
-from startup_watch.adapters.agriinvestor import AgriinvestorAdapter
-from startup_watch.adapters.agweb import AgwebAdapter
-from startup_watch.adapters.antler import AntlerAdapter
-from startup_watch.adapters.angellist_startups import AngellistStartupsAdapter
-from startup_watch.adapters.alchemist import AlchemistAdapter
-from startup_watch.adapters.atdc import AtdcAdapter
-from startup_watch.adapters.berkeley_skydeck import BerkeleySkydeckAdapter
-from startup_watch.adapters.cornell_tech import CornellTechAdapter
-from startup_watch.adapters.climateinsider import ClimateinsiderAdapter
-from startup_watch.adapters.crunchbase_news import CrunchbaseNewsAdapter
-from startup_watch.adapters.cleanenergywire import CleanenergywireAdapter
-from startup_watch.adapters.bessemer import BessemerAdapter
-from startup_watch.adapters.betalist import BetalistAdapter
-from startup_watch.adapters.dealroom import DealroomAdapter
-from startup_watch.adapters.freightwaves import FreightwavesAdapter
-from startup_watch.adapters.foodbytes import FoodbytesAdapter
-from startup_watch.adapters.gust import GustAdapter
-from startup_watch.adapters.fivehundred_global import FivehundredGlobalAdapter
-from startup_watch.adapters.hackernews import HackernewsAdapter
-from startup_watch.adapters.harvard_ilab import HarvardIlabAdapter
-from startup_watch.adapters.eu_startups import EuStartupsAdapter
-from startup_watch.adapters.enterprise_ireland import EnterpriseIrelandAdapter
-from startup_watch.adapters.eth_pioneer import EthPioneerAdapter
-from startup_watch.adapters.eit_food import EitFoodAdapter
-from startup_watch.adapters.f6s import F6sAdapter
-from startup_watch.adapters.firstround import FirstroundAdapter
-from startup_watch.adapters.future_ag import FutureAgAdapter
-from startup_watch.adapters.industryweek import IndustryweekAdapter
-from startup_watch.adapters.iiot_world import IiotWorldAdapter
-from startup_watch.adapters.indiehackers import IndiehackersAdapter
-from startup_watch.adapters.iot_analytics import IotAnalyticsAdapter
-from startup_watch.adapters.linkedin import LinkedInAdapter
-from startup_watch.adapters.logisticsmgmt import LogisticsmgmtAdapter
-from startup_watch.adapters.manufacturing_net import ManufacturingNetAdapter
-from startup_watch.adapters.masschallenge import MasschallengeAdapter
-from startup_watch.adapters.mfg_dive import MfgDiveAdapter
-from startup_watch.adapters.mit_deltav import MitDeltavAdapter
-from startup_watch.adapters.mmh import MmhAdapter
-from startup_watch.adapters.owler import OwlerAdapter
-from startup_watch.adapters.oxford_foundry import OxfordFoundryAdapter
-from startup_watch.adapters.openvc import OpenvcAdapter
-from startup_watch.adapters.plugandplay_sc import PlugandplayScAdapter
-from startup_watch.adapters.plugandplay_food import PlugandplayFoodAdapter
-from startup_watch.adapters.pitchbook_blog import PitchbookBlogAdapter
-from startup_watch.adapters.producthunt import ProducthuntAdapter
-from startup_watch.adapters.reddit_startups import RedditStartupsAdapter
-from startup_watch.adapters.s2g_companies import S2gCompaniesAdapter
-from startup_watch.adapters.seedtable import SeedtableAdapter
-from startup_watch.adapters.sequoia import SequoiaAdapter
-from startup_watch.adapters.skydeck_fund import SkydeckFundAdapter
-from startup_watch.adapters.sifted import SiftedAdapter
-from startup_watch.adapters.smart_industry import SmartIndustryAdapter
-from startup_watch.adapters.spendmatters import SpendmattersAdapter
-from startup_watch.adapters.stanford_startx import StanfordStartxAdapter
-from startup_watch.adapters.startupstream import StartupStreamAdapter
-from startup_watch.adapters.startupland import StartuplandAdapter
-from startup_watch.adapters.startup_genome import StartupGenomeAdapter
-from startup_watch.adapters.supplychainbrain import SupplychainbrainAdapter
-from startup_watch.adapters.sustainability_mag import SustainabilityMagAdapter
-from startup_watch.adapters.supplychaindive import SupplychaindiveAdapter
-from startup_watch.adapters.techcrunch_funding import TechcrunchFundingAdapter
-from startup_watch.adapters.tech_eu import TechEuAdapter
-from startup_watch.adapters.techstars import TechstarsAdapter
-from startup_watch.adapters.tractica_ai import TracticaAiAdapter
-from startup_watch.adapters.uw_comotion import UwComotionAdapter
-from startup_watch.adapters.therobotreport import TherobotreportAdapter
-from startup_watch.adapters.thrive_agtech import ThriveAgtechAdapter
-from startup_watch.adapters.venturebeat_ai import VenturebeatAiAdapter
-from startup_watch.adapters.wellfound import WellfoundAdapter
-from startup_watch.adapters.yc import YCombinatorAdapter
+"""Source adapters, imported lazily from ``startup_watch.adapters.registry``."""
 
-__all__ = [
-    "A16zAdapter",
-    "AgdailyAdapter",
-    "AgfunderNewsAdapter",
-    "AgfunderAdapter",
-    "AgfunderPodAdapter",
-    "AgriinvestorAdapter",
-    "AgwebAdapter",
-    "AntlerAdapter",
-    "AngellistStartupsAdapter",
-    "AlchemistAdapter",
-    "AtdcAdapter",
-    "BerkeleySkydeckAdapter",
-    "CornellTechAdapter",
-    "ClimateinsiderAdapter",
-    "CrunchbaseNewsAdapter",
-    "CleanenergywireAdapter",
-    "BessemerAdapter",
-    "BetalistAdapter",
-    "DealroomAdapter",
-    "FreightwavesAdapter",
-    "FoodbytesAdapter",
-    "GustAdapter",
-    "FivehundredGlobalAdapter",
-    "HackernewsAdapter",
-    "HarvardIlabAdapter",
-    "EuStartupsAdapter",
-    "EnterpriseIrelandAdapter",
-    "EthPioneerAdapter",
-    "EitFoodAdapter",
-    "F6sAdapter",
-    "FirstroundAdapter",
-    "FutureAgAdapter",
-    "IndustryweekAdapter",
-    "IiotWorldAdapter",
-    "IndiehackersAdapter",
-    "IotAnalyticsAdapter",
-    "LinkedInAdapter",
-    "LogisticsmgmtAdapter",
-    "ManufacturingNetAdapter",
-    "MasschallengeAdapter",
-    "MfgDiveAdapter",
-    "MitDeltavAdapter",
-    "MmhAdapter",
-    "OwlerAdapter",
-    "OxfordFoundryAdapter",
-    "OpenvcAdapter",
-    "PlugandplayScAdapter",
-    "PlugandplayFoodAdapter",
-    "PitchbookBlogAdapter",
-    "ProducthuntAdapter",
-    "RedditStartupsAdapter",
-    "S2gCompaniesAdapter",
-    "SeedtableAdapter",
-    "SequoiaAdapter",
-    "SkydeckFundAdapter",
-    "SiftedAdapter",
-    "SmartIndustryAdapter",
-    "SpendmattersAdapter",
-    "StanfordStartxAdapter",
-    "StartupStreamAdapter",
-    "StartuplandAdapter",
-    "StartupGenomeAdapter",
-    "SupplychainbrainAdapter",
-    "SustainabilityMagAdapter",
-    "SupplychaindiveAdapter",
-    "TechcrunchFundingAdapter",
-    "TechEuAdapter",
-    "TechstarsAdapter",
-    "TracticaAiAdapter",
-    "UwComotionAdapter",
-    "TherobotreportAdapter",
-    "ThriveAgtechAdapter",
-    "VenturebeatAiAdapter",
-    "WellfoundAdapter",
-    "YCombinatorAdapter",
-]
+from startup_watch.adapters.registry import BUILTIN_ADAPTERS, load_adapter_class
+
+_BY_CLASS = {target.partition(":")[2]: target for target in BUILTIN_ADAPTERS.values()}
+
+__all__ = sorted(_BY_CLASS)
+
+
+def __getattr__(name: str) -> type:
+    if name in _BY_CLASS:
+        return load_adapter_class(_BY_CLASS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
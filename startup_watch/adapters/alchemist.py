@@ -1,7 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import node_text
 from startup_watch.schema import StartupSignal
 
 
@@ -23,17 +21,12 @@ class AlchemistAdapter(BaseAdapter):
         if not url:
             return []
         try:
-            response = requests.get(
-                url,
-                timeout=20,
-                headers={"User-Agent": "startup-watch/1.0"},
-            )
+            response = self.http_get(url)
             if response.status_code != 200:
                 return []
-            soup = BeautifulSoup(response.text, "lxml")
             output: list[StartupSignal] = []
-            for node in soup.select("h2, h3, a"):
-                name = node.get_text(" ", strip=True)
+            for node in self.select_html(response, "h2, h3, a"):
+                name = node_text(node)
                 if not name or len(name) > 80:
                     continue
                 output.append(
@@ -46,5 +39,5 @@ class AlchemistAdapter(BaseAdapter):
                     ).normalize()
                 )
             return output
-        except Exception:
-            return []
+        except Exception as exc:
+            return self.failed(exc)
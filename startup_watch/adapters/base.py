@@ -1,15 +1,256 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
 
+import feedparser
+
+from startup_watch.extract import select
+from startup_watch.feedparse import parse_feed
+from startup_watch.outcomes import FetchResult, classify
+from startup_watch.retry import parse_retry_after
 from startup_watch.schema import StartupSignal
+from startup_watch.state import CursorStore
+from startup_watch.transport import (
+    FEED_TYPES,
+    HTML_TYPES,
+    FeedFetch,
+    HttpTransport,
+    TransportResponse,
+    get_default_transport,
+)
 
 
 class BaseAdapter(ABC):
     source_name: str = "base"
     requires_auth: bool = False
+    not_modified: bool = False
+    offline_miss: bool = False
+    last_status: int | None = None
+    last_error: Exception | None = None
+    last_retry_after: float | None = None
+    max_feed_entries: int = 50
+    content_types: tuple[str, ...] = HTML_TYPES
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        transport: HttpTransport | None = None,
+        cursors: CursorStore | None = None,
+    ):
         self.config = config
+        self.transport = transport or get_default_transport()
+        self.cursors = cursors
 
     @abstractmethod
     def fetch(self) -> list[StartupSignal]:
         """Return normalized startup signals."""
+
+    def failed(self, exc: Exception) -> list[StartupSignal]:
+        """Record why ``fetch`` gave up and return no signals.
+
+        Adapters call this from their catch-all handler so the error still
+        reaches ``fetch_result`` instead of looking like an empty feed.
+        """
+        self.last_error = exc
+        return []
+
+    def reset_attempt(self) -> None:
+        self.not_modified = False
+        self.offline_miss = False
+        self.last_status = None
+        self.last_error = None
+        self.last_retry_after = None
+
+    def result(
+        self, signals: list[StartupSignal], elapsed: float, error: Exception | None = None
+    ) -> FetchResult:
+        error = error or self.last_error
+        return FetchResult(
+            signals=signals,
+            outcome=classify(
+                signals, self.last_status, error, self.not_modified, self.offline_miss
+            ),
+            status=self.last_status,
+            elapsed=elapsed,
+            error=repr(error) if error is not None else "",
+            retry_after=self.last_retry_after,
+        )
+
+    def fetch_result(self) -> FetchResult:
+        """Run ``fetch`` once and classify what happened."""
+        self.reset_attempt()
+        started = time.monotonic()
+        try:
+            signals = self.fetch()
+        except Exception as exc:
+            return self.result([], time.monotonic() - started, exc)
+        return self.result(signals, time.monotonic() - started)
+
+    async def afetch_result(self) -> FetchResult:
+        """Async twin of ``fetch_result`` around ``afetch``."""
+        self.reset_attempt()
+        started = time.monotonic()
+        try:
+            signals = await self.afetch()
+        except Exception as exc:
+            return self.result([], time.monotonic() - started, exc)
+        return self.result(signals, time.monotonic() - started)
+
+    def request_options(self, **kwargs: object) -> dict:
+        """Transport kwargs with this adapter's overrides.
+
+        The adapter block may set ``cache_ttl_seconds``, ``rate_limit_per_second``,
+        ``rate_limit_burst``, ``max_response_bytes`` and ``allowed_content_types``;
+        the allowlist defaults to the caller's, else ``content_types``.
+        """
+        for option, key in (
+            ("ttl", "cache_ttl_seconds"),
+            ("rate_limit", "rate_limit_per_second"),
+            ("rate_burst", "rate_limit_burst"),
+        ):
+            if self.config.get(key) is not None:
+                kwargs.setdefault(option, float(self.config[key]))
+        if self.config.get("max_response_bytes") is not None:
+            kwargs.setdefault("max_bytes", int(self.config["max_response_bytes"]))
+        if self.config.get("allowed_content_types") is not None:
+            kwargs["content_types"] = tuple(self.config["allowed_content_types"])
+        kwargs.setdefault("content_types", self.content_types)
+        return kwargs
+
+    def note_response(self, response: TransportResponse) -> None:
+        self.offline_miss = self.offline_miss or getattr(response, "offline_miss", False)
+        # Keep the first failing status: it explains an empty multi-page fetch.
+        if self.last_status is None or self.last_status < 400:
+            self.last_status = response.status_code
+            if response.status_code >= 400:
+                headers = {name.lower(): value for name, value in response.headers.items()}
+                self.last_retry_after = parse_retry_after(headers.get("retry-after"))
+
+    def http_get(self, url: str, **kwargs: object) -> TransportResponse:
+        """GET ``url`` through the transport with this adapter's overrides."""
+        response = self.transport.get(url, **self.request_options(**kwargs))
+        self.note_response(response)
+        return response
+
+    def select_html(self, response: TransportResponse, selector: str) -> list:
+        """lxml elements of ``response`` matching the configured ``selector``.
+
+        The adapter block's ``selector`` (CSS, or XPath starting with ``/``)
+        overrides the adapter's default.
+        """
+        selector = self.config.get("selector", selector)
+        return select(response.content, selector, encoding=response.encoding)
+
+    def select_rendered(self, url: str, response: TransportResponse, selector: str) -> list:
+        """``select_html``, re-rendering ``url`` in a browser if the content is missing.
+
+        The fallback runs only for adapter blocks with ``render_js: true``,
+        which must also set ``render_wait_for``: a selector for the content
+        the browser builds (e.g. the portfolio grid). The static page is used
+        when it already matches that selector, so pages that render
+        server-side never start a browser; nav and footer links matching the
+        extraction selector do not count. The browser waits for the same
+        selector before the DOM is read.
+        """
+        nodes = self.select_html(response, selector) if response.status_code == 200 else []
+        if not self.config.get("render_js", False):
+            return nodes
+        wait_for = self.config.get("render_wait_for")
+        if not wait_for:
+            raise ValueError(f"{self.source_name}: render_js needs render_wait_for")
+        if nodes and select(response.content, wait_for, encoding=response.encoding):
+            return nodes
+        ttl = self.config.get("cache_ttl_seconds")
+        rendered = self.transport.render(
+            url,
+            wait_for=wait_for,
+            ttl=float(ttl) if ttl is not None else None,
+        )
+        self.last_status = rendered.status_code
+        self.offline_miss = self.offline_miss or rendered.offline_miss
+        if rendered.status_code != 200:
+            return []
+        return self.select_html(rendered, selector)
+
+    def _download_feed(self, url: str) -> FeedFetch:
+        response = self.transport.get(
+            url, **self.request_options(conditional=True, content_types=FEED_TYPES)
+        )
+        if response.status_code != 200:
+            return response, feedparser.FeedParserDict(entries=[])
+        self.transport.flights.note_content(url, response.content)
+        # Incremental runs skip seen entries afterwards, so they need them all.
+        max_items = None if self.cursors is not None else self.max_feed_entries
+        return response, parse_feed(
+            response.content,
+            response.headers,
+            max_items=max_items,
+            fast=self.config.get("feed_parser", "fast") == "fast",
+        )
+
+    def fetch_feed(self, url: str) -> feedparser.FeedParserDict:
+        """Download ``url`` through the transport, then parse the bytes.
+
+        Keeping the network out of the parser gives feeds the transport's
+        timeouts, size cap and pooled connections. Parsing stops after
+        ``max_feed_entries`` items (see ``startup_watch.feedparse``). The request is conditional:
+        an unchanged feed answers 304, is not parsed, and sets
+        ``not_modified``. Adapters sharing a feed URL download and parse it
+        once per run. With a cursor store (incremental runs) only entries not
+        emitted by an earlier run are returned.
+
+        A shared download is made and parsed by whichever adapter asks first:
+        its ``request_options`` (TTL, byte cap, content types) and its
+        ``max_feed_entries`` apply to every adapter on that URL, so adapters
+        sharing a feed should agree on them. Incremental runs parse every
+        entry, and each adapter still takes only its own ``max_feed_entries``
+        new ones.
+        """
+        response, feed = self.transport.flights.do(
+            url,
+            lambda: self._download_feed(url),
+            caller=self.source_name,
+            keep=lambda result: result[0].status_code in (200, 304),
+        )
+        self.note_response(response)
+        self.not_modified = response.not_modified
+        if self.cursors is not None:
+            feed = feedparser.FeedParserDict(feed)
+            feed["entries"] = self.cursors.take_new(
+                self.source_name, feed.entries, limit=self.max_feed_entries
+            )
+        return feed
+
+    async def afetch(self) -> list[StartupSignal]:
+        """Return normalized startup signals without blocking the event loop.
+
+        The default runs the blocking ``fetch`` in a worker thread, and no
+        shipped adapter overrides it: the transport is synchronous. Only an
+        adapter that brings its own async I/O gains anything from overriding.
+        """
+        return await asyncio.to_thread(self.fetch)
+
+
+def has_native_afetch(adapter: object) -> bool:
+    afetch = getattr(type(adapter), "afetch", None)
+    return afetch is not None and afetch is not BaseAdapter.afetch
+
+
+def fetch_result(adapter: object) -> FetchResult:
+    """Return ``adapter.fetch_result()``, wrapping plain ``fetch``-only objects."""
+    if isinstance(adapter, BaseAdapter):
+        return adapter.fetch_result()
+    started = time.monotonic()
+    try:
+        signals = adapter.fetch()
+    except Exception as exc:
+        return FetchResult(
+            outcome=classify([], error=exc),
+            elapsed=time.monotonic() - started,
+            error=repr(exc),
+        )
+    return FetchResult(
+        signals=signals,
+        outcome=classify(signals, not_modified=getattr(adapter, "not_modified", False)),
+        elapsed=time.monotonic() - started,
+    )
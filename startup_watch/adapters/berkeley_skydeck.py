@@ -1,7 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import node_text
 from startup_watch.schema import StartupSignal
 
 
@@ -9,7 +7,8 @@ class BerkeleySkydeckAdapter(BaseAdapter):
     """Berkeley SkyDeck adapter.
 
     Source: SkyDeck portfolio pages.
-    Method: HTML parsing.
+    Method: HTML parsing; the portfolio grid is rendered client-side, so the
+    block may set ``render_js: true`` to fall back to the browser pool.
     Stage signal: accelerator/fund cohorts.
     Thesis alignment: supply-chain, agtech, industrial AI.
     """
@@ -23,13 +22,10 @@ class BerkeleySkydeckAdapter(BaseAdapter):
         if not url:
             return []
         try:
-            response = requests.get(url, timeout=20, headers={"User-Agent": "startup-watch/1.0"})
-            if response.status_code != 200:
-                return []
-            soup = BeautifulSoup(response.text, "lxml")
+            response = self.http_get(url)
             output: list[StartupSignal] = []
-            for card in soup.select("h2, h3, a"):
-                name = card.get_text(" ", strip=True)
+            for card in self.select_rendered(url, response, "h2, h3, a"):
+                name = node_text(card)
                 if not name or len(name) > 80:
                     continue
                 output.append(
@@ -42,5 +38,5 @@ class BerkeleySkydeckAdapter(BaseAdapter):
                     ).normalize()
                 )
             return output
-        except Exception:
-            return []
+        except Exception as exc:
+            return self.failed(exc)
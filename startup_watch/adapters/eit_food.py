@@ -1,7 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import node_text
 from startup_watch.schema import StartupSignal
 
 
@@ -17,13 +15,12 @@ class EitFoodAdapter(BaseAdapter):
         if not url:
             return []
         try:
-            response = requests.get(url, timeout=20, headers={"User-Agent": "startup-watch/1.0"})
+            response = self.http_get(url)
             if response.status_code != 200:
                 return []
-            soup = BeautifulSoup(response.text, "lxml")
             out: list[StartupSignal] = []
-            for node in soup.select("a, h2, h3"):
-                name = node.get_text(" ", strip=True)
+            for node in self.select_html(response, "a, h2, h3"):
+                name = node_text(node)
                 if not name or len(name) > 80:
                     continue
                 out.append(
@@ -36,5 +33,5 @@ class EitFoodAdapter(BaseAdapter):
                     ).normalize()
                 )
             return out
-        except Exception:
-            return []
+        except Exception as exc:
+            return self.failed(exc)
@@ -0,0 +1,80 @@
+import os
+from functools import lru_cache
+
+import yaml
+
+from startup_watch.adapters.base import BaseAdapter
+from startup_watch.schema import StartupSignal
+
+FEEDS_PATH = os.path.join(os.path.dirname(__file__), "feeds.yaml")
+DEFAULT_FIELDS = {"company_name": "title", "description": "summary", "source_url": "link"}
+
+
+class FeedAdapter(BaseAdapter):
+    """Generic RSS/Atom adapter; one subclass per source in ``feeds.yaml``.
+
+    The adapter block may override ``stage``, ``categories``, ``max_items``
+    and ``fields`` (signal field -> feed entry key).
+    """
+
+    source_name = "feed"
+    stage: str = "seed"
+    categories: tuple[str, ...] = ()
+
+    def fetch(self) -> list[StartupSignal]:
+        if not self.config.get("enabled", False):
+            return []
+        url = self.config.get("url", "")
+        if not url:
+            return []
+        # Incremental runs only mark as seen the entries this adapter keeps.
+        self.max_feed_entries = int(self.config.get("max_items", BaseAdapter.max_feed_entries))
+        fields = {**DEFAULT_FIELDS, **self.config.get("fields", {})}
+        stage = self.config.get("stage", self.stage)
+        categories = self.config.get("categories", self.categories)
+        try:
+            feed = self.fetch_feed(url)
+            out: list[StartupSignal] = []
+            for entry in feed.entries[: self.max_feed_entries]:
+                out.append(
+                    StartupSignal(
+                        company_name=getattr(entry, fields["company_name"], "")[:80],
+                        description=getattr(entry, fields["description"], "")[:280],
+                        stage=stage,
+                        categories=list(categories),
+                        source_name=self.source_name,
+                        source_url=getattr(entry, fields["source_url"], "") or url,
+                    ).normalize()
+                )
+            return out
+        except Exception as exc:
+            return self.failed(exc)
+
+
+@lru_cache(maxsize=1)
+def feed_definitions() -> dict[str, dict]:
+    with open(FEEDS_PATH, "r", encoding="utf-8") as handle:
+        return yaml.safe_load(handle) or {}
+
+
+@lru_cache(maxsize=None)
+def feed_adapter_class(class_name: str) -> type[FeedAdapter]:
+    """Build the named alias subclass of ``FeedAdapter`` from ``feeds.yaml``."""
+    for definition in feed_definitions().values():
+        if definition["class"] == class_name:
+            return type(
+                class_name,
+                (FeedAdapter,),
+                {
+                    "__doc__": definition.get("description", ""),
+                    "__module__": __name__,
+                    "source_name": definition["source_name"],
+                    "stage": definition.get("stage", FeedAdapter.stage),
+                    "categories": tuple(definition.get("categories", ())),
+                },
+            )
+    raise AttributeError(f"module {__name__!r} has no attribute {class_name!r}")
+
+
+def __getattr__(name: str) -> type[FeedAdapter]:
+    return feed_adapter_class(name)
@@ -1,7 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import node_text
 from startup_watch.schema import StartupSignal
 
 
@@ -23,16 +21,11 @@ class MitDeltavAdapter(BaseAdapter):
         output: list[StartupSignal] = []
         for url in urls:
             try:
-                response = requests.get(
-                    url,
-                    timeout=20,
-                    headers={"User-Agent": "startup-watch/1.0"},
-                )
+                response = self.http_get(url)
                 if response.status_code != 200:
                     continue
-                soup = BeautifulSoup(response.text, "lxml")
-                for header in soup.select("h2, h3, h4"):
-                    name = header.get_text(" ", strip=True)
+                for header in self.select_html(response, "h2, h3, h4"):
+                    name = node_text(header)
                     if not name or len(name) > 80:
                         continue
                     output.append(
@@ -44,6 +37,7 @@ class MitDeltavAdapter(BaseAdapter):
                             categories=["manufacturing software", "supply chain"],
                         ).normalize()
                     )
-            except Exception:
+            except Exception as exc:
+                self.failed(exc)
                 continue
         return output
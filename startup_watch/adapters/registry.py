@@ -0,0 +1,324 @@
+import importlib
+from functools import lru_cache
+from importlib.metadata import entry_points
+
+ENTRY_POINT_GROUP = "startup_watch.adapters"
+
+# Config key -> "module:Class", in run order. Modules are imported only when
+# their config block is enabled.
+BUILTIN_ADAPTERS: dict[str, str] = {
+    "yc_directory": "startup_watch.adapters.yc:YCombinatorAdapter",
+    "agdaily_adapter": "startup_watch.adapters.feeds:AgdailyAdapter",
+    "startupstream": "startup_watch.adapters.startupstream:StartupStreamAdapter",
+    "linkedin": "startup_watch.adapters.linkedin:LinkedInAdapter",
+    "mit_deltav_adapter": "startup_watch.adapters.mit_deltav:MitDeltavAdapter",
+    "stanford_startx_adapter": "startup_watch.adapters.stanford_startx:StanfordStartxAdapter",
+    "berkeley_skydeck_adapter": "startup_watch.adapters.berkeley_skydeck:BerkeleySkydeckAdapter",
+    "cornell_tech_adapter": "startup_watch.adapters.cornell_tech:CornellTechAdapter",
+    "harvard_ilab_adapter": "startup_watch.adapters.harvard_ilab:HarvardIlabAdapter",
+    "oxford_foundry_adapter": "startup_watch.adapters.oxford_foundry:OxfordFoundryAdapter",
+    "eth_pioneer_adapter": "startup_watch.adapters.eth_pioneer:EthPioneerAdapter",
+    "uw_comotion_adapter": "startup_watch.adapters.uw_comotion:UwComotionAdapter",
+    "atdc_adapter": "startup_watch.adapters.atdc:AtdcAdapter",
+    "techstars_adapter": "startup_watch.adapters.techstars:TechstarsAdapter",
+    "fivehundred_global_adapter": (
+        "startup_watch.adapters.fivehundred_global:FivehundredGlobalAdapter"
+    ),
+    "antler_adapter": "startup_watch.adapters.antler:AntlerAdapter",
+    "alchemist_adapter": "startup_watch.adapters.alchemist:AlchemistAdapter",
+    "masschallenge_adapter": "startup_watch.adapters.masschallenge:MasschallengeAdapter",
+    "plugandplay_food_adapter": "startup_watch.adapters.plugandplay_food:PlugandplayFoodAdapter",
+    "startupland_adapter": "startup_watch.adapters.feeds:StartuplandAdapter",
+    "plugandplay_sc_adapter": "startup_watch.adapters.plugandplay_sc:PlugandplayScAdapter",
+    "thrive_agtech_adapter": "startup_watch.adapters.thrive_agtech:ThriveAgtechAdapter",
+    "a16z_adapter": "startup_watch.adapters.a16z:A16zAdapter",
+    "sequoia_adapter": "startup_watch.adapters.sequoia:SequoiaAdapter",
+    "bessemer_adapter": "startup_watch.adapters.bessemer:BessemerAdapter",
+    "firstround_adapter": "startup_watch.adapters.firstround:FirstroundAdapter",
+    "skydeck_fund_adapter": "startup_watch.adapters.skydeck_fund:SkydeckFundAdapter",
+    "s2g_companies_adapter": "startup_watch.adapters.s2g_companies:S2gCompaniesAdapter",
+    "dealroom_adapter": "startup_watch.adapters.dealroom:DealroomAdapter",
+    "f6s_adapter": "startup_watch.adapters.f6s:F6sAdapter",
+    "openvc_adapter": "startup_watch.adapters.openvc:OpenvcAdapter",
+    "startup_genome_adapter": "startup_watch.adapters.startup_genome:StartupGenomeAdapter",
+    "owler_adapter": "startup_watch.adapters.owler:OwlerAdapter",
+    "crunchbase_news_adapter": "startup_watch.adapters.feeds:CrunchbaseNewsAdapter",
+    "gust_adapter": "startup_watch.adapters.gust:GustAdapter",
+    "enterprise_ireland_adapter": (
+        "startup_watch.adapters.enterprise_ireland:EnterpriseIrelandAdapter"
+    ),
+    "tech_eu_adapter": "startup_watch.adapters.feeds:TechEuAdapter",
+    "cleanenergywire_adapter": "startup_watch.adapters.feeds:CleanenergywireAdapter",
+    "sustainability_mag_adapter": (
+        "startup_watch.adapters.feeds:SustainabilityMagAdapter"
+    ),
+    "climateinsider_adapter": "startup_watch.adapters.feeds:ClimateinsiderAdapter",
+    "angellist_startups_adapter": (
+        "startup_watch.adapters.angellist_startups:AngellistStartupsAdapter"
+    ),
+    "eu_startups_adapter": "startup_watch.adapters.eu_startups:EuStartupsAdapter",
+    "future_ag_adapter": "startup_watch.adapters.feeds:FutureAgAdapter",
+    "pitchbook_blog_adapter": "startup_watch.adapters.feeds:PitchbookBlogAdapter",
+    "sifted_adapter": "startup_watch.adapters.feeds:SiftedAdapter",
+    "agriinvestor_adapter": "startup_watch.adapters.feeds:AgriinvestorAdapter",
+    "seedtable_adapter": "startup_watch.adapters.seedtable:SeedtableAdapter",
+    "tractica_ai_adapter": "startup_watch.adapters.feeds:TracticaAiAdapter",
+    "iiot_world_adapter": "startup_watch.adapters.feeds:IiotWorldAdapter",
+    "hackernews_adapter": "startup_watch.adapters.feeds:HackernewsAdapter",
+    "reddit_startups_adapter": "startup_watch.adapters.feeds:RedditStartupsAdapter",
+    "indiehackers_adapter": "startup_watch.adapters.feeds:IndiehackersAdapter",
+    "techcrunch_funding_adapter": (
+        "startup_watch.adapters.feeds:TechcrunchFundingAdapter"
+    ),
+    "agfunder_news_adapter": "startup_watch.adapters.feeds:AgfunderNewsAdapter",
+    "agfunder_adapter": "startup_watch.adapters.agfunder:AgfunderAdapter",
+    "eit_food_adapter": "startup_watch.adapters.eit_food:EitFoodAdapter",
+    "foodbytes_adapter": "startup_watch.adapters.foodbytes:FoodbytesAdapter",
+    "agfunder_pod_adapter": "startup_watch.adapters.feeds:AgfunderPodAdapter",
+    "agweb_adapter": "startup_watch.adapters.feeds:AgwebAdapter",
+    "industryweek_adapter": "startup_watch.adapters.feeds:IndustryweekAdapter",
+    "freightwaves_adapter": "startup_watch.adapters.feeds:FreightwavesAdapter",
+    "wellfound_adapter": "startup_watch.adapters.wellfound:WellfoundAdapter",
+    "betalist_adapter": "startup_watch.adapters.betalist:BetalistAdapter",
+    "producthunt_adapter": "startup_watch.adapters.feeds:ProducthuntAdapter",
+    "spendmatters_adapter": "startup_watch.adapters.feeds:SpendmattersAdapter",
+    "smart_industry_adapter": "startup_watch.adapters.feeds:SmartIndustryAdapter",
+    "iot_analytics_adapter": "startup_watch.adapters.feeds:IotAnalyticsAdapter",
+    "manufacturing_net_adapter": "startup_watch.adapters.feeds:ManufacturingNetAdapter",
+    "mfg_dive_adapter": "startup_watch.adapters.feeds:MfgDiveAdapter",
+    "mmh_adapter": "startup_watch.adapters.feeds:MmhAdapter",
+    "logisticsmgmt_adapter": "startup_watch.adapters.feeds:LogisticsmgmtAdapter",
+    "supplychaindive_adapter": "startup_watch.adapters.feeds:SupplychaindiveAdapter",
+    "therobotreport_adapter": "startup_watch.adapters.feeds:TherobotreportAdapter",
+    "venturebeat_ai_adapter": "startup_watch.adapters.feeds:VenturebeatAiAdapter",
+    "supplychainbrain_adapter": "startup_watch.adapters.feeds:SupplychainbrainAdapter",
+    "techfundingnews_adapter": "startup_watch.adapters.feeds:TechfundingnewsAdapter",
+    "greenqueen_adapter": "startup_watch.adapters.feeds:GreenqueenAdapter",
+    "finsmes_adapter": "startup_watch.adapters.feeds:FinsmesAdapter",
+    "siliconcanals_adapter": "startup_watch.adapters.feeds:SiliconcanalsAdapter",
+    "vestbee_adapter": "startup_watch.adapters.feeds:VestbeeAdapter",
+    "startupdaily_adapter": "startup_watch.adapters.feeds:StartupdailyAdapter",
+    "techinasia_adapter": "startup_watch.adapters.feeds:TechinasiaAdapter",
+    "yourstory_adapter": "startup_watch.adapters.feeds:YourstoryAdapter",
+    "builtin_adapter": "startup_watch.adapters.feeds:BuiltinAdapter",
+    "euvc_adapter": "startup_watch.adapters.feeds:EuvcAdapter",
+    "sifted_news_adapter": "startup_watch.adapters.feeds:SiftedNewsAdapter",
+    "unicornnest_adapter": "startup_watch.adapters.feeds:UnicornnestAdapter",
+    "startupnewsfyi_adapter": "startup_watch.adapters.feeds:StartupnewsfyiAdapter",
+    "latitud_adapter": "startup_watch.adapters.feeds:LatitudAdapter",
+    "refreshmiami_adapter": "startup_watch.adapters.feeds:RefreshmiamiAdapter",
+    "geekwire_adapter": "startup_watch.adapters.feeds:GeekwireAdapter",
+    "thenextweb_adapter": "startup_watch.adapters.feeds:ThenextwebAdapter",
+    "e27_adapter": "startup_watch.adapters.feeds:E27Adapter",
+    "startupbeat_adapter": "startup_watch.adapters.feeds:StartupbeatAdapter",
+    "entrepreneurshiplife_adapter": (
+        "startup_watch.adapters.feeds:EntrepreneurshiplifeAdapter"
+    ),
+    "innovationorigins_adapter": (
+        "startup_watch.adapters.feeds:InnovationoriginsAdapter"
+    ),
+    "startupsmagazine_adapter": "startup_watch.adapters.feeds:StartupsmagazineAdapter",
+    "vccircle_adapter": "startup_watch.adapters.feeds:VccircleAdapter",
+    "techpoint_africa_adapter": "startup_watch.adapters.feeds:TechpointAfricaAdapter",
+    "disruptafrica_adapter": "startup_watch.adapters.feeds:DisruptafricaAdapter",
+    "vested_adapter": "startup_watch.adapters.feeds:VestedAdapter",
+    "therecursive_adapter": "startup_watch.adapters.feeds:TherecursiveAdapter",
+    "siliconrepublic_adapter": "startup_watch.adapters.feeds:SiliconrepublicAdapter",
+    "itweb_africa_adapter": "startup_watch.adapters.feeds:ItwebAfricaAdapter",
+    "startupill_adapter": "startup_watch.adapters.feeds:StartupillAdapter",
+    "devdiscourse_adapter": "startup_watch.adapters.feeds:DevdiscourseAdapter",
+    "techbuild_africa_adapter": "startup_watch.adapters.feeds:TechbuildAfricaAdapter",
+    "futurescot_adapter": "startup_watch.adapters.feeds:FuturescotAdapter",
+    "techcabal_adapter": "startup_watch.adapters.feeds:TechcabalAdapter",
+    "benjamindada_adapter": "startup_watch.adapters.feeds:BenjamindadaAdapter",
+    "technext_ng_adapter": "startup_watch.adapters.feeds:TechnextNgAdapter",
+    "techafricanews_adapter": "startup_watch.adapters.feeds:TechafricanewsAdapter",
+    "techtrendske_adapter": "startup_watch.adapters.feeds:TechtrendskeAdapter",
+    "tech_ish_adapter": "startup_watch.adapters.feeds:TechIshAdapter",
+    "techmoran_adapter": "startup_watch.adapters.feeds:TechmoranAdapter",
+    "memeburn_adapter": "startup_watch.adapters.feeds:MemeburnAdapter",
+    "weetracker_adapter": "startup_watch.adapters.feeds:WeetrackerAdapter",
+    "techweez_adapter": "startup_watch.adapters.feeds:TechweezAdapter",
+    "ventureburn_adapter": "startup_watch.adapters.feeds:VentureburnAdapter",
+    "venturesafrica_adapter": "startup_watch.adapters.feeds:VenturesafricaAdapter",
+    "inc42_adapter": "startup_watch.adapters.feeds:Inc42Adapter",
+    "entrackr_adapter": "startup_watch.adapters.feeds:EntrackrAdapter",
+    "dealstreetasia_adapter": "startup_watch.adapters.feeds:DealstreetasiaAdapter",
+    "techloy_adapter": "startup_watch.adapters.feeds:TechloyAdapter",
+    "kr_asia_adapter": "startup_watch.adapters.feeds:KrAsiaAdapter",
+    "technode_adapter": "startup_watch.adapters.feeds:TechnodeAdapter",
+    "techsauce_adapter": "startup_watch.adapters.feeds:TechsauceAdapter",
+    "echelonasia_adapter": "startup_watch.adapters.feeds:EchelonasiaAdapter",
+    "technin_asia_adapter": "startup_watch.adapters.feeds:TechninAsiaAdapter",
+    "vulcanpost_adapter": "startup_watch.adapters.feeds:VulcanpostAdapter",
+    "pandaily_adapter": "startup_watch.adapters.feeds:PandailyAdapter",
+    "wamda_adapter": "startup_watch.adapters.feeds:WamdaAdapter",
+    "maddyness_adapter": "startup_watch.adapters.feeds:MaddynessAdapter",
+    "techfundingasia_adapter": "startup_watch.adapters.feeds:TechfundingasiaAdapter",
+    "startupnewsasia_adapter": "startup_watch.adapters.feeds:StartupnewsasiaAdapter",
+    "vietcetera_adapter": "startup_watch.adapters.feeds:VietceteraAdapter",
+    "bloomingstartup_adapter": "startup_watch.adapters.feeds:BloomingstartupAdapter",
+    "africanbusiness_tech_adapter": (
+        "startup_watch.adapters.feeds:AfricanbusinessTechAdapter"
+    ),
+    "menabytes_adapter": "startup_watch.adapters.feeds:MenabytesAdapter",
+    "magnitt_adapter": "startup_watch.adapters.feeds:MagnittAdapter",
+    "wadi_mena_adapter": "startup_watch.adapters.feeds:WadiMenaAdapter",
+    "startupbahrain_adapter": "startup_watch.adapters.feeds:StartupbahrainAdapter",
+    "techjuice_adapter": "startup_watch.adapters.feeds:TechjuiceAdapter",
+    "pakwired_adapter": "startup_watch.adapters.feeds:PakwiredAdapter",
+    "dailysocial_adapter": "startup_watch.adapters.feeds:DailysocialAdapter",
+    "techstartups_adapter": "startup_watch.adapters.feeds:TechstartupsAdapter",
+    "startupnewsme_adapter": "startup_watch.adapters.feeds:StartupnewsmeAdapter",
+    "middleeastventures_adapter": (
+        "startup_watch.adapters.feeds:MiddleeastventuresAdapter"
+    ),
+    "europeanstartups_adapter": "startup_watch.adapters.feeds:EuropeanstartupsAdapter",
+    "startupobserver_adapter": "startup_watch.adapters.feeds:StartupobserverAdapter",
+    "startupsavant_adapter": "startup_watch.adapters.feeds:StartupsavantAdapter",
+    "techrasa_adapter": "startup_watch.adapters.feeds:TechrasaAdapter",
+    "techgistafrica_adapter": "startup_watch.adapters.feeds:TechgistafricaAdapter",
+    "itnewsafrica_adapter": "startup_watch.adapters.feeds:ItnewsafricaAdapter",
+    "disfold_blog_adapter": "startup_watch.adapters.feeds:DisfoldBlogAdapter",
+    "startupradius_adapter": "startup_watch.adapters.feeds:StartupradiusAdapter",
+    "nextbigwhat_adapter": "startup_watch.adapters.feeds:NextbigwhatAdapter",
+    "techcircle_adapter": "startup_watch.adapters.feeds:TechcircleAdapter",
+    "siliconangle_startups_adapter": (
+        "startup_watch.adapters.feeds:SiliconangleStartupsAdapter"
+    ),
+    "readwrite_startups_adapter": (
+        "startup_watch.adapters.feeds:ReadwriteStartupsAdapter"
+    ),
+    "techinformed_adapter": "startup_watch.adapters.feeds:TechinformedAdapter",
+    "startupdaily_africa_adapter": (
+        "startup_watch.adapters.feeds:StartupdailyAfricaAdapter"
+    ),
+    "techlabari_adapter": "startup_watch.adapters.feeds:TechlabariAdapter",
+    "innov8tiv_adapter": "startup_watch.adapters.feeds:Innov8tivAdapter",
+    "smesouthafrica_adapter": "startup_watch.adapters.feeds:SmesouthafricaAdapter",
+    "techawkng_adapter": "startup_watch.adapters.feeds:TechawkngAdapter",
+    "technovagh_adapter": "startup_watch.adapters.feeds:TechnovaghAdapter",
+    "afritechie_adapter": "startup_watch.adapters.feeds:AfritechieAdapter",
+    "frenchweb_adapter": "startup_watch.adapters.feeds:FrenchwebAdapter",
+    "maddyness_fr_adapter": "startup_watch.adapters.feeds:MaddynessFrAdapter",
+    "gruenderszene_adapter": "startup_watch.adapters.feeds:GruenderszeneAdapter",
+    "siliconallee_adapter": "startup_watch.adapters.feeds:SiliconalleeAdapter",
+    "siftedeu_news_adapter": "startup_watch.adapters.feeds:SiftedeuNewsAdapter",
+    "arcticstartup_adapter": "startup_watch.adapters.feeds:ArcticstartupAdapter",
+    "eu_startups_news_adapter": "startup_watch.adapters.feeds:EuStartupsNewsAdapter",
+    "uktechnews_adapter": "startup_watch.adapters.feeds:UktechnewsAdapter",
+    "irishtechnews_adapter": "startup_watch.adapters.feeds:IrishtechnewsAdapter",
+    "techpluto_adapter": "startup_watch.adapters.feeds:TechplutoAdapter",
+    "siliconrepublic_startups_adapter": (
+        "startup_watch.adapters.feeds:SiliconrepublicStartupsAdapter"
+    ),
+    "techforge_media_adapter": "startup_watch.adapters.feeds:TechforgeMediaAdapter",
+    "sifted_pro_adapter": "startup_watch.adapters.feeds:SiftedProAdapter",
+    "foundersguide_adapter": "startup_watch.adapters.feeds:FoundersguideAdapter",
+    "startupvalley_news_adapter": (
+        "startup_watch.adapters.feeds:StartupvalleyNewsAdapter"
+    ),
+    "techbehemoths_blog_adapter": (
+        "startup_watch.adapters.feeds:TechbehemothsBlogAdapter"
+    ),
+    "startupscoot_adapter": "startup_watch.adapters.feeds:StartupscootAdapter",
+    "seedrs_insights_adapter": "startup_watch.adapters.feeds:SeedrsInsightsAdapter",
+    "euvc_insights_adapter": "startup_watch.adapters.feeds:EuvcInsightsAdapter",
+    "startupmag_europe_adapter": "startup_watch.adapters.feeds:StartupmagEuropeAdapter",
+    "vator_startups_adapter": "startup_watch.adapters.feeds:VatorStartupsAdapter",
+    "startus_insights_adapter": "startup_watch.adapters.feeds:StartusInsightsAdapter",
+    "tracxn_blog_adapter": "startup_watch.adapters.feeds:TracxnBlogAdapter",
+    "f6s_news_adapter": "startup_watch.adapters.feeds:F6sNewsAdapter",
+    "euvc_deals_adapter": "startup_watch.adapters.feeds:EuvcDealsAdapter",
+    "venturecapitaljournal_adapter": (
+        "startup_watch.adapters.feeds:VenturecapitaljournalAdapter"
+    ),
+    "privateequitywire_vc_adapter": (
+        "startup_watch.adapters.feeds:PrivateequitywireVcAdapter"
+    ),
+    "globalventuring_adapter": "startup_watch.adapters.feeds:GlobalventuringAdapter",
+    "thehumancapital_adapter": "startup_watch.adapters.feeds:ThehumancapitalAdapter",
+    "startupsatellite_adapter": "startup_watch.adapters.feeds:StartupsatelliteAdapter",
+    "startupgenius_adapter": "startup_watch.adapters.feeds:StartupgeniusAdapter",
+    "founderjar_adapter": "startup_watch.adapters.feeds:FounderjarAdapter",
+    "smallbiztrends_startups_adapter": (
+        "startup_watch.adapters.feeds:SmallbiztrendsStartupsAdapter"
+    ),
+    "startupgrind_blog_adapter": "startup_watch.adapters.feeds:StartupgrindBlogAdapter",
+    "forentrepreneurs_adapter": "startup_watch.adapters.feeds:ForentrepreneursAdapter",
+    "bothsidesofthetable_adapter": (
+        "startup_watch.adapters.feeds:BothsidesofthetableAdapter"
+    ),
+    "avc_blog_adapter": "startup_watch.adapters.feeds:AvcBlogAdapter",
+    "feldthoughts_adapter": "startup_watch.adapters.feeds:FeldthoughtsAdapter",
+    "saastr_blog_adapter": "startup_watch.adapters.feeds:SaastrBlogAdapter",
+    "tomtunguz_adapter": "startup_watch.adapters.feeds:TomtunguzAdapter",
+    "openhubstartup_adapter": "startup_watch.adapters.feeds:OpenhubstartupAdapter",
+    "startuptalky_adapter": "startup_watch.adapters.feeds:StartuptalkyAdapter",
+    "yourtechtoday_adapter": "startup_watch.adapters.feeds:YourtechtodayAdapter",
+    "techsafariz_adapter": "startup_watch.adapters.feeds:TechsafarizAdapter",
+    "africatechdaily_adapter": "startup_watch.adapters.feeds:AfricatechdailyAdapter",
+    "startupnewszone_adapter": "startup_watch.adapters.feeds:StartupnewszoneAdapter",
+    "venturefounders_adapter": "startup_watch.adapters.feeds:VenturefoundersAdapter",
+    "newstartupmedia_adapter": "startup_watch.adapters.feeds:NewstartupmediaAdapter",
+    "seedfundnews_adapter": "startup_watch.adapters.feeds:SeedfundnewsAdapter",
+    "techpulsefounders_adapter": (
+        "startup_watch.adapters.feeds:TechpulsefoundersAdapter"
+    ),
+    "startupreporter_adapter": "startup_watch.adapters.feeds:StartupreporterAdapter",
+    "foundersradar_adapter": "startup_watch.adapters.feeds:FoundersradarAdapter",
+    "deeptechdigest_adapter": "startup_watch.adapters.feeds:DeeptechdigestAdapter",
+    "futurefoundersnews_adapter": (
+        "startup_watch.adapters.feeds:FuturefoundersnewsAdapter"
+    ),
+    "nextventuredaily_adapter": "startup_watch.adapters.feeds:NextventuredailyAdapter",
+    "startupwireglobal_adapter": (
+        "startup_watch.adapters.feeds:StartupwireglobalAdapter"
+    ),
+    "frontierstartups_adapter": "startup_watch.adapters.feeds:FrontierstartupsAdapter",
+    "climatestartupsnews_adapter": (
+        "startup_watch.adapters.feeds:ClimatestartupsnewsAdapter"
+    ),
+    "industriousventures_adapter": (
+        "startup_watch.adapters.feeds:IndustriousventuresAdapter"
+    ),
+    "logisticstechnews_adapter": (
+        "startup_watch.adapters.feeds:LogisticstechnewsAdapter"
+    ),
+    "agxstartupnews_adapter": "startup_watch.adapters.feeds:AgxstartupnewsAdapter",
+    "enterprisefoundry_adapter": (
+        "startup_watch.adapters.feeds:EnterprisefoundryAdapter"
+    ),
+    "seedstageinsider_adapter": "startup_watch.adapters.feeds:SeedstageinsiderAdapter",
+    "vcsignalsdaily_adapter": "startup_watch.adapters.feeds:VcsignalsdailyAdapter",
+    "startupcurrents_adapter": "startup_watch.adapters.feeds:StartupcurrentsAdapter",
+    "venturechronicle_adapter": "startup_watch.adapters.feeds:VenturechronicleAdapter",
+    "foundersbriefing_adapter": "startup_watch.adapters.feeds:FoundersbriefingAdapter",
+}
+
+
+def registered_adapters() -> dict[str, str]:
+    """Built-in adapters plus third-party ones from the entry-point group.
+
+    A distribution registers an adapter as ``<config key> = "module:Class"``
+    under ``startup_watch.adapters``; built-in keys cannot be overridden.
+    """
+    registry = dict(BUILTIN_ADAPTERS)
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        registry.setdefault(entry_point.name, entry_point.value)
+    return registry
+
+
+@lru_cache(maxsize=None)
+def load_adapter_class(target: str) -> type:
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def enabled_adapter_classes(config: dict) -> list[tuple[str, type]]:
+    """``(config key, class)`` for every adapter whose block is ``enabled: true``."""
+    return [
+        (key, load_adapter_class(target))
+        for key, target in registered_adapters().items()
+        if config.get(key, {}).get("enabled", False)
+    ]
@@ -1,7 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import node_text
 from startup_watch.schema import StartupSignal
 
 
@@ -14,13 +12,12 @@ class StartupStreamAdapter(BaseAdapter):
         url = self.config.get("url", "https://startupstream.io")
         max_items = int(self.config.get("max_items", 200))
         try:
-            response = requests.get(url, timeout=20, headers={"User-Agent": "startup-watch/1.0"})
+            response = self.http_get(url)
             if response.status_code != 200:
                 return []
-            soup = BeautifulSoup(response.text, "lxml")
             out: list[StartupSignal] = []
-            for link in soup.select("a"):
-                name = link.get_text(" ", strip=True)
+            for link in self.select_html(response, "a"):
+                name = node_text(link)
                 href = link.get("href") or ""
                 if not name or len(name) > 80:
                     continue
@@ -34,5 +31,5 @@ class StartupStreamAdapter(BaseAdapter):
                 if len(out) >= max_items:
                     break
             return out
-        except Exception:
-            return []
+        except Exception as exc:
+            return self.failed(exc)
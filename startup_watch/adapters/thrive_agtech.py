@@ -1,7 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import node_text
 from startup_watch.schema import StartupSignal
 
 
@@ -23,16 +21,11 @@ class ThriveAgtechAdapter(BaseAdapter):
         output: list[StartupSignal] = []
         for url in urls:
             try:
-                response = requests.get(
-                    url,
-                    timeout=20,
-                    headers={"User-Agent": "startup-watch/1.0"},
-                )
+                response = self.http_get(url)
                 if response.status_code != 200:
                     continue
-                soup = BeautifulSoup(response.text, "lxml")
-                for node in soup.select("li, h2, h3, a"):
-                    name = node.get_text(" ", strip=True)
+                for node in self.select_html(response, "li, h2, h3, a"):
+                    name = node_text(node)
                     if not name or len(name) > 80:
                         continue
                     output.append(
@@ -44,6 +37,7 @@ class ThriveAgtechAdapter(BaseAdapter):
                             source_url=url,
                         ).normalize()
                     )
-            except Exception:
+            except Exception as exc:
+                self.failed(exc)
                 continue
         return output
@@ -1,9 +1,7 @@
 import json
 
-import requests
-from bs4 import BeautifulSoup
-
 from startup_watch.adapters.base import BaseAdapter
+from startup_watch.extract import select
 from startup_watch.schema import StartupSignal
 
 
@@ -17,14 +15,13 @@ class YCombinatorAdapter(BaseAdapter):
         categories = set(self.config.get("categories", []))
         url = f"https://www.ycombinator.com/companies?batch={batch}"
         try:
-            response = requests.get(url, timeout=20, headers={"User-Agent": "startup-watch/1.0"})
+            response = self.http_get(url)
             if response.status_code != 200:
                 return []
-            soup = BeautifulSoup(response.text, "lxml")
-            script = soup.find("script", id="__NEXT_DATA__")
-            if not script or not script.string:
+            scripts = select(response.content, "script#__NEXT_DATA__", response.encoding)
+            if not scripts or not scripts[0].text:
                 return []
-            data = json.loads(script.string)
+            data = json.loads(scripts[0].text)
             companies = data.get("props", {}).get("pageProps", {}).get("companies", [])
             out: list[StartupSignal] = []
             for company in companies:
@@ -45,5 +42,5 @@ class YCombinatorAdapter(BaseAdapter):
                     ).normalize()
                 )
             return out
-        except Exception:
-            return []
+        except Exception as exc:
+            return self.failed(exc)
@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+BLOCKED_RESOURCES = ("image", "font", "media")
+DEFAULT_BROWSER = "chromium"
+
+
+class BrowserUnavailable(Exception):
+    """Raised when Playwright or its browser binary cannot be started."""
+
+
+@dataclass
+class RenderedPage:
+    url: str
+    status_code: int
+    html: str
+    elapsed: float = 0.0
+
+
+class BrowserPool:
+    """Headless browser for pages whose content is built by JavaScript.
+
+    Playwright objects are bound to one event loop, so the pool runs its own
+    loop on a dedicated thread and ``render`` may be called from any worker.
+    The browser is launched on first use and keeps up to ``max_contexts``
+    contexts, which also caps concurrent pages; each render opens a fresh
+    page in a reused context. Requests for ``blocked_resources`` (images,
+    fonts, media by default) are aborted, and a page gets ``page_timeout``
+    seconds from navigation to serialised HTML.
+    """
+
+    def __init__(
+        self,
+        browser: str = DEFAULT_BROWSER,
+        max_contexts: int = 2,
+        page_timeout: float = 20.0,
+        blocked_resources: tuple[str, ...] = BLOCKED_RESOURCES,
+        user_agent: str | None = None,
+    ):
+        self.browser_name = browser
+        self.max_contexts = max(1, max_contexts)
+        self.page_timeout = page_timeout
+        self.blocked_resources = frozenset(blocked_resources)
+        self.user_agent = user_agent
+        self.renders = 0
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._error: BrowserUnavailable | None = None
+        self._playwright = None
+        self._browser = None
+        self._idle: asyncio.Queue | None = None
+        self._created = 0
+
+    @classmethod
+    def from_config(cls, config: dict) -> "BrowserPool | None":
+        """Pool for the ``playwright_fallback`` block, or ``None`` if disabled."""
+        browser_cfg = config.get("playwright_fallback", {})
+        if not browser_cfg.get("enabled", False):
+            return None
+        return cls(
+            browser=browser_cfg.get("browser", DEFAULT_BROWSER),
+            max_contexts=int(browser_cfg.get("max_contexts", 2)),
+            page_timeout=float(browser_cfg.get("page_timeout_seconds", 20)),
+            blocked_resources=tuple(browser_cfg.get("block_resources", BLOCKED_RESOURCES)),
+            user_agent=config.get("transport", {}).get("user_agent"),
+        )
+
+    def render(self, url: str, wait_for: str | None = None) -> RenderedPage:
+        """Load ``url``, optionally wait for the ``wait_for`` selector, return the DOM.
+
+        Raises ``BrowserUnavailable`` if the browser cannot start and
+        ``TimeoutError`` when the page overruns its budget.
+        """
+        loop = self._start()
+        return asyncio.run_coroutine_threadsafe(self._render(url, wait_for), loop).result()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(self.page_timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="startup-watch-browser", daemon=True
+            )
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), loop).result()
+            except BrowserUnavailable as exc:
+                # Remember the failure so every fallback does not relaunch.
+                self._error = exc
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+                raise
+            self._loop, self._thread = loop, thread
+            return loop
+
+    async def _launch(self) -> None:
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError as exc:
+            raise BrowserUnavailable("playwright is not installed") from exc
+        try:
+            self._playwright = await async_playwright().start()
+        except Exception as exc:
+            raise BrowserUnavailable(f"cannot start playwright: {exc}") from exc
+        try:
+            self._browser = await getattr(self._playwright, self.browser_name).launch()
+        except Exception as exc:
+            await self._playwright.stop()
+            raise BrowserUnavailable(f"cannot launch {self.browser_name}: {exc}") from exc
+        self._idle = asyncio.Queue()
+        self._created = 0
+
+    async def _route(self, route) -> None:
+        if route.request.resource_type in self.blocked_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _acquire(self):
+        idle, browser = self._idle, self._browser
+        if idle is None or browser is None:
+            raise BrowserUnavailable("browser is not running")
+        while True:
+            if idle.empty() and self._created < self.max_contexts:
+                self._created += 1
+                try:
+                    context = await browser.new_context(user_agent=self.user_agent)
+                    await context.route("**/*", self._route)
+                except Exception:
+                    self._created -= 1
+                    raise
+                return context
+            context = await idle.get()
+            # ``None`` is the slot of a dropped context: create a replacement.
+            if context is not None:
+                return context
+
+    async def _drop(self, context) -> None:
+        """Retire a context that cannot open pages and free its slot."""
+        self._created -= 1
+        if self._idle is not None:
+            self._idle.put_nowait(None)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+    async def _render(self, url: str, wait_for: str | None) -> RenderedPage:
+        context = await self._acquire()
+        try:
+            page = await context.new_page()
+        except Exception:
+            await self._drop(context)
+            raise
+        try:
+            try:
+                return await asyncio.wait_for(self._load(page, url, wait_for), self.page_timeout)
+            finally:
+                await page.close()
+        finally:
+            if self._idle is not None:
+                self._idle.put_nowait(context)
+
+    async def _load(self, page, url: str, wait_for: str | None) -> RenderedPage:
+        started = time.monotonic()
+        timeout_ms = self.page_timeout * 1000
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+        if wait_for:
+            await page.wait_for_selector(wait_for, timeout=timeout_ms)
+        html = await page.content()
+        self.renders += 1
+        return RenderedPage(
+            url=page.url,
+            status_code=response.status if response is not None else 200,
+            html=html,
+            elapsed=time.monotonic() - started,
+        )
+
+    async def _shutdown(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+CACHE_MODES = ("use", "refresh", "offline")
+
+
+class ResponseCache:
+    """On-disk HTTP response cache with per-request TTLs and an LRU size cap.
+
+    Entries are keyed by the SHA-256 of the URL (not of the content):
+    ``<key>.json`` holds the status, headers, body length and store time,
+    ``<key>.body`` the raw bytes. Both are written to temporary files and
+    renamed into place, meta last, so a reader never sees a partial body.
+    Modes:
+
+    - ``use``: serve fresh entries, fetch and store everything else.
+    - ``refresh``: always fetch, then overwrite the entry.
+    - ``offline``: serve any entry regardless of age and never fetch.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        default_ttl: float = 86400.0,
+        max_bytes: int = 512 * 1024 * 1024,
+        mode: str = "use",
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"cache mode must be one of {CACHE_MODES}, got {mode!r}")
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._index: dict[str, tuple[int, float]] = self._scan()
+
+    @classmethod
+    def from_config(cls, config: dict, default_dir: str = "") -> "ResponseCache | None":
+        cache_cfg = config.get("cache", {})
+        directory = cache_cfg.get("dir", default_dir)
+        if not cache_cfg.get("enabled", True) or not directory:
+            return None
+        return cls(
+            directory,
+            default_ttl=float(cache_cfg.get("ttl_seconds", 86400)),
+            max_bytes=int(cache_cfg.get("max_bytes", 512 * 1024 * 1024)),
+            mode=cache_cfg.get("mode", "use"),
+        )
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == "offline"
+
+    @property
+    def refresh(self) -> bool:
+        return self.mode == "refresh"
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return f"{base}.json", f"{base}.body"
+
+    def _scan(self) -> dict[str, tuple[int, float]]:
+        index: dict[str, tuple[int, float]] = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            index[name[: -len(".body")]] = (stat.st_size, stat.st_mtime)
+        return index
+
+    def lookup(self, url: str, ttl: float | None = None) -> dict | None:
+        """Return ``{status_code, headers, content, stored_at}`` for a usable entry."""
+        if self.mode == "refresh":
+            return None
+        key = self.key(url)
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as handle:
+                meta = json.load(handle)
+            with open(body_path, "rb") as handle:
+                content = handle.read()
+        except (OSError, ValueError):
+            return None
+        if len(content) != meta.get("length", len(content)):
+            # A body and meta from different writes; treat as a miss.
+            return None
+        max_age = self.default_ttl if ttl is None else ttl
+        if not self.offline and time.time() - meta.get("stored_at", 0) > max_age:
+            return None
+        now = time.time()
+        os.utime(body_path, (now, now))
+        with self._lock:
+            self._index[key] = (len(content), now)
+        return {**meta, "content": content}
+
+    def store(self, url: str, status_code: int, headers: dict, content: bytes) -> None:
+        key = self.key(url)
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": url,
+            "status_code": status_code,
+            "headers": headers,
+            "length": len(content),
+            "stored_at": time.time(),
+        }
+        self._replace(body_path, content)
+        self._replace(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            self._index[key] = (len(content), time.time())
+            self._evict()
+
+    def _replace(self, path: str, data: bytes) -> None:
+        """Write ``data`` to a unique temporary file, then rename it to ``path``."""
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _evict(self) -> None:
+        total = sum(size for size, _ in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            del self._index[key]
+            total -= size
+            if total <= self.max_bytes:
+                return
@@ -0,0 +1,68 @@
+import codecs
+import re
+
+# The HTML standard's prescan looks at the first 1024 bytes for a <meta>.
+PRESCAN_BYTES = 1024
+DEFAULT_ENCODING = "utf-8"
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+_XML_ENCODING = re.compile(rb"^<\?xml[^>]+encoding\s*=\s*[\"']([\w.:-]+)[\"']")
+
+
+def _known(label: str | bytes | None) -> str | None:
+    """``label`` lower-cased if Python knows the codec; parsers share IANA labels."""
+    if not label:
+        return None
+    if isinstance(label, bytes):
+        label = label.decode("ascii", errors="ignore")
+    try:
+        codecs.lookup(label)
+    except LookupError:
+        return None
+    return label.lower()
+
+
+def declared_charset(headers: dict) -> str | None:
+    """Charset named in ``Content-Type``; unlike requests, no latin-1 default."""
+    for name, value in headers.items():
+        if name.lower() == "content-type":
+            match = _HEADER_CHARSET.search(value)
+            return _known(match.group(1)) if match else None
+    return None
+
+
+def sniff_encoding(content: bytes) -> str | None:
+    """Encoding from a BOM, XML declaration or ``<meta>`` in the first 1 KiB."""
+    for bom, name in _BOMS:
+        if content.startswith(bom):
+            return name
+    head = content[:PRESCAN_BYTES]
+    match = _XML_ENCODING.match(head) or _META_CHARSET.search(head)
+    return _known(match.group(1)) if match else None
+
+
+def detect_encoding(headers: dict, content: bytes) -> str:
+    """Declared, then sniffed, then UTF-8; never scans the whole body."""
+    return declared_charset(headers) or sniff_encoding(content) or DEFAULT_ENCODING
+
+
+def parseable(content: bytes, encoding: str | None) -> tuple[bytes, str | None]:
+    """``content`` and ``encoding`` safe to hand to libxml2.
+
+    libxml2 keeps bytes it cannot decode and lxml raises when the text is
+    read, so a Latin-1 page served as plain ``text/html`` is re-encoded as
+    UTF-8 with U+FFFD in place of the bad bytes.
+    """
+    if not encoding:
+        return content, encoding
+    try:
+        content.decode(encoding)
+    except UnicodeDecodeError:
+        return content.decode(encoding, errors="replace").encode("utf-8"), "utf-8"
+    return content, encoding
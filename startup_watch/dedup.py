@@ -1,14 +1,26 @@
+from typing import Iterable, Iterator
+
 from startup_watch.schema import StartupSignal
 
 
-def deduplicate_signals(signals: list[StartupSignal]) -> list[StartupSignal]:
-    seen: dict[str, StartupSignal] = {}
+def dedup_key(signal: StartupSignal) -> str:
+    key = "".join(ch for ch in signal.company_name.lower() if ch.isalnum())
+    if not key:
+        key = signal.website.lower()
+    if not key:
+        key = f"{signal.source_name}:{signal.source_url}:{signal.description[:40]}"
+    return key
+
+
+def iter_deduplicate(signals: Iterable[StartupSignal]) -> Iterator[StartupSignal]:
+    """Yield the first signal for each company; only the keys are kept in memory."""
+    seen: set[str] = set()
     for signal in signals:
-        key = "".join(ch for ch in signal.company_name.lower() if ch.isalnum())
-        if not key:
-            key = signal.website.lower()
-        if not key:
-            key = f"{signal.source_name}:{signal.source_url}:{signal.description[:40]}"
+        key = dedup_key(signal)
         if key not in seen:
-            seen[key] = signal
-    return list(seen.values())
+            seen.add(key)
+            yield signal
+
+
+def deduplicate_signals(signals: list[StartupSignal]) -> list[StartupSignal]:
+    return list(iter_deduplicate(signals))
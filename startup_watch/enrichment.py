@@ -1,36 +1,370 @@
-import re
-
-import requests
-from bs4 import BeautifulSoup
+import queue
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import Callable, Iterable, Iterator
 
+from startup_watch.outcomes import TRANSIENT_STATUSES
 from startup_watch.schema import StartupSignal
+from startup_watch.sitemeta import extract_site_meta
+from startup_watch.state import EnrichmentStore
+from startup_watch.transport import HTML_TYPES, HttpTransport, get_default_transport
+from startup_watch.urls import registrable_domain, site_key
+
+# Titles and funding mentions sit near the top of a page; the rest is skipped.
+ENRICH_MAX_BYTES = 256 * 1024
+
+
+# Fields copied from a site record onto signals that lack them.
+RECORD_FIELDS = ("funding_amount", "linkedin_url", "location", "headcount_range", "founders")
+ENRICHED_FIELDS = frozenset({"description", *RECORD_FIELDS})
+
+
+def needs_enrichment(signal: StartupSignal) -> bool:
+    return bool(signal.website) and not (signal.description and signal.funding_amount)
+
+
+def fetch_site(
+    url: str,
+    timeout: int = 15,
+    transport: HttpTransport | None = None,
+    max_bytes: int = ENRICH_MAX_BYTES,
+    head_only: bool = False,
+) -> dict:
+    """HTTP ``status`` plus the page metadata from ``extract_site_meta``.
 
+    Only HTML is downloaded, and at most ``max_bytes`` of it; ``head_only``
+    stops at ``</head>`` and skips the funding scan.
+    """
+    transport = transport or get_default_transport()
+    response = transport.get(
+        url,
+        timeout=timeout,
+        max_bytes=max_bytes,
+        content_types=HTML_TYPES,
+        truncate=True,
+        stop_at=b"</head>" if head_only else None,
+    )
+    if response.status_code != 200:
+        return {"status": response.status_code}
+    meta = extract_site_meta(response.content, response.encoding, scan_body=not head_only)
+    return {"status": response.status_code, **meta}
+
+
+def worth_keeping(record: dict) -> bool:
+    """True for a 200 or a permanent 4xx; throttling, 5xx and offline misses are dropped."""
+    status = record.get("status")
+    if status == 200:
+        return True
+    return isinstance(status, int) and 400 <= status < 500 and status not in TRANSIENT_STATUSES
+
+
+def apply_record(signal: StartupSignal, record: dict) -> StartupSignal:
+    """Fill ``signal``'s empty fields from ``record``.
+
+    The description prefers the site's meta, OpenGraph or JSON-LD
+    description and falls back to its title.
+    """
+    if record.get("status") != 200:
+        return signal
+    if not signal.description:
+        signal.description = record.get("description") or record.get("title") or ""
+    for name in RECORD_FIELDS:
+        value = record.get(name)
+        if not getattr(signal, name) and value:
+            # Lists are copied: one cached record may fill many signals.
+            setattr(signal, name, list(value) if isinstance(value, list) else value)
+    return signal
 
-def extract_funding_amount(text: str) -> str:
-    match = re.search(r"\$\s?\d{1,3}(?:\.\d+)?\s?(?:m|million|b|billion)", text, re.I)
-    return match.group(0) if match else ""
 
+def enrich_from_website(
+    signal: StartupSignal,
+    timeout: int = 15,
+    transport: HttpTransport | None = None,
+    max_bytes: int = ENRICH_MAX_BYTES,
+    store: EnrichmentStore | None = None,
+) -> StartupSignal:
+    """Fill a missing description or funding amount from the company website.
 
-def enrich_from_website(signal: StartupSignal, timeout: int = 15) -> StartupSignal:
-    if not signal.website:
+    Without a ``store``, a signal missing only its title downloads no further
+    than ``</head>``. With one, the whole page (up to ``max_bytes``) is read so
+    the record answers later signals too; a fresh record for the domain
+    answers without a request, and a stale one stands in if the fetch fails
+    or answers with a transient status, which is never stored.
+    """
+    if not needs_enrichment(signal):
         return signal
+    cached, fresh = store.lookup(signal.website) if store is not None else (None, False)
+    if cached is not None and fresh:
+        return apply_record(signal, cached)
     try:
-        response = requests.get(
+        record = fetch_site(
             signal.website,
             timeout=timeout,
-            headers={"User-Agent": "startup-watch/1.0"},
+            transport=transport,
+            max_bytes=max_bytes,
+            head_only=store is None and bool(signal.funding_amount),
         )
-        if response.status_code != 200:
-            return signal
-        soup = BeautifulSoup(response.text, "lxml")
-        if not signal.description and soup.title and soup.title.string:
-            signal.description = soup.title.string.strip()
-        if not signal.funding_amount:
-            signal.funding_amount = extract_funding_amount(soup.get_text(" ", strip=True))
     except Exception:
-        return signal
-    return signal
+        return apply_record(signal, cached) if cached is not None else signal
+    if not worth_keeping(record):
+        return apply_record(signal, cached) if cached is not None else signal
+    if store is not None:
+        store.put(signal.website, record)
+    return apply_record(signal, record)
+
+
+def refresh_site(
+    url: str,
+    timeout: int = 15,
+    transport: HttpTransport | None = None,
+    store: EnrichmentStore | None = None,
+) -> None:
+    """Refetch ``url`` into ``store``; on failure the stale record stays."""
+    try:
+        record = fetch_site(url, timeout=timeout, transport=transport)
+    except Exception:
+        return
+    if store is not None and worth_keeping(record):
+        store.put(url, record)
+
+
+class _Budget:
+    """Enrichment time budget that only runs while enrichment is working.
+
+    Time spent waiting for the next upstream signal is not counted: on the
+    streaming path signals arrive as adapters produce them, and a slow
+    adapter must not use up the deadline of signals that come after it.
+    """
+
+    def __init__(self, seconds: float | None):
+        self.seconds = seconds or None
+        self.spent = 0.0
+        self.since: float | None = time.monotonic()
+
+    def remaining(self) -> float | None:
+        if self.seconds is None:
+            return None
+        since = self.since
+        running = time.monotonic() - since if since is not None else 0.0
+        return max(self.seconds - self.spent - running, 0.0)
+
+    def expired(self) -> bool:
+        return self.remaining() == 0.0
+
+    def pull(self, signals: Iterable[StartupSignal]) -> Iterator[StartupSignal]:
+        """Iterate ``signals`` with the clock stopped while each one is produced."""
+        iterator = iter(signals)
+        while True:
+            if self.since is not None:
+                self.spent += time.monotonic() - self.since
+                self.since = None
+            try:
+                signal = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.since = time.monotonic()
+            yield signal
 
 
-def enrich_batch(signals: list[StartupSignal]) -> list[StartupSignal]:
-    return [enrich_from_website(s) for s in signals]
+def _cached(signal: StartupSignal, store: EnrichmentStore | None) -> tuple[dict | None, bool]:
+    if store is None or not needs_enrichment(signal):
+        return None, False
+    return store.lookup(signal.website)
+
+
+def iter_enrich(
+    signals: Iterable[StartupSignal],
+    transport: HttpTransport | None = None,
+    workers: int = 1,
+    deadline_seconds: float | None = None,
+    timeout: int = 15,
+    store: EnrichmentStore | None = None,
+) -> Iterator[StartupSignal]:
+    """Yield ``signals`` in input order, enriched from their websites.
+
+    With ``workers > 1`` up to that many sites are fetched at once, at most
+    one per registrable domain. Once ``deadline_seconds`` have passed, signals
+    still waiting (and every later one) are yielded un-enriched, so a few slow
+    sites cannot stall the run; the clock only runs while enrichment is
+    working, not while it waits for upstream signals. Signals whose site has
+    a stale ``store`` record get it straight away; those sites are refetched
+    once, after the last signal in serial mode or alongside the others in
+    parallel, so the next run starts warm.
+    """
+    budget = _Budget(deadline_seconds)
+    if workers <= 1:
+        stale: dict[str, str] = {}
+        for signal in budget.pull(signals):
+            cached, fresh = _cached(signal, store)
+            if cached is not None:
+                apply_record(signal, cached)
+                if not fresh:
+                    stale.setdefault(site_key(signal.website), signal.website)
+                yield signal
+            elif budget.expired():
+                yield signal
+            else:
+                yield enrich_from_website(signal, timeout=timeout, transport=transport, store=store)
+        for url in stale.values():
+            if budget.expired():
+                break
+            refresh_site(url, timeout=timeout, transport=transport, store=store)
+        return
+    yield from _iter_enrich_parallel(signals, transport, workers, budget, timeout, store)
+
+
+class _DomainScheduler:
+    """Runs at most one task per domain on ``executor``, queueing the rest.
+
+    Serialising happens on the consuming thread: a task whose domain is busy
+    waits in that domain's queue instead of occupying a worker, so same-domain
+    signals in the window cannot starve other domains of threads. Workers
+    report finished domains on ``finished``; the consumer pumps it in ``wait``
+    and ``poll`` and starts the next queued task.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, budget: _Budget):
+        self.executor = executor
+        self.budget = budget
+        self.busy: set[str] = set()
+        self.queued: defaultdict[str, deque[tuple[Callable[[], object], Future]]] = (
+            defaultdict(deque)
+        )
+        self.finished: queue.SimpleQueue[str] = queue.SimpleQueue()
+
+    def submit(self, domain: str, task: Callable[[], object]) -> Future:
+        future: Future = Future()
+        if domain in self.busy:
+            self.queued[domain].append((task, future))
+        else:
+            self._start(domain, task, future)
+        return future
+
+    def _start(self, domain: str, task: Callable[[], object], future: Future) -> None:
+        self.busy.add(domain)
+
+        def relay(done: Future) -> None:
+            if done.cancelled():
+                future.cancel()
+            elif done.exception() is not None:
+                future.set_exception(done.exception())
+            else:
+                future.set_result(done.result())
+            self.finished.put(domain)
+
+        self.executor.submit(task).add_done_callback(relay)
+
+    def _release(self, domain: str) -> None:
+        waiting = self.queued.get(domain)
+        if waiting and not self.budget.expired():
+            self._start(domain, *waiting.popleft())
+            return
+        # Past the deadline queued tasks never start; their signals pass through.
+        self.queued.pop(domain, None)
+        self.busy.discard(domain)
+
+    def poll(self) -> None:
+        """Start queued tasks for every domain that has finished so far."""
+        while True:
+            try:
+                self._release(self.finished.get_nowait())
+            except queue.Empty:
+                return
+
+    def wait(self, future: Future) -> bool:
+        """Pump finished domains until ``future`` is done; False at the deadline."""
+        while not future.done():
+            remaining = self.budget.remaining()
+            if remaining == 0.0:
+                return False
+            try:
+                self._release(self.finished.get(timeout=remaining))
+            except queue.Empty:
+                return False
+        return not future.cancelled()
+
+
+def _iter_enrich_parallel(
+    signals: Iterable[StartupSignal],
+    transport: HttpTransport | None,
+    workers: int,
+    budget: _Budget,
+    timeout: int,
+    store: EnrichmentStore | None,
+) -> Iterator[StartupSignal]:
+    transport = transport or get_default_transport()
+    expired = budget.expired
+
+    def enrich_copy(signal: StartupSignal) -> StartupSignal:
+        if expired():
+            return signal
+        # A copy, so a late result can never touch a signal already yielded.
+        return enrich_from_website(
+            replace(signal), timeout=timeout, transport=transport, store=store
+        )
+
+    def refresh(url: str) -> None:
+        if not expired():
+            refresh_site(url, timeout=timeout, transport=transport, store=store)
+
+    def settle(signal: StartupSignal, future: Future | None) -> StartupSignal:
+        if future is None or not scheduler.wait(future):
+            return signal
+        return future.result()
+
+    # A bounded window keeps the stream flowing and memory flat.
+    window = workers * 4
+    pending: deque[tuple[StartupSignal, Future | None]] = deque()
+    refreshes: dict[str, Future] = {}
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich")
+    scheduler = _DomainScheduler(executor, budget)
+    try:
+        for signal in budget.pull(signals):
+            scheduler.poll()
+            future = None
+            cached, fresh = _cached(signal, store)
+            if cached is not None:
+                apply_record(signal, cached)
+                site = site_key(signal.website)
+                if not fresh and site not in refreshes and not expired():
+                    refreshes[site] = scheduler.submit(
+                        registrable_domain(signal.website), partial(refresh, signal.website)
+                    )
+            elif needs_enrichment(signal) and not expired():
+                future = scheduler.submit(
+                    registrable_domain(signal.website), partial(enrich_copy, signal)
+                )
+            pending.append((signal, future))
+            while len(pending) >= window:
+                yield settle(*pending.popleft())
+        while pending:
+            yield settle(*pending.popleft())
+        # Give revalidations the rest of the deadline so the store can save them.
+        for future in refreshes.values():
+            if not scheduler.wait(future):
+                break
+    finally:
+        # Abandon stragglers; their requests end at their own timeout.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def enrich_batch(
+    signals: list[StartupSignal],
+    transport: HttpTransport | None = None,
+    workers: int = 1,
+    deadline_seconds: float | None = None,
+    store: EnrichmentStore | None = None,
+) -> list[StartupSignal]:
+    return list(
+        iter_enrich(
+            signals,
+            transport=transport,
+            workers=workers,
+            deadline_seconds=deadline_seconds,
+            store=store,
+        )
+    )
@@ -0,0 +1,80 @@
+import re
+from functools import lru_cache
+
+import lxml.etree as etree
+import lxml.html
+
+from startup_watch.charset import DEFAULT_ENCODING, parseable
+
+# One compound selector: optional tag, then any of .class, #id, [attr] or
+# [attr=value]. Descendant combinators are plain whitespace.
+_COMPOUND = re.compile(r"^([a-zA-Z][\w-]*|\*)?((?:\.[\w-]+|#[\w-]+|\[[\w-]+(?:=[^\]]+)?\])*)$")
+_PART = re.compile(r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:=([^\]]+))?\]")
+
+
+def _compound_xpath(compound: str) -> str:
+    match = _COMPOUND.match(compound)
+    if not match:
+        raise ValueError(f"unsupported CSS selector: {compound!r}")
+    xpath = match.group(1) or "*"
+    for cls, ident, attr, value in _PART.findall(match.group(2)):
+        if cls:
+            xpath += f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+        elif ident:
+            xpath += f"[@id='{ident}']"
+        elif value:
+            value = value.strip("\"'")
+            xpath += f"[@{attr}='{value}']"
+        else:
+            xpath += f"[@{attr}]"
+    return xpath
+
+
+def css_to_xpath(selector: str) -> str:
+    """Translate a selector list such as ``"a, h2, div.card h3"`` to XPath.
+
+    Supports tags, ``.class``, ``#id``, ``[attr]``, ``[attr=value]`` and the
+    descendant combinator; that covers every adapter's selector. Matches
+    come back in document order, like BeautifulSoup's ``select``.
+    """
+    branches = []
+    for branch in selector.split(","):
+        steps = branch.split()
+        if not steps:
+            raise ValueError(f"empty selector in {selector!r}")
+        branches.append("//" + "//".join(_compound_xpath(step) for step in steps))
+    return " | ".join(branches)
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> etree.XPath:
+    """Compile a CSS selector, or an XPath expression starting with ``/`` or ``(``."""
+    selector = selector.strip()
+    if selector.startswith(("/", "(")):
+        return etree.XPath(selector)
+    return etree.XPath(css_to_xpath(selector))
+
+
+def parse_html(content: bytes, encoding: str | None = None) -> lxml.html.HtmlElement:
+    """Parse bytes in ``encoding``; libxml2 decodes, and bad bytes become U+FFFD."""
+    content, encoding = parseable(content, encoding)
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True)
+    except LookupError:
+        # A codec Python knows but libxml2 does not: decode on our side.
+        text = content.decode(encoding or DEFAULT_ENCODING, errors="replace")
+        parser = lxml.html.HTMLParser(remove_comments=True)
+        return lxml.html.document_fromstring(text, parser=parser)
+    return lxml.html.document_fromstring(content, parser=parser)
+
+
+def select(content: bytes, selector: str, encoding: str | None = None) -> list:
+    """Parse HTML bytes with lxml and return the elements ``selector`` matches."""
+    if not content.strip():
+        return []
+    return compile_selector(selector)(parse_html(content, encoding))
+
+
+def node_text(node: etree._Element) -> str:
+    """Whitespace-joined text of ``node``, like ``get_text(" ", strip=True)``."""
+    return " ".join(part.strip() for part in node.itertext() if part.strip())
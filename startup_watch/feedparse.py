@@ -0,0 +1,103 @@
+import io
+
+import feedparser
+import lxml.etree as etree
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+ITEM_TAGS = ("item", f"{RSS1}item", f"{ATOM}entry")
+
+# Entry key -> candidate child local names, first non-empty wins.
+TEXT_FIELDS = {
+    "title": ("title",),
+    "summary": ("description", "summary", "encoded", "content"),
+    "id": ("guid", "id"),
+    "published": ("pubDate", "published", "date", "issued"),
+    "updated": ("updated", "modified"),
+}
+
+
+def _local(tag: object) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _entry(element: etree._Element) -> feedparser.FeedParserDict:
+    children: dict[str, etree._Element] = {}
+    link = ""
+    for child in element:
+        name = _local(child.tag)
+        if name == "link" and not link:
+            href = child.get("href")
+            if href is not None:
+                if child.get("rel", "alternate") == "alternate":
+                    link = href
+                continue
+            link = (child.text or "").strip()
+            continue
+        children.setdefault(name, child)
+    entry = feedparser.FeedParserDict(link=link)
+    for key, names in TEXT_FIELDS.items():
+        for name in names:
+            child = children.get(name)
+            text = "".join(child.itertext()).strip() if child is not None else ""
+            if text:
+                entry[key] = text
+                break
+        else:
+            entry[key] = ""
+    if not entry["id"]:
+        entry["id"] = element.get(f"{RDF}about", "")
+    return entry
+
+
+def parse_fast(content: bytes, max_items: int | None = None) -> feedparser.FeedParserDict:
+    """Pull title, link, summary, id and dates from RSS 1.0/2.0 or Atom bytes.
+
+    Items are read one at a time and freed after use, and parsing stops once
+    ``max_items`` entries are collected. Raises ``etree.XMLSyntaxError`` on
+    malformed XML.
+    """
+    entries: list[feedparser.FeedParserDict] = []
+    if max_items is not None and max_items <= 0:
+        return feedparser.FeedParserDict(entries=entries)
+    events = etree.iterparse(
+        io.BytesIO(content),
+        events=("end",),
+        tag=ITEM_TAGS,
+        resolve_entities=False,
+        no_network=True,
+    )
+    for _, element in events:
+        entries.append(_entry(element))
+        element.clear()
+        parent = element.getparent()
+        while parent is not None and element.getprevious() is not None:
+            del parent[0]
+        if max_items is not None and len(entries) >= max_items:
+            break
+    return feedparser.FeedParserDict(entries=entries)
+
+
+def parse_feed(
+    content: bytes,
+    headers: dict | None = None,
+    max_items: int | None = None,
+    fast: bool = True,
+) -> feedparser.FeedParserDict:
+    """Parse feed bytes with ``parse_fast``, falling back to ``feedparser``.
+
+    The fallback covers malformed XML (undeclared HTML entities, bad
+    encodings) and documents in which the fast path finds no items.
+    """
+    if fast:
+        try:
+            feed = parse_fast(content, max_items)
+        except etree.LxmlError:
+            feed = None
+        if feed is not None and feed.entries:
+            return feed
+    feed = feedparser.parse(content, response_headers=headers or {})
+    if max_items is not None:
+        feed["entries"] = feed.entries[:max_items]
+    return feed
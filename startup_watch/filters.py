@@ -1,29 +1,40 @@
+from typing import Iterable, Iterator
+
 from startup_watch.schema import StartupSignal
 
 
-def filter_by_category(signals: list[StartupSignal], categories: list[str]) -> list[StartupSignal]:
+def iter_filter_by_category(
+    signals: Iterable[StartupSignal], categories: list[str]
+) -> Iterator[StartupSignal]:
     wanted = {c.lower().strip() for c in categories}
-    if not wanted:
-        return signals
-    out: list[StartupSignal] = []
     for signal in signals:
-        signal_cats = {c.lower().strip() for c in signal.categories}
-        if signal_cats.intersection(wanted):
-            out.append(signal)
-    return out
+        if not wanted or {c.lower().strip() for c in signal.categories} & wanted:
+            yield signal
 
 
-def filter_by_stage(signals: list[StartupSignal], stages: list[str]) -> list[StartupSignal]:
+def iter_filter_by_stage(
+    signals: Iterable[StartupSignal], stages: list[str]
+) -> Iterator[StartupSignal]:
     allowed = {s.lower().strip() for s in stages}
-    if not allowed:
-        return signals
-    return [s for s in signals if s.stage.lower().strip() in allowed]
+    return (s for s in signals if not allowed or s.stage.lower().strip() in allowed)
+
+
+def iter_filter_excluded(
+    signals: Iterable[StartupSignal], excluded_companies: list[str]
+) -> Iterator[StartupSignal]:
+    excluded = [x.lower().strip() for x in excluded_companies]
+    return (s for s in signals if not any(x in s.company_name.lower() for x in excluded))
+
+
+def filter_by_category(signals: list[StartupSignal], categories: list[str]) -> list[StartupSignal]:
+    return list(iter_filter_by_category(signals, categories))
+
+
+def filter_by_stage(signals: list[StartupSignal], stages: list[str]) -> list[StartupSignal]:
+    return list(iter_filter_by_stage(signals, stages))
 
 
 def filter_excluded(
     signals: list[StartupSignal], excluded_companies: list[str]
 ) -> list[StartupSignal]:
-    excluded = [x.lower().strip() for x in excluded_companies]
-    if not excluded:
-        return signals
-    return [s for s in signals if not any(x in s.company_name.lower() for x in excluded)]
+    return list(iter_filter_excluded(signals, excluded_companies))
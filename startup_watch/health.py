@@ -0,0 +1,85 @@
+import time
+from datetime import datetime, timezone
+
+from startup_watch.state import JsonStore, state_path
+
+CLOSED = "closed"
+OPEN = "open"
+PROBE = "probe"
+
+
+class AdapterHealth(JsonStore):
+    """Per-adapter run history with a circuit breaker.
+
+    Each record holds the last latency, yield, outcome, HTTP status, failure
+    streak and last-success time. Once an adapter has failed ``failure_threshold`` runs
+    in a row its breaker opens and it is skipped. After ``cooldown_seconds``
+    it is admitted once as a probe, without retries; one success closes the
+    breaker again.
+    """
+
+    def __init__(
+        self,
+        path: str = "",
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 259200.0,
+    ):
+        super().__init__(path)
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+
+    @classmethod
+    def from_config(cls, config: dict) -> "AdapterHealth":
+        pipeline_cfg = config.get("pipeline", {})
+        return cls(
+            state_path(config, "adapter_health.json"),
+            failure_threshold=int(pipeline_cfg.get("breaker_failure_threshold", 3)),
+            cooldown_seconds=float(pipeline_cfg.get("breaker_cooldown_hours", 72)) * 3600,
+        )
+
+    def record_for(self, source_name: str) -> dict:
+        """A copy of ``source_name``'s record, or ``{}`` if it has none."""
+        record = self.get(source_name)
+        return dict(record) if isinstance(record, dict) else {}
+
+    def admit(self, source_name: str) -> str:
+        """Return ``closed`` (run normally), ``probe`` (run once) or ``open`` (skip)."""
+        record = self.record_for(source_name)
+        if self.failure_threshold <= 0 or record.get("failure_streak", 0) < self.failure_threshold:
+            return CLOSED
+        if time.time() - record.get("last_attempt_ts", 0) >= self.cooldown_seconds:
+            return PROBE
+        return OPEN
+
+    def record(
+        self,
+        source_name: str,
+        ok: bool,
+        latency: float,
+        signals: int = 0,
+        outcome: str = "",
+        status: int | None = None,
+    ) -> None:
+        record = self.record_for(source_name)
+        record["last_latency_seconds"] = round(latency, 3)
+        record["last_attempt_ts"] = time.time()
+        record["runs"] = record.get("runs", 0) + 1
+        if outcome:
+            record["last_outcome"] = outcome
+            record["last_status"] = status
+        if ok:
+            record["failure_streak"] = 0
+            record["last_yield"] = signals
+            record["last_success"] = datetime.now(timezone.utc).isoformat()
+        else:
+            record["failure_streak"] = record.get("failure_streak", 0) + 1
+        self.set(source_name, record)
+
+    def tripped(self) -> list[str]:
+        with self._lock:
+            return sorted(
+                name
+                for name, record in self.data.items()
+                if self.failure_threshold > 0
+                and record.get("failure_streak", 0) >= self.failure_threshold
+            )
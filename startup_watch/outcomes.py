@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+
+from startup_watch.browser import BrowserUnavailable
+from startup_watch.schema import StartupSignal
+from startup_watch.transport import ResponseTooLarge, UnsupportedContentType
+
+OK = "ok"
+NOT_MODIFIED = "not_modified"
+EMPTY = "empty"
+OFFLINE_MISS = "offline_miss"
+TRANSIENT_ERROR = "transient_error"
+PERMANENT_ERROR = "permanent_error"
+
+TRANSIENT_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Errors that a retry cannot fix: oversized or wrong-type bodies, a missing
+# browser, bad URLs and parser or adapter bugs. Anything else (connection
+# resets, timeouts) is worth a retry.
+PERMANENT_EXCEPTIONS = (
+    ResponseTooLarge,
+    UnsupportedContentType,
+    BrowserUnavailable,
+    ValueError,
+    KeyError,
+    AttributeError,
+    TypeError,
+    IndexError,
+)
+
+
+@dataclass
+class FetchResult:
+    """What one adapter attempt produced and why.
+
+    ``outcome`` is one of ``ok``, ``not_modified``, ``empty``,
+    ``offline_miss``, ``transient_error`` or ``permanent_error``. An
+    offline miss (nothing cached under ``--cache-mode offline``) is neither
+    a failure nor retryable. ``retry_after`` is the
+    server's ``Retry-After`` hint in seconds, honoured by ``RetryPolicy``.
+    """
+
+    signals: list[StartupSignal] = field(default_factory=list)
+    outcome: str = EMPTY
+    status: int | None = None
+    elapsed: float = 0.0
+    error: str = ""
+    retry_after: float | None = None
+
+    @property
+    def failed(self) -> bool:
+        return self.outcome in (TRANSIENT_ERROR, PERMANENT_ERROR)
+
+    @property
+    def retryable(self) -> bool:
+        return self.outcome == TRANSIENT_ERROR
+
+
+class TransientFetchError(Exception):
+    """Raised by scheduler attempts so a transient ``FetchResult`` is retried."""
+
+    def __init__(self, result: FetchResult):
+        super().__init__(result.error or f"status {result.status}")
+        self.result = result
+        self.retry_after = result.retry_after
+
+
+def classify(
+    signals: list[StartupSignal],
+    status: int | None = None,
+    error: Exception | None = None,
+    not_modified: bool = False,
+    offline_miss: bool = False,
+) -> str:
+    """Map what an attempt observed onto an outcome.
+
+    Signals win: an adapter that yielded anything succeeded, even if one of
+    several requests failed. Otherwise an offline cache miss explains the
+    rest, since nothing reached the network.
+    """
+    if signals:
+        return OK
+    if offline_miss:
+        return OFFLINE_MISS
+    if error is not None:
+        return PERMANENT_ERROR if isinstance(error, PERMANENT_EXCEPTIONS) else TRANSIENT_ERROR
+    if not_modified:
+        return NOT_MODIFIED
+    if status is not None and status in TRANSIENT_STATUSES:
+        return TRANSIENT_ERROR
+    if status is not None and status >= 400:
+        return PERMANENT_ERROR
+    return EMPTY
@@ -0,0 +1,104 @@
+import threading
+import time
+
+from startup_watch.urls import host_of, registrable_domain
+
+
+class TokenBucket:
+    """Token bucket that refills at ``rate`` tokens per second up to ``burst``.
+
+    ``reserve`` takes a token immediately and returns how long the caller must
+    wait before using it, so concurrent callers queue up fairly without
+    holding the lock while they sleep.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, clock=time.monotonic):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.clock = clock
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        with self._lock:
+            self._refill()
+            self.tokens -= 1.0
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def tighten(self, rate: float, burst: float) -> None:
+        """Lower ``rate`` and ``burst`` to the given values if they are stricter."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.rate, rate)
+            self.burst = min(self.burst, max(1.0, burst))
+            self.tokens = min(self.tokens, self.burst)
+
+
+class HostRateLimiter:
+    """Per-host politeness: one token bucket per host (or registrable domain).
+
+    Hosts without a configured rate are never delayed. Callers sharing a host
+    share its bucket, and a per-adapter override stricter than the bucket
+    lowers it for everyone, so the strictest rate asked for a host wins
+    whatever order the threads run in. ``defer`` pauses a host outright,
+    e.g. for ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 0.0,
+        burst: float = 1.0,
+        scope: str = "host",
+        sleep=time.sleep,
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.scope = scope
+        self.sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._paused: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "HostRateLimiter":
+        transport_cfg = config.get("transport", {})
+        return cls(
+            rate_per_second=float(transport_cfg.get("rate_limit_per_second", 0)),
+            burst=float(transport_cfg.get("rate_limit_burst", 1)),
+            scope=transport_cfg.get("rate_limit_scope", "host"),
+        )
+
+    def key(self, url: str) -> str:
+        return registrable_domain(url) if self.scope == "domain" else host_of(url)
+
+    def acquire(self, url: str, rate: float | None = None, burst: float | None = None) -> float:
+        """Block until ``url``'s host may be contacted; return the time waited."""
+        key = self.key(url)
+        with self._lock:
+            paused = max(0.0, self._paused.get(key, 0.0) - time.monotonic())
+            bucket = self._buckets.get(key)
+            bucket_rate = self.rate_per_second if rate is None else rate
+            bucket_burst = self.burst if burst is None else burst
+            if bucket is None:
+                if bucket_rate > 0:
+                    bucket = TokenBucket(bucket_rate, bucket_burst)
+                    self._buckets[key] = bucket
+            elif rate is not None and 0 < rate < bucket.rate:
+                bucket.tighten(rate, bucket_burst)
+        wait = paused + (bucket.reserve() if bucket is not None else 0.0)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold every request to ``url``'s host for the next ``seconds``."""
+        key = self.key(url)
+        until = time.monotonic() + seconds
+        with self._lock:
+            self._paused[key] = max(self._paused.get(key, 0.0), until)
@@ -0,0 +1,124 @@
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a ``Retry-After`` header (seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and a per-run retry budget.
+
+    The delay before retry ``n`` is uniform in ``[0, min(max_seconds,
+    base_seconds * 2 ** (n - 1))]``. A server's ``retry_after`` hint (seconds)
+    is used instead when there is one. ``budget`` caps the number of
+    retries across the whole run; ``None`` means unlimited.
+    """
+
+    def __init__(
+        self,
+        retries: int,
+        base_seconds: float,
+        max_seconds: float = 60.0,
+        budget: int | None = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.retries = retries
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self.budget = budget
+        self.rng = rng
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict, retries: int | None = None) -> "RetryPolicy":
+        pipeline_cfg = config.get("pipeline", {})
+        budget = pipeline_cfg.get("retry_budget")
+        return cls(
+            retries=int(pipeline_cfg.get("adapter_retries", 1)) if retries is None else retries,
+            base_seconds=float(pipeline_cfg.get("adapter_backoff_seconds", 0.5)),
+            max_seconds=float(pipeline_cfg.get("adapter_backoff_max_seconds", 60)),
+            budget=None if budget is None else int(budget),
+        )
+
+    def next_delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Return the wait before attempt ``attempt + 1``, or ``None`` to give up."""
+        if attempt > self.retries:
+            return None
+        with self._lock:
+            if self.budget is not None:
+                if self.budget <= 0:
+                    return None
+                self.budget -= 1
+        if retry_after is not None:
+            return min(float(retry_after), self.max_seconds)
+        ceiling = min(self.max_seconds, self.base_seconds * 2 ** (attempt - 1))
+        return self.rng() * ceiling
+
+
+def iter_with_retries(
+    tasks: Sequence[T],
+    attempt: Callable[[T, int], R],
+    retries_for: Callable[[T], int],
+    policy: RetryPolicy,
+    workers: int,
+) -> Iterator[tuple[int, R | Exception]]:
+    """Run ``attempt(task, n)`` for every task on a pool, rescheduling failures.
+
+    A failed attempt is put on a delay queue rather than sleeping in its
+    worker, so other tasks keep the pool busy while a source backs off.
+    ``retries_for`` gives each task's own retry allowance (0 for breaker
+    probes). An exception's ``retry_after`` attribute, if any, is passed to
+    the policy. Yields ``(index, result)`` as each task settles; a task that
+    never succeeds yields its last exception.
+    """
+    delayed: list[tuple[float, int, int, int]] = []
+    sequence = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="adapter") as pool:
+        pending = {pool.submit(attempt, task, 1): (index, 1) for index, task in enumerate(tasks)}
+        while pending or delayed:
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                _, _, index, number = heapq.heappop(delayed)
+                pending[pool.submit(attempt, tasks[index], number)] = (index, number)
+            timeout = max(0.0, delayed[0][0] - now) if delayed else None
+            if not pending:
+                time.sleep(timeout or 0.0)
+                continue
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, number = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    retry_after = getattr(exc, "retry_after", None)
+                    delay = (
+                        policy.next_delay(number, retry_after)
+                        if number <= retries_for(tasks[index])
+                        else None
+                    )
+                    if delay is None:
+                        yield index, exc
+                        continue
+                    heapq.heappush(delayed, (time.monotonic() + delay, sequence, index, number + 1))
+                    sequence += 1
+                    continue
+                yield index, result
@@ -0,0 +1,103 @@
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    # Set by the leader before ``done`` fires, unless ``error`` is.
+    result: T
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        self.callers: set[str] = set()
+
+
+class SingleFlight(Generic[T]):
+    """Run each keyed call once per run and share the result with every caller.
+
+    Callers that arrive while a call is in flight wait for it; callers that
+    arrive later get the retained result. Only results ``keep(result)``
+    accepts are retained, and at most ``max_entries`` of them (least recently
+    used first out), so failures are retried and memory stays bounded.
+    Errors are shared with concurrent waiters only. A named ``caller`` that
+    was already served a retained result is retrying or starting a new run,
+    so it triggers a fresh call instead.
+
+    It also records a digest of every body it sees, so a run can report
+    configured URLs that serve identical content.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inflight: dict[str, _Call[T]] = {}
+        self._done: OrderedDict[str, tuple[T, set[str]]] = OrderedDict()
+        self._callers: dict[str, set[str]] = defaultdict(set)
+        self._digests: dict[str, set[str]] = defaultdict(set)
+        self.hits = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        caller: str = "",
+        keep: Callable[[T], bool] = lambda _result: True,
+    ) -> T:
+        with self._lock:
+            if caller:
+                self._callers[key].add(caller)
+            if key in self._done:
+                result, served = self._done[key]
+                if not caller or caller not in served:
+                    served.add(caller)
+                    self._done.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._done[key]
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._inflight[key] = _Call()
+            else:
+                self.hits += 1
+            call.callers.add(caller)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            result = call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if call.error is None and keep(call.result):
+                    self._done[key] = (call.result, call.callers)
+                    while len(self._done) > self.max_entries:
+                        self._done.popitem(last=False)
+            call.done.set()
+        return result
+
+    def note_content(self, url: str, content: bytes) -> None:
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._digests[digest].add(url)
+
+    def shared_keys(self) -> dict[str, list[str]]:
+        """Keys requested by more than one caller, with those callers."""
+        with self._lock:
+            return {
+                key: sorted(callers) for key, callers in self._callers.items() if len(callers) > 1
+            }
+
+    def duplicate_content(self) -> list[list[str]]:
+        """Groups of distinct URLs whose bodies were byte-identical."""
+        with self._lock:
+            return sorted(sorted(urls) for urls in self._digests.values() if len(urls) > 1)
@@ -0,0 +1,201 @@
+import json
+import re
+
+import lxml.etree as etree
+
+from startup_watch.charset import parseable
+from startup_watch.textsignals import extract_text_signals
+
+FEED_CHUNK = 16 * 1024
+DEFAULT_MAX_ELEMENTS = 3000
+ORGANIZATION_TYPES = {"Organization", "Corporation", "LocalBusiness", "OnlineBusiness", "NGO"}
+_SKIP_TEXT = {"script", "style", "noscript", "template", "svg"}
+_SPACE = re.compile(r"\s+")
+
+
+def _clean(text: object) -> str:
+    return _SPACE.sub(" ", text).strip() if isinstance(text, str) else ""
+
+
+class _MetaTarget:
+    """lxml parser target: keeps head metadata and body text, builds no tree."""
+
+    def __init__(self, scan_body: bool):
+        self.scan_body = scan_body
+        self.elements = 0
+        self.skipping = 0
+        self.in_head = False
+        self.in_title = False
+        self.title_done = False
+        self.in_body = False
+        self.jsonld: list[str] | None = None
+        self.title: list[str] = []
+        self.meta: dict[str, str] = {}
+        self.blocks: list[str] = []
+        self.body_text: list[str] = []
+
+    def start(self, tag: str, attrib: dict) -> None:
+        self.elements += 1
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag == "meta":
+            key = (attrib.get("property") or attrib.get("name") or "").lower()
+            if key and key not in self.meta:
+                self.meta[key] = _clean(attrib.get("content"))
+        elif tag == "head":
+            self.in_head = True
+        elif tag == "title":
+            # Only the document title: SVG icons carry <title> elements too.
+            self.in_title = self.in_head and not self.title_done
+        elif tag == "body":
+            self.in_head = False
+            self.in_body = True
+        elif tag == "script" and attrib.get("type", "").lower() == "application/ld+json":
+            self.jsonld = []
+        if tag in _SKIP_TEXT:
+            self.skipping += 1
+
+    def end(self, tag: str) -> None:
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag == "head":
+            self.in_head = False
+        elif tag == "title" and self.in_title:
+            self.in_title = False
+            self.title_done = True
+        elif tag == "script" and self.jsonld is not None:
+            self.blocks.append("".join(self.jsonld))
+            self.jsonld = None
+        if tag in _SKIP_TEXT:
+            self.skipping = max(self.skipping - 1, 0)
+
+    def data(self, text: str) -> None:
+        if self.jsonld is not None:
+            self.jsonld.append(text)
+        elif self.in_title:
+            self.title.append(text)
+        elif self.scan_body and self.in_body and not self.skipping:
+            self.body_text.append(text)
+
+    def close(self) -> None:
+        return None
+
+
+def _organizations(block: str) -> list[dict]:
+    try:
+        data = json.loads(block)
+    except ValueError:
+        return []
+    stack = data if isinstance(data, list) else [data]
+    found = []
+    while stack:
+        item = stack.pop(0)
+        if not isinstance(item, dict):
+            continue
+        stack.extend(item.get("@graph", []) if isinstance(item.get("@graph"), list) else [])
+        kinds = item.get("@type", [])
+        kinds = kinds if isinstance(kinds, list) else [kinds]
+        if ORGANIZATION_TYPES.intersection(k for k in kinds if isinstance(k, str)):
+            found.append(item)
+    return found
+
+
+def _location(address: object) -> str:
+    if isinstance(address, list):
+        address = address[0] if address else ""
+    if not isinstance(address, dict):
+        return _clean(address)
+    parts = []
+    for key in ("addressLocality", "addressRegion", "addressCountry"):
+        value = address.get(key)
+        value = value.get("name") if isinstance(value, dict) else value
+        if _clean(value) and _clean(value) not in parts:
+            parts.append(_clean(value))
+    return ", ".join(parts)
+
+
+def _headcount(employees: object) -> str:
+    if isinstance(employees, dict):
+        if employees.get("value") is not None:
+            return _clean(str(employees["value"]))
+        low, high = employees.get("minValue"), employees.get("maxValue")
+        if low is not None and high is not None:
+            return f"{low}-{high}"
+        return ""
+    return _clean(str(employees)) if isinstance(employees, (int, str)) else ""
+
+
+def _organization_fields(organization: dict) -> dict:
+    same_as = organization.get("sameAs", [])
+    same_as = same_as if isinstance(same_as, list) else [same_as]
+    founders = organization.get("founder", organization.get("founders", []))
+    founders = founders if isinstance(founders, list) else [founders]
+    return {
+        "org_description": _clean(organization.get("description")),
+        "linkedin_url": next(
+            (url for url in same_as if isinstance(url, str) and "linkedin.com/" in url), ""
+        ),
+        "location": _location(organization.get("address")),
+        "headcount_range": _headcount(organization.get("numberOfEmployees")),
+        "founders": [
+            name
+            for name in (
+                _clean(f.get("name")) if isinstance(f, dict) else _clean(f) for f in founders
+            )
+            if name
+        ],
+    }
+
+
+def extract_site_meta(
+    content: bytes,
+    encoding: str | None = None,
+    scan_body: bool = True,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
+) -> dict:
+    """Title, descriptions, JSON-LD organisation data and a funding mention.
+
+    The bytes are fed to lxml in chunks through a parser target, so no tree
+    or soup is built. Parsing stops after ``max_elements`` elements, or once
+    a funding amount has been found in the body text (only scanned with
+    ``scan_body``). Returns ``title``, ``description`` (meta, OpenGraph or
+    JSON-LD), ``funding_amount``, ``linkedin_url``, ``location``,
+    ``headcount_range`` and ``founders``.
+    """
+    target = _MetaTarget(scan_body)
+    content, encoding = parseable(content, encoding)
+    try:
+        parser = etree.HTMLParser(target=target, encoding=encoding, remove_comments=True)
+    except LookupError:
+        content = content.decode(encoding or "utf-8", errors="replace").encode("utf-8")
+        parser = etree.HTMLParser(target=target, encoding="utf-8", remove_comments=True)
+    funding = ""
+    scanned = 0
+    for start in range(0, len(content), FEED_CHUNK):
+        parser.feed(content[start:start + FEED_CHUNK])
+        if scan_body and len(target.body_text) > scanned:
+            # Rescan the last piece too: an amount may straddle two chunks.
+            text = "".join(target.body_text[max(scanned - 1, 0):])
+            funding = extract_text_signals(text).amount
+            scanned = len(target.body_text)
+        if funding or target.elements >= max_elements:
+            break
+    else:
+        if content:
+            parser.close()
+    meta = target.meta
+    organization: dict = {}
+    for block in target.blocks:
+        organizations = _organizations(block)
+        if organizations:
+            organization = _organization_fields(organizations[0])
+            break
+    return {
+        "title": _clean("".join(target.title)) or meta.get("og:title", ""),
+        "description": meta.get("description")
+        or meta.get("og:description")
+        or organization.get("org_description", ""),
+        "funding_amount": funding,
+        "linkedin_url": organization.get("linkedin_url", ""),
+        "location": organization.get("location", ""),
+        "headcount_range": organization.get("headcount_range", ""),
+        "founders": organization.get("founders", []),
+    }
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from startup_watch.schema import StartupSignal
+
+# Cost classes, cheapest first: in-memory checks, then network round-trips.
+CHEAP = "cheap"
+NETWORK = "network"
+COST_CLASSES = (CHEAP, NETWORK)
+
+StageFn = Callable[[Iterable[StartupSignal]], Iterator[StartupSignal]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of ``process_signals`` and what the planner may assume about it.
+
+    ``selective`` stages may drop signals. ``stateful`` stages decide per
+    signal from what they saw earlier (dedup keeps the first of each key),
+    so they never trade places with a selective stage. ``reads`` and
+    ``writes`` name the signal fields a stage looks at and fills in; a stage
+    never moves past one that writes a field it reads or writes.
+    """
+
+    name: str
+    apply: StageFn
+    cost: str = CHEAP
+    selective: bool = False
+    stateful: bool = False
+    reads: frozenset[str] = frozenset()
+    writes: frozenset[str] = frozenset()
+
+    def run(self, signals: Iterable[StartupSignal]) -> Iterator[StartupSignal]:
+        return self.apply(signals)
+
+
+def commutes(first: Stage, second: Stage) -> bool:
+    """True if running ``second`` before ``first`` yields the same signals."""
+    if first.writes & (second.reads | second.writes) or second.writes & first.reads:
+        return False
+    if (first.stateful and second.selective) or (second.stateful and first.selective):
+        return False
+    return True
+
+
+def _rank(stage: Stage) -> tuple[int, int]:
+    return COST_CLASSES.index(stage.cost), 0 if stage.selective else 1
+
+
+def plan_stages(stages: Iterable[Stage]) -> list[Stage]:
+    """Order ``stages`` so cheap, selective ones run before expensive ones.
+
+    Each stage moves ahead of more expensive stages, stepping over equally
+    ranked ones on the way, but only past stages it commutes with. The
+    output is the same as in declaration order; the expensive stages just
+    see fewer signals.
+    """
+    planned: list[Stage] = []
+    for stage in stages:
+        position = len(planned)
+        for index in range(len(planned) - 1, -1, -1):
+            other = planned[index]
+            if _rank(other) < _rank(stage) or not commutes(other, stage):
+                break
+            if _rank(other) > _rank(stage):
+                position = index
+        planned.insert(position, stage)
+    return planned
+
+
+def run_stages(
+    signals: Iterable[StartupSignal], stages: Iterable[Stage]
+) -> Iterator[StartupSignal]:
+    """Chain ``stages`` lazily over ``signals`` in the given order."""
+    for stage in stages:
+        signals = stage.run(signals)
+    return iter(signals)
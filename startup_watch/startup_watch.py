@@ -1,17 +1,33 @@
 import argparse
 
-from startup_watch.pipeline import load_config, run_pipeline, write_csv
+from startup_watch.cache import CACHE_MODES
+from startup_watch.pipeline import load_config, stream_pipeline_to_csv
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", required=True, help="Path to YAML config")
+    parser.add_argument(
+        "--cache-mode",
+        choices=CACHE_MODES,
+        help="HTTP cache mode: use fresh entries, refresh all, or replay offline",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip feed entries already emitted by an earlier run",
+    )
     args = parser.parse_args()
 
     config = load_config(args.config)
-    signals = run_pipeline(config)
-    output_path = write_csv(signals, config.get("output_dir", "startup_watch/output"))
-    print(f"Wrote {len(signals)} rows to {output_path}")
+    if args.cache_mode:
+        config.setdefault("cache", {})["mode"] = args.cache_mode
+    if args.incremental:
+        config.setdefault("pipeline", {})["incremental"] = True
+    output_path, rows = stream_pipeline_to_csv(
+        config, config.get("output_dir", "startup_watch/output")
+    )
+    print(f"Wrote {rows} rows to {output_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from startup_watch.urls import site_key
+
+
+class JsonStore:
+    """Thread-safe JSON mapping persisted atomically between runs.
+
+    A store without a ``path`` lives in memory only, which keeps tests and
+    ad-hoc runs free of side effects.
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data: dict = self._load()
+
+    def _load(self) -> dict:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                loaded = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return loaded if isinstance(loaded, dict) else {}
+
+    def get(self, key: str, default: object = None) -> object:
+        with self._lock:
+            return self.data.get(key, default)
+
+    def set(self, key: str, value: object) -> None:
+        with self._lock:
+            self.data[key] = value
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(self.data, handle, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def state_path(config: dict, filename: str) -> str:
+    """Return ``filename`` inside the configured ``state_dir`` ('' if unset)."""
+    state_dir = config.get("state_dir", "")
+    return os.path.join(state_dir, filename) if state_dir else ""
+
+
+class ValidatorStore(JsonStore):
+    """Per-URL ``ETag`` / ``Last-Modified`` validators for conditional GETs."""
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        validators = self.get(url)
+        headers: dict[str, str] = {}
+        if not isinstance(validators, dict):
+            return headers
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def update(self, url: str, response_headers: dict[str, str]) -> None:
+        lowered = {k.lower(): v for k, v in response_headers.items()}
+        validators = {
+            "etag": lowered.get("etag", ""),
+            "last_modified": lowered.get("last-modified", ""),
+        }
+        if validators["etag"] or validators["last_modified"]:
+            self.set(url, validators)
+
+
+def entry_key(entry: dict) -> str:
+    """Stable key for a feed entry: its GUID (or link) plus published date."""
+    ident = entry.get("id") or entry.get("link") or entry.get("title", "")
+    published = entry.get("published") or entry.get("updated") or ""
+    return hashlib.sha1(f"{ident}|{published}".encode("utf-8")).hexdigest()[:20]
+
+
+class CursorStore(JsonStore):
+    """Per-source feed entries already emitted, for ``--incremental`` runs.
+
+    Each source keeps at most ``max_entries`` keys; the least recently seen
+    are dropped first, so entries still present in a feed are never forgotten.
+    """
+
+    def __init__(self, path: str = "", max_entries: int = 1000):
+        super().__init__(path)
+        self.max_entries = max_entries
+
+    @classmethod
+    def from_config(cls, config: dict) -> "CursorStore | None":
+        pipeline_cfg = config.get("pipeline", {})
+        if not pipeline_cfg.get("incremental", False):
+            return None
+        return cls(
+            state_path(config, "feed_cursors.json"),
+            max_entries=int(pipeline_cfg.get("incremental_max_entries", 1000)),
+        )
+
+    def take_new(self, source_name: str, entries: list, limit: int | None = None) -> list:
+        """Return up to ``limit`` entries not seen before and mark them seen."""
+        keys = [entry_key(entry) for entry in entries]
+        now = time.time()
+        with self._lock:
+            seen = dict(self.data.get(source_name, {}))
+            fresh = []
+            for entry, key in zip(entries, keys):
+                if key in seen:
+                    seen[key] = now
+                elif limit is None or len(fresh) < limit:
+                    seen[key] = now
+                    fresh.append(entry)
+            if len(seen) > self.max_entries:
+                seen = dict(sorted(seen.items(), key=lambda item: item[1])[-self.max_entries:])
+            self.data[source_name] = seen
+        return fresh
+
+
+class EnrichmentStore(JsonStore):
+    """Homepage title and funding mention per site (see ``urls.site_key``).
+
+    Records younger than ``ttl`` are used as they are; records up to
+    ``stale_seconds`` older are still used while they are refetched
+    (stale-while-revalidate); anything older is ignored and pruned on save.
+    Permanent failures keep their HTTP status, so dead sites are not retried
+    every run either; callers do not store transient ones (see
+    ``enrichment.worth_keeping``).
+    """
+
+    def __init__(
+        self, path: str = "", ttl: float = 30 * 86400.0, stale_seconds: float = 7 * 86400.0
+    ):
+        super().__init__(path)
+        self.ttl = ttl
+        self.stale_seconds = stale_seconds
+
+    @classmethod
+    def from_config(cls, config: dict) -> "EnrichmentStore":
+        enrich_cfg = config.get("enrichment", {})
+        return cls(
+            enrich_cfg.get("cache_file") or state_path(config, "enrichment_cache.json"),
+            ttl=float(enrich_cfg.get("cache_ttl_seconds", 30 * 86400)),
+            stale_seconds=float(enrich_cfg.get("stale_seconds", 7 * 86400)),
+        )
+
+    def lookup(self, url: str) -> tuple[dict | None, bool]:
+        """``(record, fresh)`` for ``url``'s site, or ``(None, False)`` if unusable."""
+        record = self.get(site_key(url))
+        if not isinstance(record, dict):
+            return None, False
+        age = time.time() - record.get("fetched_at", 0)
+        if age >= self.ttl + self.stale_seconds:
+            return None, False
+        return record, age < self.ttl
+
+    def put(self, url: str, record: dict) -> None:
+        self.set(site_key(url), {**record, "fetched_at": time.time()})
+
+    def save(self) -> None:
+        cutoff = time.time() - self.ttl - self.stale_seconds
+        with self._lock:
+            self.data = {
+                key: record
+                for key, record in self.data.items()
+                if isinstance(record, dict) and record.get("fetched_at", 0) > cutoff
+            }
+        super().save()
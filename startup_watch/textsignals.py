@@ -0,0 +1,115 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from startup_watch.schema import StartupSignal
+
+# Most specific first; the old substring checks used the same precedence.
+STAGE_PRIORITY = ("pre-seed", "series-c", "series-b", "series-a", "seed", "stealth")
+CURRENCIES = {"$": "USD", "€": "EUR", "£": "GBP", "USD": "USD", "EUR": "EUR", "GBP": "GBP"}
+MULTIPLIERS = {
+    "k": 1e3,
+    "thousand": 1e3,
+    "m": 1e6,
+    "mn": 1e6,
+    "million": 1e6,
+    "b": 1e9,
+    "bn": 1e9,
+    "billion": 1e9,
+}
+
+# Capitalised words; dots only inside a word, so a sentence end stops a name.
+_WORD = r"[A-Z0-9][\w'&-]*(?:\.[\w'&-]+)*"
+_NAME = rf"{_WORD}(?:\s+(?:&\s+)?{_WORD})*"
+_NAMES = rf"{_NAME}(?:(?:\s*,\s*(?:and\s+)?|\s+and\s+){_NAME})*"
+# One alternation, one outer named group per kind; ``finditer`` walks the
+# text once and ``lastgroup`` says which kind matched. The lookahead lists
+# every character a match can start with, so most positions fail at once.
+PATTERN = re.compile(
+    r"(?=[$€£UEGPSBLCIpsblci])(?:"
+    r"(?P<amount>(?:(?P<symbol>[$€£])\s?|\b(?P<code>USD|EUR|GBP)\s?)"
+    r"(?P<number>\d{1,3}(?:\.\d+)?)\s?"
+    r"(?P<unit>(?i:thousand|million|billion|mn|bn|k|m|b))\b)"
+    r"|(?P<round>\b(?i:pre[-\s]?seed|seed|series[-\s][a-e]|bridge)\b)"
+    r"|(?P<stealth>\b(?i:stealth)\b)"
+    r"|(?P<investors>\b(?i:co-led by|led by|backed by|participation from|investors includ(?:e|ing))"
+    rf"\s+(?P<names>{_NAMES})))"
+)
+_NAME_SEPARATOR = re.compile(r"\s*,\s*(?:and\s+)?|\s+and\s+")
+
+
+@dataclass
+class TextSignals:
+    """What one pass over a text found; empty fields mean no mention."""
+
+    stage: str = "unknown"
+    round_type: str = ""
+    amount: str = ""
+    amount_value: float | None = None
+    currency: str = ""
+    investors: list[str] = field(default_factory=list)
+
+
+def _round_name(text: str) -> str:
+    words = re.split(r"[-\s]+", text.lower())
+    return "pre-seed" if words[0] == "pre" or words[0] == "preseed" else "-".join(words)
+
+
+def extract_text_signals(text: str) -> TextSignals:
+    """Stage, first round type, first amount and investor mentions in ``text``.
+
+    The amount keeps its original spelling in ``amount`` and is normalised to
+    ``amount_value`` (a plain number) and an ISO ``currency`` code.
+    """
+    found = TextSignals()
+    stages: set[str] = set()
+    for match in PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == "amount" and not found.amount:
+            found.amount = match.group("amount")
+            found.currency = CURRENCIES[match.group("symbol") or match.group("code")]
+            multiplier = MULTIPLIERS[match.group("unit").lower()]
+            found.amount_value = round(float(match.group("number")) * multiplier, 2)
+        elif kind == "round":
+            round_type = _round_name(match.group("round"))
+            found.round_type = found.round_type or round_type
+            stages.add(round_type)
+        elif kind == "stealth":
+            stages.add("stealth")
+        elif kind == "investors":
+            for name in _NAME_SEPARATOR.split(match.group("names")):
+                name = name.strip()
+                if name and name not in found.investors:
+                    found.investors.append(name)
+    found.stage = next((stage for stage in STAGE_PRIORITY if stage in stages), "unknown")
+    return found
+
+
+def extract_many(texts: Iterable[str]) -> list[TextSignals]:
+    return [extract_text_signals(text) for text in texts]
+
+
+def signal_text(signal: StartupSignal) -> str:
+    return f"{signal.company_name}\n{signal.description}"
+
+
+def iter_annotate(signals: Iterable[StartupSignal]) -> Iterator[StartupSignal]:
+    """Fill stage, funding amount and investors from each signal's own text.
+
+    A stage named in the headline or description replaces the adapter's
+    source-level default; the funding amount and investors only fill empty
+    fields.
+    """
+    for signal in signals:
+        found = extract_text_signals(signal_text(signal))
+        if found.stage != "unknown":
+            signal.stage = found.stage
+        if not signal.funding_amount and found.amount:
+            signal.funding_amount = found.amount
+        if not signal.investor_names and found.investors:
+            signal.investor_names = found.investors
+        yield signal
+
+
+def annotate_signals(signals: list[StartupSignal]) -> list[StartupSignal]:
+    return list(iter_annotate(signals))
@@ -0,0 +1,322 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+from startup_watch.browser import BrowserPool, BrowserUnavailable
+from startup_watch.cache import ResponseCache
+from startup_watch.charset import detect_encoding
+from startup_watch.ratelimit import HostRateLimiter
+from startup_watch.retry import parse_retry_after
+from startup_watch.singleflight import SingleFlight
+from startup_watch.state import ValidatorStore, state_path
+
+DEFAULT_USER_AGENT = "startup-watch/1.0"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+THROTTLE_STATUSES = (429, 503)
+CHUNK_SIZE = 64 * 1024
+# Media types accepted by default; an entry ending in "/" matches any subtype.
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+FEED_TYPES = (
+    "application/rss+xml",
+    "application/atom+xml",
+    "application/rdf+xml",
+    "application/xml",
+    "text/",
+)
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a response body exceeds the transport byte cap."""
+
+
+class UnsupportedContentType(Exception):
+    """Raised when a response's media type is not in the caller's allowlist."""
+
+
+def media_type(headers: dict) -> str:
+    """Lower-cased ``type/subtype`` from ``Content-Type``, or ``""``."""
+    for name, value in headers.items():
+        if name.lower() == "content-type":
+            return value.split(";", 1)[0].strip().lower()
+    return ""
+
+
+def content_type_allowed(headers: dict, allowed: tuple[str, ...] | None) -> bool:
+    """True without an allowlist or ``Content-Type``, else if any entry matches."""
+    kind = media_type(headers)
+    if not allowed or not kind:
+        return True
+    return any(
+        kind.startswith(entry) if entry.endswith("/") else kind == entry for entry in allowed
+    )
+
+
+@dataclass
+class TransportResponse:
+    url: str
+    status_code: int
+    content: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    from_cache: bool = False
+    truncated: bool = False
+    offline_miss: bool = False
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @cached_property
+    def encoding(self) -> str:
+        """Declared or sniffed charset; the body is never scanned for a guess."""
+        return detect_encoding(self.headers, self.content)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+
+# A feed download shared through ``HttpTransport.flights``: response and parse.
+FeedFetch = tuple[TransportResponse, feedparser.FeedParserDict]
+
+
+class HttpTransport:
+    """Pooled HTTP client shared by every adapter in a run.
+
+    One ``requests.Session`` keeps a keep-alive connection pool per host, so
+    repeated requests to the same publisher reuse TCP+TLS connections. Bodies
+    are streamed and capped at ``max_bytes`` (per request if the caller asks)
+    so one oversized response cannot stall or bloat the run. ``flights`` lets
+    adapters that share a URL fetch and parse it once per run. With a
+    ``browser`` pool, ``render`` loads JavaScript-built pages.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: float = 20.0,
+        connect_timeout: float = 5.0,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        pool_connections: int = 64,
+        pool_maxsize: int = 16,
+        validators: ValidatorStore | None = None,
+        cache: ResponseCache | None = None,
+        limiter: HostRateLimiter | None = None,
+        browser: BrowserPool | None = None,
+    ):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_bytes = max_bytes
+        self.validators = validators
+        self.cache = cache
+        self.limiter = limiter or HostRateLimiter()
+        self.browser = browser
+        self.flights: SingleFlight[FeedFetch] = SingleFlight()
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        pooled = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", pooled)
+        self.session.mount("https://", pooled)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "HttpTransport":
+        transport_cfg = config.get("transport", {})
+        validators = None
+        if transport_cfg.get("conditional_get", True):
+            validators = ValidatorStore(state_path(config, "feed_validators.json"))
+        return cls(
+            user_agent=transport_cfg.get("user_agent", DEFAULT_USER_AGENT),
+            timeout=float(transport_cfg.get("timeout_seconds", 20)),
+            connect_timeout=float(transport_cfg.get("connect_timeout_seconds", 5)),
+            max_bytes=int(transport_cfg.get("max_response_bytes", DEFAULT_MAX_BYTES)),
+            pool_connections=int(transport_cfg.get("pool_connections", 64)),
+            pool_maxsize=int(transport_cfg.get("pool_maxsize", 16)),
+            validators=validators,
+            cache=ResponseCache.from_config(config, state_path(config, "http_cache")),
+            limiter=HostRateLimiter.from_config(config),
+            browser=BrowserPool.from_config(config),
+        )
+
+    def get(
+        self,
+        url: str,
+        timeout: float | None = None,
+        headers: dict | None = None,
+        conditional: bool = False,
+        ttl: float | None = None,
+        rate_limit: float | None = None,
+        rate_burst: float | None = None,
+        max_bytes: int | None = None,
+        content_types: tuple[str, ...] | None = None,
+        truncate: bool = False,
+        stop_at: bytes | None = None,
+    ) -> TransportResponse:
+        """GET ``url``; ``conditional`` sends stored validators and may return 304.
+
+        Validators are not sent in the cache's ``refresh`` mode, so a forced
+        refresh always downloads the body (and updates the validators).
+
+        With a cache, fresh entries (younger than ``ttl``) are served from disk.
+        In offline mode a miss answers 504, as for ``only-if-cached``, and is
+        marked ``offline_miss``. Network
+        requests wait for the host's token bucket; ``rate_limit`` and
+        ``rate_burst`` override its defaults. A 429/503 with ``Retry-After``
+        pauses the host for the advertised delay.
+
+        ``max_bytes`` overrides the transport's byte cap for this request, and
+        a 200 whose ``Content-Type`` is not in ``content_types`` raises
+        ``UnsupportedContentType`` before the body is read. With ``truncate``
+        the first ``max_bytes`` are returned instead of raising, and
+        ``stop_at`` (matched case-insensitively, e.g. ``b"</head>"``) ends the
+        download once seen. Truncated bodies are marked and never cached.
+        """
+        if self.cache is not None:
+            cached = self.cache.lookup(url, ttl)
+            if cached is not None:
+                return TransportResponse(
+                    url=url,
+                    status_code=cached["status_code"],
+                    content=cached["content"],
+                    headers=cached["headers"],
+                    from_cache=True,
+                )
+            if self.cache.offline:
+                return TransportResponse(url=url, status_code=504, offline_miss=True)
+        self.limiter.acquire(url, rate=rate_limit, burst=rate_burst)
+        # A forced refresh must get a full body back, never a 304.
+        refresh = self.cache is not None and self.cache.refresh
+        if conditional and self.validators is not None and not refresh:
+            headers = {**self.validators.request_headers(url), **(headers or {})}
+        started = time.monotonic()
+        with self.session.get(
+            url,
+            timeout=(self.connect_timeout, timeout or self.timeout),
+            headers=headers,
+            stream=True,
+        ) as raw:
+            response_headers = dict(raw.headers)
+            if raw.status_code == 200 and not content_type_allowed(response_headers, content_types):
+                raise UnsupportedContentType(
+                    f"{raw.url} serves {media_type(response_headers)!r}, expected {content_types}"
+                )
+            content, truncated = self._read_capped(
+                raw, max_bytes or self.max_bytes, truncate=truncate, stop_at=stop_at
+            )
+            if raw.status_code in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(raw.headers.get("Retry-After"))
+                if retry_after:
+                    self.limiter.defer(url, retry_after)
+            complete = raw.status_code == 200 and not truncated
+            if conditional and self.validators is not None and complete:
+                self.validators.update(url, response_headers)
+            if self.cache is not None and complete:
+                self.cache.store(url, raw.status_code, response_headers, content)
+            return TransportResponse(
+                url=raw.url or url,
+                status_code=raw.status_code,
+                content=content,
+                headers=response_headers,
+                elapsed=time.monotonic() - started,
+                truncated=truncated,
+            )
+
+    def _read_capped(
+        self,
+        raw: requests.Response,
+        max_bytes: int,
+        truncate: bool = False,
+        stop_at: bytes | None = None,
+    ) -> tuple[bytes, bool]:
+        """Body of ``raw`` and whether the download stopped before its end."""
+        declared = raw.headers.get("Content-Length", "")
+        if not truncate and declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLarge(f"{raw.url} declares {declared} bytes > {max_bytes}")
+        marker = stop_at.lower() if stop_at else b""
+        body = bytearray()
+        for chunk in raw.iter_content(CHUNK_SIZE):
+            # Rescan the chunk plus enough overlap to catch a split marker.
+            scan_from = max(len(body) - len(marker), 0)
+            body.extend(chunk)
+            if marker:
+                found = bytes(body[scan_from:]).lower().find(marker)
+                if found != -1:
+                    return bytes(body[: scan_from + found + len(marker)]), True
+            if len(body) > max_bytes:
+                if truncate:
+                    return bytes(body[:max_bytes]), True
+                raise ResponseTooLarge(f"{raw.url} exceeded {max_bytes} bytes")
+        return bytes(body), False
+
+    def render(
+        self, url: str, wait_for: str | None = None, ttl: float | None = None
+    ) -> TransportResponse:
+        """Load ``url`` in the browser pool, after the host's token bucket.
+
+        Rendered pages share the response cache under their own key, so a
+        fresh one (younger than ``ttl``) needs no browser; offline, a miss
+        answers 504 like ``get``. Raises ``BrowserUnavailable`` when
+        ``playwright_fallback`` is off.
+        """
+        key = f"render:{url}"
+        if self.cache is not None:
+            cached = self.cache.lookup(key, ttl)
+            if cached is not None:
+                return TransportResponse(
+                    url=url,
+                    status_code=cached["status_code"],
+                    content=cached["content"],
+                    headers=cached["headers"],
+                    from_cache=True,
+                )
+            if self.cache.offline:
+                return TransportResponse(url=url, status_code=504, offline_miss=True)
+        if self.browser is None:
+            raise BrowserUnavailable("playwright_fallback is disabled")
+        self.limiter.acquire(url)
+        page = self.browser.render(url, wait_for=wait_for)
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        content = page.html.encode("utf-8")
+        if self.cache is not None and page.status_code == 200:
+            self.cache.store(key, page.status_code, headers, content)
+        return TransportResponse(
+            url=page.url,
+            status_code=page.status_code,
+            content=content,
+            headers=headers,
+            elapsed=page.elapsed,
+        )
+
+    def persist(self) -> None:
+        """Save validators once a run has finished successfully."""
+        if self.validators is not None:
+            self.validators.save()
+
+    def close(self) -> None:
+        self.session.close()
+        if self.browser is not None:
+            self.browser.close()
+
+    def __enter__(self) -> "HttpTransport":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_default_transport: HttpTransport | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """Return the process-wide transport used when none is injected."""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
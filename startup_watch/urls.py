@@ -0,0 +1,41 @@
+from urllib.parse import urlsplit
+
+# Second-level labels under which registrations happen one level deeper,
+# e.g. ``example.co.uk``. A heuristic stand-in for the public suffix list.
+_SECOND_LEVEL_SUFFIXES = {"ac", "co", "com", "edu", "gov", "net", "org"}
+# Hosts that serve unrelated sites under a path prefix, with its depth.
+_PATH_SITE_HOSTS = {"sites.google.com": 2, "github.com": 1, "medium.com": 1, "linktr.ee": 1}
+
+
+def host_of(url: str) -> str:
+    """Return the lowercase host of ``url`` (or of a bare host name)."""
+    host = urlsplit(url if "//" in url else f"//{url}").hostname or ""
+    return host.lower().rstrip(".")
+
+
+def registrable_domain(url: str) -> str:
+    """Return the registrable domain, e.g. ``news.sifted.eu`` -> ``sifted.eu``."""
+    labels = [label for label in host_of(url).split(".") if label]
+    if len(labels) <= 2:
+        return ".".join(labels)
+    if len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def site_key(url: str) -> str:
+    """Return the key of the site ``url`` belongs to, e.g. ``acme.github.io``.
+
+    Unlike ``registrable_domain`` this never merges hosts, so companies on
+    shared platforms (``*.github.io``, ``*.vercel.app``) stay apart; a
+    leading ``www.`` is dropped, and path-hosted sites such as
+    ``sites.google.com/view/acme`` keep their path prefix.
+    """
+    host = host_of(url)
+    host = host[4:] if host.startswith("www.") else host
+    depth = _PATH_SITE_HOSTS.get(host, 0)
+    if not depth:
+        return host
+    path = urlsplit(url if "//" in url else f"//{url}").path
+    segments = [segment.lower() for segment in path.split("/") if segment][:depth]
+    return "/".join([host, *segments])
@@ -29,7 +29,7 @@ def test_run_pipeline_filters_dedups_and_normalizes(monkeypatch) -> None:
             source_url="https://example.com/c",
         ),
     ]
-    monkeypatch.setattr("startup_watch.pipeline.collect_signals", lambda _cfg: sample)
+    monkeypatch.setattr("startup_watch.pipeline.collect_signals", lambda _cfg, **_kwargs: sample)
 
     config = {
         "filters": {"exclude_companies": ["Other Co"]},
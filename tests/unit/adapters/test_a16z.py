@@ -5,11 +5,13 @@ class _Resp:
     def __init__(self, code: int, text: str):
         self.status_code = code
         self.text = text
+        self.content = text.encode("utf-8")
+        self.encoding = "utf-8"
 
 
 def test_fetch_returns_list(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.a16z.requests.get",
+        "startup_watch.transport.HttpTransport.get",
         lambda *a, **k: _Resp(200, "<h2>ChainOps</h2>"),
     )
     adapter = A16zAdapter({"enabled": True, "url": "https://example.com"})
@@ -18,7 +20,7 @@ def test_fetch_returns_list(monkeypatch) -> None:
 
 def test_fetch_handles_404(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.a16z.requests.get",
+        "startup_watch.transport.HttpTransport.get",
         lambda *a, **k: _Resp(404, ""),
     )
     adapter = A16zAdapter({"enabled": True, "url": "https://example.com"})
@@ -27,7 +29,7 @@ def test_fetch_handles_404(monkeypatch) -> None:
 
 def test_signal_fields(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.a16z.requests.get",
+        "startup_watch.transport.HttpTransport.get",
         lambda *a, **k: _Resp(200, "<h3>Flow Foundry</h3>"),
     )
     adapter = A16zAdapter({"enabled": True, "url": "https://example.com"})
@@ -1,4 +1,4 @@
-from startup_watch.adapters.agfunder_news import AgfunderNewsAdapter
+from startup_watch.adapters.feeds import AgfunderNewsAdapter
 
 
 class _Feed:
@@ -8,7 +8,7 @@ class _Feed:
 
 def test_fetch_returns_list(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.agfunder_news.feedparser.parse",
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
         lambda *a, **k: _Feed([type("E", (), {"title": "Farm", "link": "u", "summary": "s"})()]),
     )
     adapter = AgfunderNewsAdapter({"enabled": True, "url": "https://example.com/feed"})
@@ -19,14 +19,14 @@ def test_fetch_handles_parse_error(monkeypatch) -> None:
     def _boom(*args, **kwargs):
         raise RuntimeError("x")
 
-    monkeypatch.setattr("startup_watch.adapters.agfunder_news.feedparser.parse", _boom)
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", _boom)
     adapter = AgfunderNewsAdapter({"enabled": True, "url": "https://example.com/feed"})
     assert adapter.fetch() == []
 
 
 def test_signal_fields(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.agfunder_news.feedparser.parse",
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
         lambda *a, **k: _Feed([type("E", (), {"title": "Soil", "link": "u", "summary": "s"})()]),
     )
     adapter = AgfunderNewsAdapter({"enabled": True, "url": "https://example.com/feed"})
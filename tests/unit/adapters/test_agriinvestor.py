@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.agriinvestor import AgriinvestorAdapter
+from startup_watch.adapters.feeds import AgriinvestorAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -17,7 +17,7 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_agriinvestor_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.agriinvestor.feedparser.parse", lambda _url: _fake_feed()
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed()
     )
     adapter = AgriinvestorAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.crunchbase_news import CrunchbaseNewsAdapter
+from startup_watch.adapters.feeds import CrunchbaseNewsAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -9,7 +9,7 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_crunchbase_news_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.crunchbase_news.feedparser.parse", lambda _url: _fake_feed()
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed()
     )
     adapter = CrunchbaseNewsAdapter({"enabled": True, "url": "https://example.com/feed"})
     signals = adapter.fetch()
@@ -5,11 +5,13 @@ class _Resp:
     def __init__(self, code: int, text: str):
         self.status_code = code
         self.text = text
+        self.content = text.encode("utf-8")
+        self.encoding = "utf-8"
 
 
 def test_fetch_returns_list(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.f6s.requests.get",
+        "startup_watch.transport.HttpTransport.get",
         lambda *a, **k: _Resp(200, "<h2>SupplyOS</h2>"),
     )
     adapter = F6sAdapter({"enabled": True, "url": "https://example.com"})
@@ -17,14 +19,14 @@ def test_fetch_returns_list(monkeypatch) -> None:
 
 
 def test_fetch_handles_404(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.f6s.requests.get", lambda *a, **k: _Resp(404, ""))
+    monkeypatch.setattr("startup_watch.transport.HttpTransport.get", lambda *a, **k: _Resp(404, ""))
     adapter = F6sAdapter({"enabled": True, "url": "https://example.com"})
     assert adapter.fetch() == []
 
 
 def test_signal_fields(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.f6s.requests.get",
+        "startup_watch.transport.HttpTransport.get",
         lambda *a, **k: _Resp(200, "<h3>FactoryFlow</h3>"),
     )
     adapter = F6sAdapter({"enabled": True, "url": "https://example.com"})
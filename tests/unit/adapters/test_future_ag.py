@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.future_ag import FutureAgAdapter
+from startup_watch.adapters.feeds import FutureAgAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -16,7 +16,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_future_ag_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.future_ag.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FutureAgAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
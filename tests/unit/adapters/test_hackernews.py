@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.hackernews import HackernewsAdapter
+from startup_watch.adapters.feeds import HackernewsAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -8,7 +8,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_hackernews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.hackernews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = HackernewsAdapter({"enabled": True, "url": "https://example.com/feed"})
     signals = adapter.fetch()
     assert len(signals) == 1
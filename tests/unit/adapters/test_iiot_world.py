@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.iiot_world import IiotWorldAdapter
+from startup_watch.adapters.feeds import IiotWorldAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -17,7 +17,7 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_iiot_world_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.iiot_world.feedparser.parse", lambda _url: _fake_feed()
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed()
     )
     adapter = IiotWorldAdapter({"enabled": True, "url": "https://example.com/feed"})
 
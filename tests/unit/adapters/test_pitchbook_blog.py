@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.pitchbook_blog import PitchbookBlogAdapter
+from startup_watch.adapters.feeds import PitchbookBlogAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -17,7 +17,7 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_pitchbook_blog_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.pitchbook_blog.feedparser.parse", lambda _url: _fake_feed()
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed()
     )
     adapter = PitchbookBlogAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.reddit_startups import RedditStartupsAdapter
+from startup_watch.adapters.feeds import RedditStartupsAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -8,7 +8,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_reddit_startups_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.reddit_startups.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = RedditStartupsAdapter({"enabled": True, "url": "https://example.com/feed"})
     signals = adapter.fetch()
     assert len(signals) == 1
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.sifted import SiftedAdapter
+from startup_watch.adapters.feeds import SiftedAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -16,7 +16,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_sifted_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.sifted.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SiftedAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.startupland import StartuplandAdapter
+from startup_watch.adapters.feeds import StartuplandAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -8,7 +8,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_startupland_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupland.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartuplandAdapter({"enabled": True, "url": "https://example.com/feed"})
     signals = adapter.fetch()
     assert len(signals) == 1
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.sustainability_mag import SustainabilityMagAdapter
+from startup_watch.adapters.feeds import SustainabilityMagAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -8,7 +8,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_sustainability_mag_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.sustainability_mag.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SustainabilityMagAdapter({"enabled": True, "url": "https://example.com/feed"})
     signals = adapter.fetch()
     assert len(signals) == 1
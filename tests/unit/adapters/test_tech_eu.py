@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.tech_eu import TechEuAdapter
+from startup_watch.adapters.feeds import TechEuAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -8,7 +8,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_tech_eu_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.tech_eu.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechEuAdapter({"enabled": True, "url": "https://example.com/feed"})
     signals = adapter.fetch()
     assert len(signals) == 1
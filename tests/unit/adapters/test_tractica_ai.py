@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.tractica_ai import TracticaAiAdapter
+from startup_watch.adapters.feeds import TracticaAiAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -17,7 +17,7 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_tractica_ai_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.tractica_ai.feedparser.parse", lambda _url: _fake_feed()
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed()
     )
     adapter = TracticaAiAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -0,0 +1,32 @@
+import pytest
+
+
+class FakeResponse:
+    """Stand-in for a streamed ``requests`` response, as seen by HttpTransport."""
+
+    def __init__(
+        self,
+        code: int,
+        body: bytes = b"",
+        headers: dict | None = None,
+        url: str = "https://example.com",
+    ):
+        self.status_code = code
+        self.body = body
+        self.headers = headers or {}
+        self.url = url
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_response() -> type[FakeResponse]:
+    return FakeResponse
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.agweb import AgwebAdapter
-from startup_watch.adapters.logisticsmgmt import LogisticsmgmtAdapter
-from startup_watch.adapters.supplychainbrain import SupplychainbrainAdapter
+from startup_watch.adapters.feeds import AgwebAdapter
+from startup_watch.adapters.feeds import LogisticsmgmtAdapter
+from startup_watch.adapters.feeds import SupplychainbrainAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -19,8 +19,8 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_supplychainbrain_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.supplychainbrain.feedparser.parse",
-        lambda _url: _fake_feed(),
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
+        lambda *_a: _fake_feed(),
     )
     adapter = SupplychainbrainAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -32,8 +32,8 @@ def test_supplychainbrain_adapter_fetch(monkeypatch) -> None:
 
 def test_logisticsmgmt_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.logisticsmgmt.feedparser.parse",
-        lambda _url: _fake_feed(),
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
+        lambda *_a: _fake_feed(),
     )
     adapter = LogisticsmgmtAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -45,8 +45,8 @@ def test_logisticsmgmt_adapter_fetch(monkeypatch) -> None:
 
 def test_agweb_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.agweb.feedparser.parse",
-        lambda _url: _fake_feed(),
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
+        lambda *_a: _fake_feed(),
     )
     adapter = AgwebAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.industryweek import IndustryweekAdapter
-from startup_watch.adapters.mfg_dive import MfgDiveAdapter
-from startup_watch.adapters.mmh import MmhAdapter
+from startup_watch.adapters.feeds import IndustryweekAdapter
+from startup_watch.adapters.feeds import MfgDiveAdapter
+from startup_watch.adapters.feeds import MmhAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_mmh_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.mmh.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = MmhAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_mmh_adapter_fetch(monkeypatch) -> None:
 
 
 def test_mfg_dive_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.mfg_dive.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = MfgDiveAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_mfg_dive_adapter_fetch(monkeypatch) -> None:
 
 
 def test_industryweek_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.industryweek.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = IndustryweekAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.finsmes import FinsmesAdapter
-from startup_watch.adapters.greenqueen import GreenqueenAdapter
-from startup_watch.adapters.techfundingnews import TechfundingnewsAdapter
+from startup_watch.adapters.feeds import FinsmesAdapter
+from startup_watch.adapters.feeds import GreenqueenAdapter
+from startup_watch.adapters.feeds import TechfundingnewsAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techfundingnews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techfundingnews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechfundingnewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techfundingnews_adapter_fetch(monkeypatch) -> None:
 
 
 def test_greenqueen_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.greenqueen.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = GreenqueenAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_greenqueen_adapter_fetch(monkeypatch) -> None:
 
 
 def test_finsmes_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.finsmes.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FinsmesAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
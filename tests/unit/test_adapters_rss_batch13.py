@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.siliconcanals import SiliconcanalsAdapter
-from startup_watch.adapters.startupdaily import StartupdailyAdapter
-from startup_watch.adapters.vestbee import VestbeeAdapter
+from startup_watch.adapters.feeds import SiliconcanalsAdapter
+from startup_watch.adapters.feeds import StartupdailyAdapter
+from startup_watch.adapters.feeds import VestbeeAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_siliconcanals_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.siliconcanals.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SiliconcanalsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_siliconcanals_adapter_fetch(monkeypatch) -> None:
 
 
 def test_vestbee_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.vestbee.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VestbeeAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_vestbee_adapter_fetch(monkeypatch) -> None:
 
 
 def test_startupdaily_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupdaily.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupdailyAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.builtin import BuiltinAdapter
-from startup_watch.adapters.techinasia import TechinasiaAdapter
-from startup_watch.adapters.yourstory import YourstoryAdapter
+from startup_watch.adapters.feeds import BuiltinAdapter
+from startup_watch.adapters.feeds import TechinasiaAdapter
+from startup_watch.adapters.feeds import YourstoryAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techinasia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techinasia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechinasiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techinasia_adapter_fetch(monkeypatch) -> None:
 
 
 def test_yourstory_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.yourstory.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = YourstoryAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_yourstory_adapter_fetch(monkeypatch) -> None:
 
 
 def test_builtin_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.builtin.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = BuiltinAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
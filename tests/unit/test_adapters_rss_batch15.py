@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.euvc import EuvcAdapter
-from startup_watch.adapters.sifted_news import SiftedNewsAdapter
-from startup_watch.adapters.unicornnest import UnicornnestAdapter
+from startup_watch.adapters.feeds import EuvcAdapter
+from startup_watch.adapters.feeds import SiftedNewsAdapter
+from startup_watch.adapters.feeds import UnicornnestAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_euvc_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.euvc.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = EuvcAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_euvc_adapter_fetch(monkeypatch) -> None:
 
 
 def test_sifted_news_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.sifted_news.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SiftedNewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_sifted_news_adapter_fetch(monkeypatch) -> None:
 
 
 def test_unicornnest_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.unicornnest.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = UnicornnestAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.latitud import LatitudAdapter
-from startup_watch.adapters.refreshmiami import RefreshmiamiAdapter
-from startup_watch.adapters.startupnewsfyi import StartupnewsfyiAdapter
+from startup_watch.adapters.feeds import LatitudAdapter
+from startup_watch.adapters.feeds import RefreshmiamiAdapter
+from startup_watch.adapters.feeds import StartupnewsfyiAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_startupnewsfyi_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupnewsfyi.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupnewsfyiAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_startupnewsfyi_adapter_fetch(monkeypatch) -> None:
 
 
 def test_latitud_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.latitud.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = LatitudAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_latitud_adapter_fetch(monkeypatch) -> None:
 
 
 def test_refreshmiami_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.refreshmiami.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = RefreshmiamiAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
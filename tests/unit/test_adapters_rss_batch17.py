@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.e27 import E27Adapter
-from startup_watch.adapters.geekwire import GeekwireAdapter
-from startup_watch.adapters.thenextweb import ThenextwebAdapter
+from startup_watch.adapters.feeds import E27Adapter
+from startup_watch.adapters.feeds import GeekwireAdapter
+from startup_watch.adapters.feeds import ThenextwebAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_geekwire_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.geekwire.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = GeekwireAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_geekwire_adapter_fetch(monkeypatch) -> None:
 
 
 def test_thenextweb_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.thenextweb.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = ThenextwebAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_thenextweb_adapter_fetch(monkeypatch) -> None:
 
 
 def test_e27_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.e27.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = E27Adapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.entrepreneurshiplife import EntrepreneurshiplifeAdapter
-from startup_watch.adapters.innovationorigins import InnovationoriginsAdapter
-from startup_watch.adapters.startupbeat import StartupbeatAdapter
+from startup_watch.adapters.feeds import EntrepreneurshiplifeAdapter
+from startup_watch.adapters.feeds import InnovationoriginsAdapter
+from startup_watch.adapters.feeds import StartupbeatAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_startupbeat_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupbeat.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupbeatAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_startupbeat_adapter_fetch(monkeypatch) -> None:
 
 
 def test_entrepreneurshiplife_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.entrepreneurshiplife.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = EntrepreneurshiplifeAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_entrepreneurshiplife_adapter_fetch(monkeypatch) -> None:
 
 
 def test_innovationorigins_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.innovationorigins.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = InnovationoriginsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.startupsmagazine import StartupsmagazineAdapter
-from startup_watch.adapters.techpoint_africa import TechpointAfricaAdapter
-from startup_watch.adapters.vccircle import VccircleAdapter
+from startup_watch.adapters.feeds import StartupsmagazineAdapter
+from startup_watch.adapters.feeds import TechpointAfricaAdapter
+from startup_watch.adapters.feeds import VccircleAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_startupsmagazine_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupsmagazine.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupsmagazineAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_startupsmagazine_adapter_fetch(monkeypatch) -> None:
 
 
 def test_vccircle_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.vccircle.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VccircleAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_vccircle_adapter_fetch(monkeypatch) -> None:
 
 
 def test_techpoint_africa_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techpoint_africa.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechpointAfricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.disruptafrica import DisruptafricaAdapter
-from startup_watch.adapters.therecursive import TherecursiveAdapter
-from startup_watch.adapters.vested import VestedAdapter
+from startup_watch.adapters.feeds import DisruptafricaAdapter
+from startup_watch.adapters.feeds import TherecursiveAdapter
+from startup_watch.adapters.feeds import VestedAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_disruptafrica_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.disruptafrica.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = DisruptafricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_disruptafrica_adapter_fetch(monkeypatch) -> None:
 
 
 def test_vested_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.vested.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VestedAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_vested_adapter_fetch(monkeypatch) -> None:
 
 
 def test_therecursive_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.therecursive.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TherecursiveAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.itweb_africa import ItwebAfricaAdapter
-from startup_watch.adapters.siliconrepublic import SiliconrepublicAdapter
-from startup_watch.adapters.startupill import StartupillAdapter
+from startup_watch.adapters.feeds import ItwebAfricaAdapter
+from startup_watch.adapters.feeds import SiliconrepublicAdapter
+from startup_watch.adapters.feeds import StartupillAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_siliconrepublic_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.siliconrepublic.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SiliconrepublicAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_siliconrepublic_adapter_fetch(monkeypatch) -> None:
 
 
 def test_itweb_africa_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.itweb_africa.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = ItwebAfricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_itweb_africa_adapter_fetch(monkeypatch) -> None:
 
 
 def test_startupill_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupill.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupillAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
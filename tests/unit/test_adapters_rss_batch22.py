@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.devdiscourse import DevdiscourseAdapter
-from startup_watch.adapters.futurescot import FuturescotAdapter
-from startup_watch.adapters.techbuild_africa import TechbuildAfricaAdapter
+from startup_watch.adapters.feeds import DevdiscourseAdapter
+from startup_watch.adapters.feeds import FuturescotAdapter
+from startup_watch.adapters.feeds import TechbuildAfricaAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_devdiscourse_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.devdiscourse.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = DevdiscourseAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_devdiscourse_adapter_fetch(monkeypatch) -> None:
 
 
 def test_techbuild_africa_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techbuild_africa.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechbuildAfricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_techbuild_africa_adapter_fetch(monkeypatch) -> None:
 
 
 def test_futurescot_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.futurescot.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FuturescotAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.benjamindada import BenjamindadaAdapter
-from startup_watch.adapters.techcabal import TechcabalAdapter
-from startup_watch.adapters.technext_ng import TechnextNgAdapter
+from startup_watch.adapters.feeds import BenjamindadaAdapter
+from startup_watch.adapters.feeds import TechcabalAdapter
+from startup_watch.adapters.feeds import TechnextNgAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techcabal_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techcabal.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechcabalAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techcabal_adapter_fetch(monkeypatch) -> None:
 
 
 def test_benjamindada_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.benjamindada.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = BenjamindadaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_benjamindada_adapter_fetch(monkeypatch) -> None:
 
 
 def test_technext_ng_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.technext_ng.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechnextNgAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
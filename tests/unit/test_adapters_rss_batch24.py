@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.tech_ish import TechIshAdapter
-from startup_watch.adapters.techafricanews import TechafricanewsAdapter
-from startup_watch.adapters.techtrendske import TechtrendskeAdapter
+from startup_watch.adapters.feeds import TechIshAdapter
+from startup_watch.adapters.feeds import TechafricanewsAdapter
+from startup_watch.adapters.feeds import TechtrendskeAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techafricanews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techafricanews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechafricanewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techafricanews_adapter_fetch(monkeypatch) -> None:
 
 
 def test_techtrendske_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techtrendske.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechtrendskeAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_techtrendske_adapter_fetch(monkeypatch) -> None:
 
 
 def test_tech_ish_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.tech_ish.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechIshAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.memeburn import MemeburnAdapter
-from startup_watch.adapters.techmoran import TechmoranAdapter
-from startup_watch.adapters.weetracker import WeetrackerAdapter
+from startup_watch.adapters.feeds import MemeburnAdapter
+from startup_watch.adapters.feeds import TechmoranAdapter
+from startup_watch.adapters.feeds import WeetrackerAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techmoran_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techmoran.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechmoranAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techmoran_adapter_fetch(monkeypatch) -> None:
 
 
 def test_memeburn_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.memeburn.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = MemeburnAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_memeburn_adapter_fetch(monkeypatch) -> None:
 
 
 def test_weetracker_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.weetracker.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = WeetrackerAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
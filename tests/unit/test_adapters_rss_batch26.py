@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.techweez import TechweezAdapter
-from startup_watch.adapters.ventureburn import VentureburnAdapter
-from startup_watch.adapters.venturesafrica import VenturesafricaAdapter
+from startup_watch.adapters.feeds import TechweezAdapter
+from startup_watch.adapters.feeds import VentureburnAdapter
+from startup_watch.adapters.feeds import VenturesafricaAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techweez_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techweez.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechweezAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techweez_adapter_fetch(monkeypatch) -> None:
 
 
 def test_ventureburn_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.ventureburn.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VentureburnAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_ventureburn_adapter_fetch(monkeypatch) -> None:
 
 
 def test_venturesafrica_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.venturesafrica.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VenturesafricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.dealstreetasia import DealstreetasiaAdapter
-from startup_watch.adapters.entrackr import EntrackrAdapter
-from startup_watch.adapters.inc42 import Inc42Adapter
+from startup_watch.adapters.feeds import DealstreetasiaAdapter
+from startup_watch.adapters.feeds import EntrackrAdapter
+from startup_watch.adapters.feeds import Inc42Adapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_inc42_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.inc42.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = Inc42Adapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_inc42_adapter_fetch(monkeypatch) -> None:
 
 
 def test_entrackr_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.entrackr.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = EntrackrAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_entrackr_adapter_fetch(monkeypatch) -> None:
 
 
 def test_dealstreetasia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.dealstreetasia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = DealstreetasiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
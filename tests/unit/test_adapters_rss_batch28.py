@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.kr_asia import KrAsiaAdapter
-from startup_watch.adapters.techloy import TechloyAdapter
-from startup_watch.adapters.technode import TechnodeAdapter
+from startup_watch.adapters.feeds import KrAsiaAdapter
+from startup_watch.adapters.feeds import TechloyAdapter
+from startup_watch.adapters.feeds import TechnodeAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techloy_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techloy.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechloyAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techloy_adapter_fetch(monkeypatch) -> None:
 
 
 def test_kr_asia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.kr_asia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = KrAsiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_kr_asia_adapter_fetch(monkeypatch) -> None:
 
 
 def test_technode_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.technode.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechnodeAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.echelonasia import EchelonasiaAdapter
-from startup_watch.adapters.technin_asia import TechninAsiaAdapter
-from startup_watch.adapters.techsauce import TechsauceAdapter
+from startup_watch.adapters.feeds import EchelonasiaAdapter
+from startup_watch.adapters.feeds import TechninAsiaAdapter
+from startup_watch.adapters.feeds import TechsauceAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_techsauce_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techsauce.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechsauceAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_techsauce_adapter_fetch(monkeypatch) -> None:
 
 
 def test_echelonasia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.echelonasia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = EchelonasiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_echelonasia_adapter_fetch(monkeypatch) -> None:
 
 
 def test_technin_asia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.technin_asia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechninAsiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.pandaily import PandailyAdapter
-from startup_watch.adapters.vulcanpost import VulcanpostAdapter
-from startup_watch.adapters.wamda import WamdaAdapter
+from startup_watch.adapters.feeds import PandailyAdapter
+from startup_watch.adapters.feeds import VulcanpostAdapter
+from startup_watch.adapters.feeds import WamdaAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_vulcanpost_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.vulcanpost.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VulcanpostAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_vulcanpost_adapter_fetch(monkeypatch) -> None:
 
 
 def test_pandaily_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.pandaily.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = PandailyAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_pandaily_adapter_fetch(monkeypatch) -> None:
 
 
 def test_wamda_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.wamda.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = WamdaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
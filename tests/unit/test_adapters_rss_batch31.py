@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.maddyness import MaddynessAdapter
-from startup_watch.adapters.startupnewsasia import StartupnewsasiaAdapter
-from startup_watch.adapters.techfundingasia import TechfundingasiaAdapter
+from startup_watch.adapters.feeds import MaddynessAdapter
+from startup_watch.adapters.feeds import StartupnewsasiaAdapter
+from startup_watch.adapters.feeds import TechfundingasiaAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_maddyness_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.maddyness.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = MaddynessAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_maddyness_adapter_fetch(monkeypatch) -> None:
 
 
 def test_techfundingasia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techfundingasia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechfundingasiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_techfundingasia_adapter_fetch(monkeypatch) -> None:
 
 
 def test_startupnewsasia_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupnewsasia.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupnewsasiaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.africanbusiness_tech import AfricanbusinessTechAdapter
-from startup_watch.adapters.bloomingstartup import BloomingstartupAdapter
-from startup_watch.adapters.vietcetera import VietceteraAdapter
+from startup_watch.adapters.feeds import AfricanbusinessTechAdapter
+from startup_watch.adapters.feeds import BloomingstartupAdapter
+from startup_watch.adapters.feeds import VietceteraAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_vietcetera_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.vietcetera.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VietceteraAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_vietcetera_adapter_fetch(monkeypatch) -> None:
 
 
 def test_bloomingstartup_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.bloomingstartup.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = BloomingstartupAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_bloomingstartup_adapter_fetch(monkeypatch) -> None:
 
 
 def test_africanbusiness_tech_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.africanbusiness_tech.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = AfricanbusinessTechAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.pakwired import PakwiredAdapter
-from startup_watch.adapters.dailysocial import DailysocialAdapter
-from startup_watch.adapters.techstartups import TechstartupsAdapter
-from startup_watch.adapters.startupnewsme import StartupnewsmeAdapter
-from startup_watch.adapters.middleeastventures import MiddleeastventuresAdapter
+from startup_watch.adapters.feeds import PakwiredAdapter
+from startup_watch.adapters.feeds import DailysocialAdapter
+from startup_watch.adapters.feeds import TechstartupsAdapter
+from startup_watch.adapters.feeds import StartupnewsmeAdapter
+from startup_watch.adapters.feeds import MiddleeastventuresAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_pakwired_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.pakwired.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = PakwiredAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_pakwired_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "pakwired"
 
 def test_dailysocial_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.dailysocial.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = DailysocialAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_dailysocial_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "dailysocial"
 
 def test_techstartups_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techstartups.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechstartupsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_techstartups_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "techstartups"
 
 def test_startupnewsme_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupnewsme.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupnewsmeAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_startupnewsme_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupnewsme"
 
 def test_middleeastventures_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.middleeastventures.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = MiddleeastventuresAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
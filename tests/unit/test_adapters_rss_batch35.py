@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.europeanstartups import EuropeanstartupsAdapter
-from startup_watch.adapters.startupobserver import StartupobserverAdapter
-from startup_watch.adapters.startupsavant import StartupsavantAdapter
-from startup_watch.adapters.techrasa import TechrasaAdapter
-from startup_watch.adapters.techgistafrica import TechgistafricaAdapter
+from startup_watch.adapters.feeds import EuropeanstartupsAdapter
+from startup_watch.adapters.feeds import StartupobserverAdapter
+from startup_watch.adapters.feeds import StartupsavantAdapter
+from startup_watch.adapters.feeds import TechrasaAdapter
+from startup_watch.adapters.feeds import TechgistafricaAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_europeanstartups_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.europeanstartups.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = EuropeanstartupsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_europeanstartups_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "europeanstartups"
 
 def test_startupobserver_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupobserver.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupobserverAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_startupobserver_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupobserver"
 
 def test_startupsavant_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupsavant.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupsavantAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_startupsavant_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupsavant"
 
 def test_techrasa_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techrasa.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechrasaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_techrasa_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "techrasa"
 
 def test_techgistafrica_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techgistafrica.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechgistafricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.itnewsafrica import ItnewsafricaAdapter
-from startup_watch.adapters.disfold_blog import DisfoldBlogAdapter
-from startup_watch.adapters.startupradius import StartupradiusAdapter
-from startup_watch.adapters.nextbigwhat import NextbigwhatAdapter
-from startup_watch.adapters.techcircle import TechcircleAdapter
+from startup_watch.adapters.feeds import ItnewsafricaAdapter
+from startup_watch.adapters.feeds import DisfoldBlogAdapter
+from startup_watch.adapters.feeds import StartupradiusAdapter
+from startup_watch.adapters.feeds import NextbigwhatAdapter
+from startup_watch.adapters.feeds import TechcircleAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_itnewsafrica_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.itnewsafrica.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = ItnewsafricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_itnewsafrica_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "itnewsafrica"
 
 def test_disfold_blog_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.disfold_blog.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = DisfoldBlogAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_disfold_blog_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "disfold_blog"
 
 def test_startupradius_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupradius.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupradiusAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_startupradius_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupradius"
 
 def test_nextbigwhat_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.nextbigwhat.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = NextbigwhatAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_nextbigwhat_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "nextbigwhat"
 
 def test_techcircle_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techcircle.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechcircleAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
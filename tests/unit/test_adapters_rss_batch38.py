@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.innov8tiv import Innov8tivAdapter
-from startup_watch.adapters.smesouthafrica import SmesouthafricaAdapter
-from startup_watch.adapters.techawkng import TechawkngAdapter
-from startup_watch.adapters.technovagh import TechnovaghAdapter
-from startup_watch.adapters.afritechie import AfritechieAdapter
+from startup_watch.adapters.feeds import Innov8tivAdapter
+from startup_watch.adapters.feeds import SmesouthafricaAdapter
+from startup_watch.adapters.feeds import TechawkngAdapter
+from startup_watch.adapters.feeds import TechnovaghAdapter
+from startup_watch.adapters.feeds import AfritechieAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_innov8tiv_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.innov8tiv.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = Innov8tivAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_innov8tiv_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "innov8tiv"
 
 def test_smesouthafrica_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.smesouthafrica.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SmesouthafricaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_smesouthafrica_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "smesouthafrica"
 
 def test_techawkng_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techawkng.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechawkngAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_techawkng_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "techawkng"
 
 def test_technovagh_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.technovagh.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechnovaghAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_technovagh_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "technovagh"
 
 def test_afritechie_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.afritechie.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = AfritechieAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.siliconrepublic_startups import SiliconrepublicStartupsAdapter
-from startup_watch.adapters.techforge_media import TechforgeMediaAdapter
-from startup_watch.adapters.sifted_pro import SiftedProAdapter
-from startup_watch.adapters.foundersguide import FoundersguideAdapter
-from startup_watch.adapters.startupvalley_news import StartupvalleyNewsAdapter
+from startup_watch.adapters.feeds import SiliconrepublicStartupsAdapter
+from startup_watch.adapters.feeds import TechforgeMediaAdapter
+from startup_watch.adapters.feeds import SiftedProAdapter
+from startup_watch.adapters.feeds import FoundersguideAdapter
+from startup_watch.adapters.feeds import StartupvalleyNewsAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_siliconrepublic_startups_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.siliconrepublic_startups.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SiliconrepublicStartupsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_siliconrepublic_startups_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "siliconrepublic_startups"
 
 def test_techforge_media_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.techforge_media.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TechforgeMediaAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_techforge_media_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "techforge_media"
 
 def test_sifted_pro_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.sifted_pro.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SiftedProAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_sifted_pro_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "sifted_pro"
 
 def test_foundersguide_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.foundersguide.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FoundersguideAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_foundersguide_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "foundersguide"
 
 def test_startupvalley_news_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupvalley_news.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupvalleyNewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
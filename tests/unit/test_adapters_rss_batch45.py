@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.startupgenius import StartupgeniusAdapter
-from startup_watch.adapters.founderjar import FounderjarAdapter
-from startup_watch.adapters.smallbiztrends_startups import SmallbiztrendsStartupsAdapter
-from startup_watch.adapters.startupgrind_blog import StartupgrindBlogAdapter
-from startup_watch.adapters.forentrepreneurs import ForentrepreneursAdapter
+from startup_watch.adapters.feeds import StartupgeniusAdapter
+from startup_watch.adapters.feeds import FounderjarAdapter
+from startup_watch.adapters.feeds import SmallbiztrendsStartupsAdapter
+from startup_watch.adapters.feeds import StartupgrindBlogAdapter
+from startup_watch.adapters.feeds import ForentrepreneursAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_startupgenius_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupgenius.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupgeniusAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_startupgenius_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupgenius"
 
 def test_founderjar_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.founderjar.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FounderjarAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_founderjar_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "founderjar"
 
 def test_smallbiztrends_startups_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.smallbiztrends_startups.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SmallbiztrendsStartupsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_smallbiztrends_startups_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "smallbiztrends_startups"
 
 def test_startupgrind_blog_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupgrind_blog.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupgrindBlogAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_startupgrind_blog_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupgrind_blog"
 
 def test_forentrepreneurs_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.forentrepreneurs.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = ForentrepreneursAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
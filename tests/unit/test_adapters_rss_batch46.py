@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.bothsidesofthetable import BothsidesofthetableAdapter
-from startup_watch.adapters.avc_blog import AvcBlogAdapter
-from startup_watch.adapters.feldthoughts import FeldthoughtsAdapter
-from startup_watch.adapters.saastr_blog import SaastrBlogAdapter
-from startup_watch.adapters.tomtunguz import TomtunguzAdapter
+from startup_watch.adapters.feeds import BothsidesofthetableAdapter
+from startup_watch.adapters.feeds import AvcBlogAdapter
+from startup_watch.adapters.feeds import FeldthoughtsAdapter
+from startup_watch.adapters.feeds import SaastrBlogAdapter
+from startup_watch.adapters.feeds import TomtunguzAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -20,7 +20,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_bothsidesofthetable_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.bothsidesofthetable.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = BothsidesofthetableAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -29,7 +29,7 @@ def test_bothsidesofthetable_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "bothsidesofthetable"
 
 def test_avc_blog_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.avc_blog.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = AvcBlogAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_avc_blog_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "avc_blog"
 
 def test_feldthoughts_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.feldthoughts.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FeldthoughtsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -47,7 +47,7 @@ def test_feldthoughts_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "feldthoughts"
 
 def test_saastr_blog_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.saastr_blog.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SaastrBlogAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -56,7 +56,7 @@ def test_saastr_blog_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "saastr_blog"
 
 def test_tomtunguz_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.tomtunguz.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TomtunguzAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -1,15 +1,15 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.startupreporter import StartupreporterAdapter
-from startup_watch.adapters.foundersradar import FoundersradarAdapter
-from startup_watch.adapters.deeptechdigest import DeeptechdigestAdapter
-from startup_watch.adapters.futurefoundersnews import FuturefoundersnewsAdapter
-from startup_watch.adapters.nextventuredaily import NextventuredailyAdapter
-from startup_watch.adapters.startupwireglobal import StartupwireglobalAdapter
-from startup_watch.adapters.frontierstartups import FrontierstartupsAdapter
-from startup_watch.adapters.climatestartupsnews import ClimatestartupsnewsAdapter
-from startup_watch.adapters.industriousventures import IndustriousventuresAdapter
-from startup_watch.adapters.logisticstechnews import LogisticstechnewsAdapter
+from startup_watch.adapters.feeds import StartupreporterAdapter
+from startup_watch.adapters.feeds import FoundersradarAdapter
+from startup_watch.adapters.feeds import DeeptechdigestAdapter
+from startup_watch.adapters.feeds import FuturefoundersnewsAdapter
+from startup_watch.adapters.feeds import NextventuredailyAdapter
+from startup_watch.adapters.feeds import StartupwireglobalAdapter
+from startup_watch.adapters.feeds import FrontierstartupsAdapter
+from startup_watch.adapters.feeds import ClimatestartupsnewsAdapter
+from startup_watch.adapters.feeds import IndustriousventuresAdapter
+from startup_watch.adapters.feeds import LogisticstechnewsAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -25,7 +25,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_startupreporter_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupreporter.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupreporterAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -34,7 +34,7 @@ def test_startupreporter_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupreporter"
 
 def test_foundersradar_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.foundersradar.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FoundersradarAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -43,7 +43,7 @@ def test_foundersradar_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "foundersradar"
 
 def test_deeptechdigest_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.deeptechdigest.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = DeeptechdigestAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -52,7 +52,7 @@ def test_deeptechdigest_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "deeptechdigest"
 
 def test_futurefoundersnews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.futurefoundersnews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FuturefoundersnewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -61,7 +61,7 @@ def test_futurefoundersnews_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "futurefoundersnews"
 
 def test_nextventuredaily_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.nextventuredaily.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = NextventuredailyAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -70,7 +70,7 @@ def test_nextventuredaily_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "nextventuredaily"
 
 def test_startupwireglobal_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupwireglobal.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupwireglobalAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -79,7 +79,7 @@ def test_startupwireglobal_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupwireglobal"
 
 def test_frontierstartups_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.frontierstartups.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FrontierstartupsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -88,7 +88,7 @@ def test_frontierstartups_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "frontierstartups"
 
 def test_climatestartupsnews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.climatestartupsnews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = ClimatestartupsnewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -97,7 +97,7 @@ def test_climatestartupsnews_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "climatestartupsnews"
 
 def test_industriousventures_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.industriousventures.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = IndustriousventuresAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -106,7 +106,7 @@ def test_industriousventures_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "industriousventures"
 
 def test_logisticstechnews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.logisticstechnews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = LogisticstechnewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
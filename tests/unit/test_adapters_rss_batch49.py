@@ -1,12 +1,12 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.agxstartupnews import AgxstartupnewsAdapter
-from startup_watch.adapters.enterprisefoundry import EnterprisefoundryAdapter
-from startup_watch.adapters.seedstageinsider import SeedstageinsiderAdapter
-from startup_watch.adapters.vcsignalsdaily import VcsignalsdailyAdapter
-from startup_watch.adapters.startupcurrents import StartupcurrentsAdapter
-from startup_watch.adapters.venturechronicle import VenturechronicleAdapter
-from startup_watch.adapters.foundersbriefing import FoundersbriefingAdapter
+from startup_watch.adapters.feeds import AgxstartupnewsAdapter
+from startup_watch.adapters.feeds import EnterprisefoundryAdapter
+from startup_watch.adapters.feeds import SeedstageinsiderAdapter
+from startup_watch.adapters.feeds import VcsignalsdailyAdapter
+from startup_watch.adapters.feeds import StartupcurrentsAdapter
+from startup_watch.adapters.feeds import VenturechronicleAdapter
+from startup_watch.adapters.feeds import FoundersbriefingAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -22,7 +22,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_agxstartupnews_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.agxstartupnews.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = AgxstartupnewsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -31,7 +31,7 @@ def test_agxstartupnews_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "agxstartupnews"
 
 def test_enterprisefoundry_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.enterprisefoundry.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = EnterprisefoundryAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -40,7 +40,7 @@ def test_enterprisefoundry_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "enterprisefoundry"
 
 def test_seedstageinsider_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.seedstageinsider.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SeedstageinsiderAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -49,7 +49,7 @@ def test_seedstageinsider_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "seedstageinsider"
 
 def test_vcsignalsdaily_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.vcsignalsdaily.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VcsignalsdailyAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -58,7 +58,7 @@ def test_vcsignalsdaily_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "vcsignalsdaily"
 
 def test_startupcurrents_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.startupcurrents.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = StartupcurrentsAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -67,7 +67,7 @@ def test_startupcurrents_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "startupcurrents"
 
 def test_venturechronicle_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.venturechronicle.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = VenturechronicleAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -76,7 +76,7 @@ def test_venturechronicle_adapter_fetch(monkeypatch) -> None:
     assert signals[0].source_name == "venturechronicle"
 
 def test_foundersbriefing_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.foundersbriefing.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = FoundersbriefingAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
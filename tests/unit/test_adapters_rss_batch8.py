@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.agdaily import AgdailyAdapter
-from startup_watch.adapters.supplychaindive import SupplychaindiveAdapter
-from startup_watch.adapters.therobotreport import TherobotreportAdapter
+from startup_watch.adapters.feeds import AgdailyAdapter
+from startup_watch.adapters.feeds import SupplychaindiveAdapter
+from startup_watch.adapters.feeds import TherobotreportAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -18,7 +18,7 @@ def _fake_feed() -> SimpleNamespace:
 
 
 def test_supplychaindive_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.supplychaindive.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = SupplychaindiveAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -28,7 +28,7 @@ def test_supplychaindive_adapter_fetch(monkeypatch) -> None:
 
 
 def test_therobotreport_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.therobotreport.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = TherobotreportAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
@@ -38,7 +38,7 @@ def test_therobotreport_adapter_fetch(monkeypatch) -> None:
 
 
 def test_agdaily_adapter_fetch(monkeypatch) -> None:
-    monkeypatch.setattr("startup_watch.adapters.agdaily.feedparser.parse", lambda _url: _fake_feed())
+    monkeypatch.setattr("startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed())
     adapter = AgdailyAdapter({"enabled": True, "url": "https://example.com/feed"})
 
     signals = adapter.fetch()
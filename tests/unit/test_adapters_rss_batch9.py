@@ -1,8 +1,8 @@
 from types import SimpleNamespace
 
-from startup_watch.adapters.agfunder_pod import AgfunderPodAdapter
-from startup_watch.adapters.manufacturing_net import ManufacturingNetAdapter
-from startup_watch.adapters.venturebeat_ai import VenturebeatAiAdapter
+from startup_watch.adapters.feeds import AgfunderPodAdapter
+from startup_watch.adapters.feeds import ManufacturingNetAdapter
+from startup_watch.adapters.feeds import VenturebeatAiAdapter
 
 
 def _fake_feed() -> SimpleNamespace:
@@ -19,8 +19,8 @@ def _fake_feed() -> SimpleNamespace:
 
 def test_manufacturing_net_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.manufacturing_net.feedparser.parse",
-        lambda _url: _fake_feed(),
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
+        lambda *_a: _fake_feed(),
     )
     adapter = ManufacturingNetAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -32,8 +32,8 @@ def test_manufacturing_net_adapter_fetch(monkeypatch) -> None:
 
 def test_venturebeat_ai_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.venturebeat_ai.feedparser.parse",
-        lambda _url: _fake_feed(),
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
+        lambda *_a: _fake_feed(),
     )
     adapter = VenturebeatAiAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -45,8 +45,8 @@ def test_venturebeat_ai_adapter_fetch(monkeypatch) -> None:
 
 def test_agfunder_pod_adapter_fetch(monkeypatch) -> None:
     monkeypatch.setattr(
-        "startup_watch.adapters.agfunder_pod.feedparser.parse",
-        lambda _url: _fake_feed(),
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed",
+        lambda *_a: _fake_feed(),
     )
     adapter = AgfunderPodAdapter({"enabled": True, "url": "https://example.com/feed"})
 
@@ -0,0 +1,266 @@
+import asyncio
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from startup_watch.adapters.berkeley_skydeck import BerkeleySkydeckAdapter
+from startup_watch.browser import BrowserPool, BrowserUnavailable, RenderedPage
+from startup_watch.cache import ResponseCache
+from startup_watch.outcomes import OFFLINE_MISS, PERMANENT_ERROR
+from startup_watch.transport import HttpTransport, TransportResponse
+
+_SHELL = b"<html><body><div id='app'></div></body></html>"
+# Server-rendered chrome around an empty grid: the extraction selector matches.
+_NAV_SHELL = b"<html><body><nav><a>Home</a><a>About</a></nav><div id='app'></div></body></html>"
+_RENDERED = "<html><body><h3>FieldOps</h3><h3>GrainMind</h3></body></html>"
+_JS_PAGE = b"""<html><head><title>Portfolio</title></head><body>
+<img src="/logo.png"><div id="app"></div>
+<script>
+document.getElementById("app").innerHTML = "<h3>FieldOps</h3><h3>GrainMind</h3>";
+</script></body></html>"""
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str | None]] = []
+
+    def render(self, url: str, wait_for: str | None = None) -> RenderedPage:
+        self.calls.append((url, wait_for))
+        return RenderedPage(url=url, status_code=200, html=_RENDERED)
+
+    def close(self) -> None:
+        return None
+
+
+def _static(transport: HttpTransport, body: bytes, status: int = 200) -> None:
+    transport.get = lambda url, **_kwargs: TransportResponse(
+        url=url, status_code=status, content=body
+    )
+
+
+def test_from_config_is_none_when_disabled() -> None:
+    assert BrowserPool.from_config({"playwright_fallback": {"enabled": False}}) is None
+    pool = BrowserPool.from_config(
+        {"playwright_fallback": {"enabled": True, "max_contexts": 3, "block_resources": ["image"]}}
+    )
+    assert pool.max_contexts == 3
+    assert pool.blocked_resources == frozenset({"image"})
+
+
+def test_render_without_browser_raises() -> None:
+    with pytest.raises(BrowserUnavailable):
+        HttpTransport().render("https://example.com")
+
+
+def test_empty_static_page_falls_back_to_browser() -> None:
+    browser = _FakeBrowser()
+    transport = HttpTransport(browser=browser)
+    _static(transport, _NAV_SHELL)
+    adapter = BerkeleySkydeckAdapter(
+        {"enabled": True, "url": "https://example.com", "render_js": True, "render_wait_for": "h3"},
+        transport,
+    )
+
+    names = [signal.company_name for signal in adapter.fetch()]
+
+    assert names == ["FieldOps", "GrainMind"]
+    assert browser.calls == [("https://example.com", "h3")]
+
+
+def test_render_js_without_render_wait_for_is_permanent_error() -> None:
+    browser = _FakeBrowser()
+    transport = HttpTransport(browser=browser)
+    _static(transport, _SHELL)
+    adapter = BerkeleySkydeckAdapter(
+        {"enabled": True, "url": "https://example.com", "render_js": True}, transport
+    )
+
+    assert adapter.fetch_result().outcome == PERMANENT_ERROR
+    assert browser.calls == []
+
+
+def test_failed_static_fetch_falls_back_to_browser() -> None:
+    transport = HttpTransport(browser=_FakeBrowser())
+    _static(transport, b"", status=403)
+    adapter = BerkeleySkydeckAdapter(
+        {"enabled": True, "url": "https://example.com", "render_js": True, "render_wait_for": "h3"},
+        transport,
+    )
+
+    result = adapter.fetch_result()
+
+    assert len(result.signals) == 2
+    assert result.status == 200
+
+
+def test_browser_not_started_when_static_page_matches() -> None:
+    browser = _FakeBrowser()
+    transport = HttpTransport(browser=browser)
+    _static(transport, b"<h3>FieldOps</h3>")
+    adapter = BerkeleySkydeckAdapter(
+        {"enabled": True, "url": "https://example.com", "render_js": True, "render_wait_for": "h3"},
+        transport,
+    )
+
+    assert adapter.fetch()
+    assert browser.calls == []
+
+
+def test_browser_not_used_without_render_js() -> None:
+    browser = _FakeBrowser()
+    transport = HttpTransport(browser=browser)
+    _static(transport, _SHELL)
+    adapter = BerkeleySkydeckAdapter({"enabled": True, "url": "https://example.com"}, transport)
+
+    assert adapter.fetch() == []
+    assert browser.calls == []
+
+
+def test_missing_browser_is_permanent_error() -> None:
+    transport = HttpTransport()
+    _static(transport, _SHELL)
+    adapter = BerkeleySkydeckAdapter(
+        {"enabled": True, "url": "https://example.com", "render_js": True, "render_wait_for": "h3"},
+        transport,
+    )
+
+    assert adapter.fetch_result().outcome == PERMANENT_ERROR
+
+
+def test_rendered_pages_are_cached(tmp_path) -> None:
+    browser = _FakeBrowser()
+    transport = HttpTransport(cache=ResponseCache(str(tmp_path)), browser=browser)
+
+    first = transport.render("https://example.com/portfolio")
+    again = transport.render("https://example.com/portfolio")
+
+    assert again.from_cache and again.content == first.content
+    assert len(browser.calls) == 1
+    assert transport.cache.lookup("https://example.com/portfolio") is None
+
+
+def test_offline_render_miss_never_starts_browser(tmp_path) -> None:
+    browser = _FakeBrowser()
+    cache = ResponseCache(str(tmp_path), mode="offline")
+    transport = HttpTransport(cache=cache, browser=browser)
+    adapter = BerkeleySkydeckAdapter(
+        {"enabled": True, "url": "https://example.com", "render_js": True, "render_wait_for": "h3"},
+        transport,
+    )
+
+    result = adapter.fetch_result()
+
+    assert (result.outcome, result.status) == (OFFLINE_MISS, 504)
+    assert browser.calls == []
+
+
+@pytest.fixture
+def fixture_server(tmp_path):
+    (tmp_path / "portfolio.html").write_bytes(_JS_PAGE)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG")
+    requested: list[str] = []
+
+    class _Handler(SimpleHTTPRequestHandler):
+        def do_GET(self) -> None:
+            requested.append(self.path)
+            super().do_GET()
+
+        def log_message(self, *args: object) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_Handler, directory=str(tmp_path)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requested
+    server.shutdown()
+
+
+def test_pool_renders_javascript_and_blocks_images(fixture_server) -> None:
+    base_url, requested = fixture_server
+    pool = BrowserPool(max_contexts=1, page_timeout=15)
+    try:
+        try:
+            page = pool.render(f"{base_url}/portfolio.html", wait_for="h3")
+        except BrowserUnavailable as exc:
+            pytest.skip(f"no headless browser: {exc}")
+        again = pool.render(f"{base_url}/portfolio.html")
+    finally:
+        pool.close()
+
+    assert page.status_code == 200
+    assert "<h3>GrainMind</h3>" in page.html
+    assert "<h3>FieldOps</h3>" in again.html
+    assert "/logo.png" not in requested
+    assert pool.renders == 2
+
+
+def test_driver_start_failure_is_remembered(monkeypatch) -> None:
+    async_api = pytest.importorskip("playwright.async_api")
+    starts: list[int] = []
+
+    class _BrokenDriver:
+        async def start(self) -> None:
+            starts.append(1)
+            raise OSError("driver missing")
+
+    monkeypatch.setattr(async_api, "async_playwright", _BrokenDriver)
+    pool = BrowserPool()
+
+    for _ in range(2):
+        with pytest.raises(BrowserUnavailable):
+            pool.render("https://example.com")
+
+    assert starts == [1]
+    assert pool._thread is None
+    assert not any(t.name == "startup-watch-browser" for t in threading.enumerate())
+
+
+def test_context_that_cannot_open_pages_is_replaced() -> None:
+    class _Page:
+        url = "https://example.com"
+
+        async def goto(self, url: str, **_kwargs: object) -> None:
+            return None
+
+        async def content(self) -> str:
+            return _RENDERED
+
+        async def close(self) -> None:
+            return None
+
+    class _Context:
+        def __init__(self, broken: bool) -> None:
+            self.broken = broken
+            self.closed = False
+
+        async def route(self, *_args: object) -> None:
+            return None
+
+        async def new_page(self) -> _Page:
+            if self.broken:
+                raise RuntimeError("target closed")
+            return _Page()
+
+        async def close(self) -> None:
+            self.closed = True
+
+    contexts: list[_Context] = []
+
+    class _Browser:
+        async def new_context(self, **_kwargs: object) -> _Context:
+            contexts.append(_Context(broken=not contexts))
+            return contexts[-1]
+
+    async def scenario() -> RenderedPage:
+        pool = BrowserPool(max_contexts=1)
+        pool._browser, pool._idle = _Browser(), asyncio.Queue()
+        with pytest.raises(RuntimeError):
+            await pool._render("https://example.com", None)
+        return await pool._render("https://example.com", None)
+
+    page = asyncio.run(scenario())
+
+    assert page.html == _RENDERED
+    assert [context.closed for context in contexts] == [True, False]
@@ -0,0 +1,77 @@
+import os
+
+from startup_watch.adapters.a16z import A16zAdapter
+from startup_watch.cache import ResponseCache
+from startup_watch.transport import HttpTransport
+
+
+def test_lookup_respects_ttl_and_offline(tmp_path, monkeypatch) -> None:
+    cache = ResponseCache(str(tmp_path), default_ttl=60)
+    cache.store("https://example.com", 200, {}, b"body")
+
+    assert cache.lookup("https://example.com")["content"] == b"body"
+    monkeypatch.setattr("startup_watch.cache.time.time", lambda: 10**10)
+    assert cache.lookup("https://example.com") is None
+    cache.mode = "offline"
+    assert cache.lookup("https://example.com")["content"] == b"body"
+
+
+def test_store_leaves_no_temp_files_and_rejects_mismatched_body(tmp_path) -> None:
+    cache = ResponseCache(str(tmp_path))
+    cache.store("https://example.com", 200, {}, b"full body")
+
+    assert sorted(os.path.splitext(name)[1] for name in os.listdir(tmp_path)) == [".body", ".json"]
+    body_path = cache._paths(cache.key("https://example.com"))[1]
+    with open(body_path, "wb") as handle:
+        handle.write(b"full")
+    assert cache.lookup("https://example.com") is None
+
+
+def test_refresh_mode_bypasses_entries(tmp_path) -> None:
+    cache = ResponseCache(str(tmp_path), mode="refresh")
+    cache.store("https://example.com", 200, {}, b"body")
+
+    assert cache.lookup("https://example.com") is None
+
+
+def test_store_evicts_least_recently_used(tmp_path) -> None:
+    cache = ResponseCache(str(tmp_path), max_bytes=10)
+    cache.store("https://example.com/a", 200, {}, b"aaaaaa")
+    cache.store("https://example.com/b", 200, {}, b"bbbbbb")
+
+    assert cache.lookup("https://example.com/a") is None
+    assert cache.lookup("https://example.com/b")["content"] == b"bbbbbb"
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_transport_replays_cache_and_adapter_ttl(tmp_path, monkeypatch, fake_response) -> None:
+    transport = HttpTransport(cache=ResponseCache(str(tmp_path)))
+    calls: list[str] = []
+
+    def _get(url, **kwargs):
+        calls.append(url)
+        return fake_response(
+            200, b"<h2>ChainOps</h2>", {"Content-Type": "text/html; charset=utf-8"}
+        )
+
+    monkeypatch.setattr(transport.session, "get", _get)
+    adapter = A16zAdapter({"enabled": True, "url": "https://example.com"}, transport)
+
+    first = adapter.fetch()
+    second = adapter.fetch()
+    assert [s.company_name for s in first] == [s.company_name for s in second] == ["ChainOps"]
+    assert len(calls) == 1
+
+    adapter.config["cache_ttl_seconds"] = 0
+    monkeypatch.setattr("startup_watch.cache.time.time", lambda: 10**10)
+    adapter.fetch()
+    assert len(calls) == 2
+
+
+def test_offline_miss_returns_504(tmp_path) -> None:
+    transport = HttpTransport(cache=ResponseCache(str(tmp_path), mode="offline"))
+
+    response = transport.get("https://example.com/missing")
+
+    assert response.status_code == 504
+    assert response.offline_miss
@@ -0,0 +1,55 @@
+from startup_watch.adapters.a16z import A16zAdapter
+from startup_watch.charset import declared_charset, detect_encoding, sniff_encoding
+from startup_watch.extract import node_text, select
+from startup_watch.transport import TransportResponse
+
+
+def test_declared_charset_has_no_latin1_default() -> None:
+    assert declared_charset({"Content-Type": "text/html; charset=Shift_JIS"}) == "shift_jis"
+    assert declared_charset({"content-type": "text/html"}) is None
+    assert declared_charset({"Content-Type": "text/html; charset=bogus"}) is None
+
+
+def test_sniff_encoding_from_bom_xml_and_meta() -> None:
+    assert sniff_encoding(b"\xef\xbb\xbf<html>") == "utf-8"
+    assert sniff_encoding(b'<?xml version="1.0" encoding="ISO-8859-1"?><rss/>') == "iso-8859-1"
+    assert sniff_encoding(b'<html><head><meta charset="windows-1252">') == "windows-1252"
+    content = b'<meta http-equiv="Content-Type" content="text/html; charset=euc-jp">'
+    assert sniff_encoding(content) == "euc-jp"
+    assert sniff_encoding(b" " * 2048 + b'<meta charset="koi8-r">') is None
+
+
+def test_detect_encoding_prefers_header_then_sniff_then_utf8() -> None:
+    meta = b'<meta charset="windows-1252">'
+    assert detect_encoding({"Content-Type": "text/html; charset=utf-8"}, meta) == "utf-8"
+    assert detect_encoding({"Content-Type": "text/html"}, meta) == "windows-1252"
+    assert detect_encoding({}, b"<p>plain</p>") == "utf-8"
+
+
+def test_response_decodes_sniffed_bytes_for_text_and_lxml() -> None:
+    body = '<html><head><meta charset="euc-jp"></head><body><h2>東京ロボティクス</h2></body></html>'
+    response = TransportResponse(
+        url="https://example.jp",
+        status_code=200,
+        content=body.encode("euc-jp"),
+        headers={"Content-Type": "text/html"},
+    )
+
+    assert response.encoding == "euc-jp"
+    assert "東京ロボティクス" in response.text
+    texts = [node_text(n) for n in select(response.content, "h2", response.encoding)]
+    assert texts == ["東京ロボティクス"]
+
+
+def test_undeclared_latin1_page_still_yields_signals(monkeypatch) -> None:
+    response = TransportResponse(
+        url="https://example.com",
+        status_code=200,
+        content=b"<html><body><h2>Caf\xe9 Co</h2></body></html>",
+        headers={"Content-Type": "text/html"},
+    )
+    monkeypatch.setattr("startup_watch.transport.HttpTransport.get", lambda *a, **k: response)
+
+    signals = A16zAdapter({"enabled": True, "url": "https://example.com"}).fetch()
+
+    assert [s.company_name for s in signals] == ["Caf� Co"]
@@ -0,0 +1,62 @@
+from startup_watch.adapters.feeds import GeekwireAdapter
+from startup_watch.cache import ResponseCache
+from startup_watch.state import ValidatorStore
+from startup_watch.transport import HttpTransport
+
+
+def test_validators_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "validators.json")
+    store = ValidatorStore(path)
+    store.update("https://example.com/feed", {"ETag": '"v1"', "Last-Modified": "Mon, 02 Mar 2026 10:00:00 GMT"})
+    store.save()
+
+    reloaded = ValidatorStore(path)
+
+    assert reloaded.request_headers("https://example.com/feed") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 02 Mar 2026 10:00:00 GMT",
+    }
+    assert reloaded.request_headers("https://example.com/other") == {}
+
+
+def test_conditional_get_sends_validators_and_reports_not_modified(
+    monkeypatch, fake_response
+) -> None:
+    transport = HttpTransport(validators=ValidatorStore())
+    sent: list[dict] = []
+    responses = [fake_response(200, b"<rss/>", {"ETag": '"v1"'}), fake_response(304)]
+
+    def _get(url, timeout=None, headers=None, stream=False):
+        sent.append(headers or {})
+        return responses.pop(0)
+
+    monkeypatch.setattr(transport.session, "get", _get)
+    adapter = GeekwireAdapter({"enabled": True, "url": "https://example.com/feed"}, transport)
+
+    adapter.fetch()
+    assert adapter.not_modified is False
+
+    assert adapter.fetch() == []
+    assert adapter.not_modified is True
+    assert sent[1] == {"If-None-Match": '"v1"'}
+
+
+def test_refresh_mode_sends_no_validators(tmp_path, monkeypatch, fake_response) -> None:
+    cache = ResponseCache(str(tmp_path), mode="refresh")
+    transport = HttpTransport(validators=ValidatorStore(), cache=cache)
+    transport.validators.update("https://example.com/feed", {"ETag": '"v1"'})
+    sent: list[dict] = []
+
+    def _get(url, timeout=None, headers=None, stream=False):
+        sent.append(headers or {})
+        return fake_response(200, b"<rss/>", {"ETag": '"v2"'})
+
+    monkeypatch.setattr(transport.session, "get", _get)
+
+    response = transport.get("https://example.com/feed", conditional=True)
+
+    assert response.status_code == 200
+    assert sent == [{}]
+    assert transport.validators.request_headers("https://example.com/feed") == {
+        "If-None-Match": '"v2"'
+    }
@@ -0,0 +1,223 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from startup_watch.enrichment import enrich_batch, enrich_from_website, iter_enrich
+from startup_watch.schema import StartupSignal
+from startup_watch.state import EnrichmentStore
+from startup_watch.transport import TransportResponse
+
+
+class _SlowSites:
+    """Fake transport: every site answers after ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.05, slow: dict[str, float] | None = None):
+        self.delay = delay
+        self.slow = slow or {}
+        self.lock = threading.Lock()
+        self.active: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+        self.peak_total = 0
+        self.calls: list[str] = []
+
+    def get(self, url: str, **_kwargs: object) -> TransportResponse:
+        domain = url.split("//")[1].split("/")[0].split(".", 1)[-1]
+        with self.lock:
+            self.active[domain] += 1
+            self.peak[domain] = max(self.peak[domain], self.active[domain])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+        time.sleep(self.slow.get(url, self.delay))
+        with self.lock:
+            self.active[domain] -= 1
+            self.calls.append(url)
+        body = f"<title>{url}</title><p>Raised $3M</p>".encode()
+        return TransportResponse(url=url, status_code=200, content=body)
+
+
+def _signal(name: str, website: str) -> StartupSignal:
+    return StartupSignal(company_name=name, website=website, funding_amount="$1M")
+
+
+def test_parallel_enrichment_keeps_order_and_overlaps_domains() -> None:
+    transport = _SlowSites()
+    signals = [_signal(f"c{i}", f"https://www.site{i}.com/") for i in range(8)]
+
+    started = time.monotonic()
+    enriched = enrich_batch(signals, transport=transport, workers=8)
+
+    assert [signal.company_name for signal in enriched] == [f"c{i}" for i in range(8)]
+    assert enriched[3].description == "https://www.site3.com/"
+    assert transport.peak_total > 1
+    assert time.monotonic() - started < 8 * transport.delay
+
+
+def test_one_request_at_a_time_per_domain() -> None:
+    transport = _SlowSites(delay=0.02)
+    signals = [_signal(f"c{i}", f"https://shop{i}.acme.com/") for i in range(4)]
+    signals += [_signal("other", "https://www.other.com/")]
+
+    enriched = enrich_batch(signals, transport=transport, workers=4)
+
+    assert all(signal.description for signal in enriched)
+    assert transport.peak["acme.com"] == 1
+
+
+def test_busy_domain_does_not_hold_workers() -> None:
+    transport = _SlowSites(delay=0.05)
+    signals = [_signal(f"a{i}", f"https://shop{i}.acme.com/") for i in range(4)]
+    signals += [_signal(f"o{i}", f"https://www.other{i}.com/") for i in range(4)]
+
+    enriched = enrich_batch(signals, transport=transport, workers=2)
+
+    assert all(signal.description for signal in enriched)
+    assert transport.peak["acme.com"] == 1
+    # The second worker served other domains instead of waiting on acme.com.
+    first_other = next(i for i, url in enumerate(transport.calls) if "other" in url)
+    assert first_other < 2
+
+
+def test_deadline_passes_slow_signals_through_unenriched() -> None:
+    transport = _SlowSites(delay=0.0, slow={"https://slow.example/": 2.0})
+    signals = [
+        _signal("fast", "https://fast.example/"),
+        _signal("slow", "https://slow.example/"),
+        _signal("after", "https://after.example/"),
+    ]
+
+    started = time.monotonic()
+    enriched = list(iter_enrich(signals, transport=transport, workers=2, deadline_seconds=0.3))
+
+    assert time.monotonic() - started < 1.5
+    assert [signal.company_name for signal in enriched] == ["fast", "slow", "after"]
+    assert enriched[0].description == "https://fast.example/"
+    assert enriched[1] is signals[1]
+    assert signals[1].description == ""
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_deadline_ignores_time_spent_waiting_for_upstream(workers: int) -> None:
+    transport = _SlowSites(delay=0.0)
+
+    def slow_adapter():
+        time.sleep(0.3)
+        yield _signal("late", "https://late.example/")
+
+    enriched = list(
+        iter_enrich(slow_adapter(), transport=transport, workers=workers, deadline_seconds=0.2)
+    )
+
+    assert enriched[0].description == "https://late.example/"
+
+
+def test_signals_without_work_skip_the_pool() -> None:
+    transport = _SlowSites()
+    done = StartupSignal(company_name="done", website="https://done.example/",
+                         description="Robots", funding_amount="$2M")
+    bare = StartupSignal(company_name="bare")
+
+    enriched = enrich_batch([done, bare], transport=transport, workers=4)
+
+    assert enriched == [done, bare]
+    assert transport.peak_total == 0
+
+
+def _aged(store: EnrichmentStore, url: str, title: str, age: float) -> None:
+    store.put(url, {"status": 200, "title": title, "funding_amount": "$9M"})
+    store.data[url.split("//")[1].split("/")[0].split(".", 1)[-1]]["fetched_at"] -= age
+
+
+def test_fresh_record_answers_without_request() -> None:
+    transport = _SlowSites(delay=0)
+    store = EnrichmentStore(ttl=100, stale_seconds=100)
+    _aged(store, "https://www.acme.com/", "Acme cached", age=10)
+    signal = StartupSignal(company_name="Acme", website="https://acme.com/about")
+
+    enriched = enrich_from_website(signal, transport=transport, store=store)
+
+    assert enriched.description == "Acme cached"
+    assert enriched.funding_amount == "$9M"
+    assert transport.calls == []
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_stale_record_is_served_then_revalidated(workers: int) -> None:
+    transport = _SlowSites(delay=0)
+    store = EnrichmentStore(ttl=100, stale_seconds=100)
+    _aged(store, "https://www.acme.com/", "Acme cached", age=150)
+    signals = [StartupSignal(company_name=f"Acme {i}", website="https://www.acme.com/")
+               for i in range(3)]
+
+    enriched = enrich_batch(signals, transport=transport, workers=workers, store=store)
+
+    assert [signal.description for signal in enriched] == ["Acme cached"] * 3
+    assert transport.calls == ["https://www.acme.com/"]
+    record, fresh = store.lookup("https://acme.com")
+    assert fresh and record["title"] == "https://www.acme.com/"
+
+
+def test_expired_record_is_refetched_and_warm_domains_fetched_once() -> None:
+    transport = _SlowSites(delay=0)
+    store = EnrichmentStore(ttl=100, stale_seconds=100)
+    _aged(store, "https://www.acme.com/", "Acme cached", age=250)
+    signals = [StartupSignal(company_name=f"Acme {i}", website="https://www.acme.com/")
+               for i in range(3)]
+
+    enriched = enrich_batch(signals, transport=transport, workers=3, store=store)
+
+    assert {signal.description for signal in enriched} == {"https://www.acme.com/"}
+    assert enriched[0].funding_amount == "$3M"
+    assert transport.calls == ["https://www.acme.com/"]
+
+
+def test_failed_fetch_falls_back_to_stale_record() -> None:
+    store = EnrichmentStore(ttl=100, stale_seconds=100)
+    _aged(store, "https://www.acme.com/", "Acme cached", age=150)
+
+    class _Down:
+        def get(self, url: str, **_kwargs: object) -> TransportResponse:
+            raise ConnectionError(url)
+
+    signal = StartupSignal(company_name="Acme", website="https://www.acme.com/")
+
+    assert enrich_from_website(signal, transport=_Down(), store=store).description == "Acme cached"
+
+
+@pytest.mark.parametrize("status", [429, 503, 504])
+def test_transient_statuses_are_not_stored(status: int) -> None:
+    store = EnrichmentStore()
+
+    class _Throttled:
+        def get(self, url: str, **_kwargs: object) -> TransportResponse:
+            return TransportResponse(url=url, status_code=status)
+
+    signal = StartupSignal(company_name="Acme", website="https://www.acme.com/")
+    enrich_from_website(signal, transport=_Throttled(), store=store)
+
+    assert store.lookup("https://acme.com/") == (None, False)
+
+
+def test_store_round_trips_one_file_and_prunes_expired(tmp_path) -> None:
+    path = tmp_path / "enrichment_cache.json"
+    store = EnrichmentStore(str(path), ttl=100, stale_seconds=100)
+    _aged(store, "https://www.old.com/", "Old", age=500)
+    store.put("https://www.acme.com/", {"status": 404, "title": "", "funding_amount": ""})
+    store.save()
+
+    reloaded = EnrichmentStore(str(path), ttl=100, stale_seconds=100)
+
+    assert sorted(reloaded.data) == ["acme.com"]
+    record, fresh = reloaded.lookup("https://acme.com/about")
+    assert fresh and record["status"] == 404
+    assert sorted(record) == ["fetched_at", "funding_amount", "status", "title"]
+
+
+def test_sites_on_shared_hosts_get_their_own_records() -> None:
+    store = EnrichmentStore()
+    store.put("https://acme.github.io/", {"status": 200, "title": "Acme"})
+    store.put("https://sites.google.com/view/acme", {"status": 200, "title": "Acme"})
+
+    assert store.lookup("https://beta.github.io/") == (None, False)
+    assert store.lookup("https://sites.google.com/view/beta/home") == (None, False)
+    assert store.lookup("https://sites.google.com/view/acme/team")[0]["title"] == "Acme"
@@ -0,0 +1,36 @@
+import pytest
+
+from startup_watch.adapters.a16z import A16zAdapter
+from startup_watch.extract import css_to_xpath, node_text, select
+from startup_watch.transport import TransportResponse
+
+_PAGE = b"""<html><body>
+<div class="card featured"><h3>Acme <b>Robotics</b></h3><a href="/acme">Visit</a></div>
+<div class="card"><h3>Beta Foods</h3></div>
+<h2 id="top">Portfolio</h2><!-- <h3>Hidden</h3> -->
+</body></html>"""
+
+
+def test_select_keeps_document_order_and_bs4_text_semantics() -> None:
+    texts = [node_text(node) for node in select(_PAGE, "a, h2, h3")]
+
+    assert texts == ["Acme Robotics", "Visit", "Beta Foods", "Portfolio"]
+
+
+def test_css_subset_and_xpath_selectors() -> None:
+    assert [node_text(n) for n in select(_PAGE, "div.featured h3")] == ["Acme Robotics"]
+    assert [node_text(n) for n in select(_PAGE, "#top")] == ["Portfolio"]
+    assert [n.get("href") for n in select(_PAGE, "a[href]")] == ["/acme"]
+    assert [node_text(n) for n in select(_PAGE, "//div[2]/h3")] == ["Beta Foods"]
+    assert css_to_xpath("a, h2") == "//a | //h2"
+    with pytest.raises(ValueError):
+        css_to_xpath("div > a")
+
+
+def test_adapter_selector_comes_from_config(monkeypatch) -> None:
+    page = TransportResponse(url="https://example.com", status_code=200, content=_PAGE)
+    monkeypatch.setattr("startup_watch.transport.HttpTransport.get", lambda *a, **k: page)
+    config = {"enabled": True, "url": "https://example.com", "selector": "div.card h3"}
+    adapter = A16zAdapter(config)
+
+    assert [signal.company_name for signal in adapter.fetch()] == ["Acme Robotics", "Beta Foods"]
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from startup_watch.adapters import GeekwireAdapter as PackageGeekwireAdapter
+from startup_watch.adapters.feeds import FeedAdapter, GeekwireAdapter, feed_definitions
+from startup_watch.adapters.registry import BUILTIN_ADAPTERS
+
+
+def _fake_feed(count: int = 3) -> SimpleNamespace:
+    return SimpleNamespace(
+        entries=[
+            SimpleNamespace(
+                title=f"Startup {i}",
+                link=f"https://example.com/{i}",
+                summary="Seed round for a robotics startup.",
+                author="Jane",
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def test_aliases_are_stable_feed_adapter_subclasses() -> None:
+    assert GeekwireAdapter is PackageGeekwireAdapter
+    assert issubclass(GeekwireAdapter, FeedAdapter)
+    assert GeekwireAdapter.source_name == "geekwire"
+    assert GeekwireAdapter.__name__ == "GeekwireAdapter"
+
+
+def test_every_feed_definition_is_registered() -> None:
+    for key, definition in feed_definitions().items():
+        assert BUILTIN_ADAPTERS[key] == f"startup_watch.adapters.feeds:{definition['class']}"
+
+
+def test_config_overrides_stage_categories_limit_and_fields(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "startup_watch.adapters.base.BaseAdapter.fetch_feed", lambda *_a: _fake_feed()
+    )
+    adapter = GeekwireAdapter(
+        {
+            "enabled": True,
+            "url": "https://example.com/feed",
+            "stage": "series-a",
+            "categories": ["robotics"],
+            "max_items": 2,
+            "fields": {"description": "author"},
+        }
+    )
+
+    signals = adapter.fetch()
+
+    assert len(signals) == 2
+    assert signals[0].stage == "series-a"
+    assert signals[0].categories == ["robotics"]
+    assert signals[0].description == "Jane"
+    assert adapter.max_feed_entries == 2
@@ -0,0 +1,57 @@
+from startup_watch.feedparse import parse_fast, parse_feed
+
+_RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>News</title><link>https://example.com</link>
+{items}
+</channel></rss>"""
+_ITEM = (
+    "<item><title>Startup {0}</title><link>https://example.com/{0}</link>"
+    "<guid>g{0}</guid><pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate>"
+    "<description><![CDATA[<p>Seed round {0}</p>]]></description></item>"
+)
+
+
+def _rss(count: int) -> bytes:
+    items = "".join(_ITEM.format(i) for i in range(count))
+    return _RSS.replace(b"{items}", items.encode("utf-8"))
+
+
+def test_parse_fast_reads_rss_fields_and_stops_at_max_items() -> None:
+    feed = parse_fast(_rss(10), max_items=3)
+
+    assert len(feed.entries) == 3
+    entry = feed.entries[0]
+    assert (entry.title, entry.link, entry.id) == ("Startup 0", "https://example.com/0", "g0")
+    assert entry.summary == "<p>Seed round 0</p>"
+    assert entry.published == "Mon, 02 Mar 2026 10:00:00 GMT"
+
+
+def test_parse_fast_handles_atom_and_rss1() -> None:
+    atom = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>x</title>
+    <entry><title>Acme</title><link rel="self" href="https://a/self"/>
+    <link href="https://a/1"/><id>urn:1</id><updated>2026-03-02</updated>
+    <content type="html">Body</content></entry></feed>"""
+    rdf = b"""<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns="http://purl.org/rss/1.0/"><item rdf:about="https://b/1"><title>Beta</title>
+    <link>https://b/1</link><description>Text</description></item></rdf:RDF>"""
+
+    atom_entry = parse_fast(atom).entries[0]
+    rdf_entry = parse_fast(rdf).entries[0]
+
+    assert (atom_entry.link, atom_entry.id, atom_entry.summary) == ("https://a/1", "urn:1", "Body")
+    assert atom_entry.updated == "2026-03-02"
+    assert (rdf_entry.title, rdf_entry.id, rdf_entry.summary) == ("Beta", "https://b/1", "Text")
+
+
+def test_parse_feed_falls_back_to_feedparser_for_malformed_xml() -> None:
+    broken = b"<rss><channel><item><title>A&nbsp;B</title></item><item><title>C</title></item>"
+
+    feed = parse_feed(broken, max_items=1)
+
+    assert [entry.title for entry in feed.entries] == ["A\xa0B"]
+
+
+def test_parse_feed_can_skip_the_fast_path() -> None:
+    feed = parse_feed(_rss(2), fast=False)
+
+    assert [entry.title for entry in feed.entries] == ["Startup 0", "Startup 1"]
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from startup_watch.health import CLOSED, OPEN, PROBE, AdapterHealth
+from startup_watch.pipeline import collect_signals, fetch_with_resilience
+from startup_watch.schema import StartupSignal
+
+_LOGGER = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None)
+
+
+class _BrokenAdapter:
+    source_name = "broken"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def fetch(self) -> list[StartupSignal]:
+        self.calls += 1
+        raise RuntimeError("down")
+
+
+def test_breaker_opens_after_threshold_and_probes_after_cooldown(monkeypatch) -> None:
+    health = AdapterHealth(failure_threshold=2, cooldown_seconds=60)
+    monkeypatch.setattr("startup_watch.health.time.time", lambda: 1000.0)
+
+    health.record("feed", False, 1.0)
+    assert health.admit("feed") == CLOSED
+    health.record("feed", False, 1.0)
+    assert health.admit("feed") == OPEN
+    assert health.tripped() == ["feed"]
+
+    monkeypatch.setattr("startup_watch.health.time.time", lambda: 1061.0)
+    assert health.admit("feed") == PROBE
+    health.record("feed", True, 0.2, signals=5)
+    assert health.admit("feed") == CLOSED
+    assert health.get("feed")["last_yield"] == 5
+
+
+def test_fetch_with_resilience_records_failures() -> None:
+    health = AdapterHealth()
+
+    fetch_with_resilience(_BrokenAdapter(), _LOGGER, retries=0, backoff_seconds=0, health=health)
+
+    assert health.get("broken")["failure_streak"] == 1
+
+
+def test_collect_signals_skips_open_breakers_and_persists(tmp_path, monkeypatch) -> None:
+    adapter = _BrokenAdapter()
+    monkeypatch.setattr("startup_watch.pipeline.build_adapters", lambda *_args: [adapter])
+    config = {
+        "state_dir": str(tmp_path),
+        "pipeline": {"adapter_retries": 0, "breaker_failure_threshold": 2},
+    }
+
+    collect_signals(config)
+    collect_signals(config)
+    collect_signals(config)
+
+    assert adapter.calls == 2
+    assert AdapterHealth(str(tmp_path / "adapter_health.json")).get("broken")["failure_streak"] == 2
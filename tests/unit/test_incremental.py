@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from startup_watch.adapters.feeds import GeekwireAdapter
+from startup_watch.singleflight import SingleFlight
+from startup_watch.state import CursorStore
+from startup_watch.transport import TransportResponse
+
+_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+{items}
+</channel></rss>"""
+_ITEM = "<item><title>{0}</title><link>https://example.com/{0}</link><guid>{0}</guid></item>"
+
+
+def _transport(*names: str) -> SimpleNamespace:
+    items = "".join(_ITEM.format(name) for name in names)
+    body = _RSS.replace(b"{items}", items.encode("utf-8"))
+    return SimpleNamespace(
+        get=lambda url, **_kwargs: TransportResponse(url=url, status_code=200, content=body),
+        flights=SingleFlight(),
+    )
+
+
+def test_incremental_fetch_skips_seen_entries(tmp_path) -> None:
+    path = str(tmp_path / "feed_cursors.json")
+    config = {"enabled": True, "url": "https://example.com/feed"}
+    cursors = CursorStore(path)
+
+    first = GeekwireAdapter(config, _transport("Acme", "Beta"), cursors).fetch()
+    cursors.save()
+    second = GeekwireAdapter(config, _transport("Gamma", "Acme", "Beta"), CursorStore(path)).fetch()
+
+    assert [s.company_name for s in first] == ["Acme", "Beta"]
+    assert [s.company_name for s in second] == ["Gamma"]
+
+
+def test_cursor_store_limit_and_pruning() -> None:
+    cursors = CursorStore(max_entries=2)
+    entries = [{"id": name} for name in ("a", "b", "c")]
+
+    assert cursors.take_new("feed", entries, limit=2) == entries[:2]
+    # "c" was beyond the limit, so it was not marked and is still new.
+    assert cursors.take_new("feed", entries) == entries[2:]
+    assert len(cursors.get("feed")) == 2
+
+
+def test_cursor_store_is_off_unless_incremental() -> None:
+    assert CursorStore.from_config({}) is None
+    assert CursorStore.from_config({"pipeline": {"incremental": True}}) is not None
@@ -0,0 +1,127 @@
+from types import SimpleNamespace
+
+import requests
+
+from startup_watch.adapters.base import BaseAdapter
+from startup_watch.health import AdapterHealth
+from startup_watch.outcomes import (
+    EMPTY,
+    NOT_MODIFIED,
+    OFFLINE_MISS,
+    OK,
+    PERMANENT_ERROR,
+    TRANSIENT_ERROR,
+    classify,
+)
+from startup_watch.pipeline import collect_signals, fetch_with_resilience
+from startup_watch.schema import StartupSignal
+from startup_watch.transport import ResponseTooLarge, TransportResponse
+
+_LOGGER = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None)
+
+
+class _PageAdapter(BaseAdapter):
+    source_name = "page"
+
+    def __init__(self, responses: list) -> None:
+        self.responses = responses
+        self.calls = 0
+        super().__init__({}, SimpleNamespace(get=self._get))
+
+    def _get(self, url: str, **_kwargs: object) -> TransportResponse:
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def fetch(self) -> list[StartupSignal]:
+        try:
+            response = self.http_get("https://example.com/news")
+            if response.status_code != 200:
+                return []
+            return [
+                StartupSignal(
+                    company_name="Acme",
+                    description="desc",
+                    stage="seed",
+                    categories=["industrial software"],
+                    source_name=self.source_name,
+                    source_url=response.url,
+                )
+            ]
+        except Exception as exc:
+            return self.failed(exc)
+
+
+def _response(status: int, **headers: str) -> TransportResponse:
+    return TransportResponse(url="https://example.com/news", status_code=status, headers=headers)
+
+
+def test_classify() -> None:
+    assert classify([object()], status=503) == OK
+    assert classify([]) == EMPTY
+    assert classify([], status=200) == EMPTY
+    assert classify([], status=304, not_modified=True) == NOT_MODIFIED
+    assert classify([], status=429) == TRANSIENT_ERROR
+    assert classify([], status=404) == PERMANENT_ERROR
+    assert classify([], error=requests.ConnectionError("reset")) == TRANSIENT_ERROR
+    assert classify([], error=ResponseTooLarge("big")) == PERMANENT_ERROR
+    assert classify([], status=504, offline_miss=True) == OFFLINE_MISS
+
+
+def test_fetch_result_sees_through_the_adapter_catch_all() -> None:
+    throttled = _PageAdapter([_response(503, **{"Retry-After": "12"})]).fetch_result()
+    gone = _PageAdapter([_response(410)]).fetch_result()
+    reset = _PageAdapter([requests.ConnectionError("reset")]).fetch_result()
+
+    assert (throttled.outcome, throttled.status) == (TRANSIENT_ERROR, 503)
+    assert throttled.retry_after == 12.0
+    assert (gone.outcome, gone.status) == (PERMANENT_ERROR, 410)
+    assert reset.outcome == TRANSIENT_ERROR
+    assert "reset" in reset.error
+
+
+def test_only_transient_failures_are_retried(monkeypatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("startup_watch.pipeline.time.sleep", delays.append)
+    gone = _PageAdapter([_response(404), _response(200)])
+    throttled = _PageAdapter([_response(429, **{"Retry-After": "3"}), _response(200)])
+    health = AdapterHealth()
+
+    lost = fetch_with_resilience(gone, _LOGGER, retries=2, backoff_seconds=0, health=health)
+    recovered = fetch_with_resilience(throttled, _LOGGER, retries=2, backoff_seconds=0)
+
+    assert (lost.outcome, gone.calls) == (PERMANENT_ERROR, 1)
+    assert (recovered.outcome, throttled.calls, len(recovered.signals)) == (OK, 2, 1)
+    assert delays == [3.0]
+    assert health.get("page")["last_outcome"] == PERMANENT_ERROR
+    assert health.get("page")["last_status"] == 404
+
+
+def test_threaded_collection_retries_transient_outcomes(monkeypatch) -> None:
+    flaky = _PageAdapter([_response(502), _response(200)])
+    gone = _PageAdapter([_response(404)])
+    monkeypatch.setattr("startup_watch.pipeline.build_adapters", lambda *_args: [flaky, gone])
+    config = {
+        "pipeline": {"adapter_retries": 2, "adapter_backoff_seconds": 0, "adapter_workers": 2}
+    }
+
+    signals = collect_signals(config)
+
+    assert len(signals) == 1
+    assert (flaky.calls, gone.calls) == (2, 1)
+
+
+def test_offline_misses_are_not_retried_or_recorded(monkeypatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("startup_watch.pipeline.time.sleep", delays.append)
+    miss = TransportResponse(url="https://example.com/news", status_code=504, offline_miss=True)
+    adapter = _PageAdapter([miss, _response(200)])
+    health = AdapterHealth()
+
+    result = fetch_with_resilience(adapter, _LOGGER, retries=2, backoff_seconds=0, health=health)
+
+    assert (result.outcome, result.failed, adapter.calls) == (OFFLINE_MISS, False, 1)
+    assert delays == []
+    assert health.get("page") is None
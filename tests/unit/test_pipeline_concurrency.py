@@ -0,0 +1,72 @@
+import threading
+
+from startup_watch.pipeline import collect_signals
+from startup_watch.schema import StartupSignal
+
+
+class _BarrierAdapter:
+    def __init__(self, name: str, barrier: threading.Barrier) -> None:
+        self.source_name = name
+        self.barrier = barrier
+
+    def fetch(self) -> list[StartupSignal]:
+        # Only returns once every adapter is running at the same time.
+        self.barrier.wait(timeout=5)
+        return [StartupSignal(company_name=self.source_name, source_name=self.source_name)]
+
+
+def test_collect_signals_runs_adapters_concurrently_in_order(monkeypatch) -> None:
+    barrier = threading.Barrier(3)
+    adapters = [_BarrierAdapter(name, barrier) for name in ("first", "second", "third")]
+    monkeypatch.setattr("startup_watch.pipeline.build_adapters", lambda *_args: adapters)
+
+    signals = collect_signals({"pipeline": {"adapter_workers": 3, "adapter_retries": 0}})
+
+    assert [s.company_name for s in signals] == ["first", "second", "third"]
+
+
+def test_collect_signals_sequential_by_default(monkeypatch) -> None:
+    calls: list[str] = []
+
+    class _Adapter:
+        def __init__(self, name: str) -> None:
+            self.source_name = name
+
+        def fetch(self) -> list[StartupSignal]:
+            calls.append(threading.current_thread().name)
+            return []
+
+    monkeypatch.setattr(
+        "startup_watch.pipeline.build_adapters", lambda *_args: [_Adapter("a"), _Adapter("b")]
+    )
+
+    assert collect_signals({}) == []
+    assert calls == [threading.main_thread().name] * 2
+
+
+def test_collect_signals_async_mixes_native_and_sync_adapters(monkeypatch) -> None:
+    from startup_watch.adapters.base import BaseAdapter
+
+    class _SyncAdapter(BaseAdapter):
+        source_name = "sync"
+
+        def fetch(self) -> list[StartupSignal]:
+            return [StartupSignal(company_name="Sync Co", source_name=self.source_name)]
+
+    class _NativeAdapter(BaseAdapter):
+        source_name = "native"
+
+        def fetch(self) -> list[StartupSignal]:  # pragma: no cover - afetch is used instead
+            raise AssertionError("fetch should not be called")
+
+        async def afetch(self) -> list[StartupSignal]:
+            return [StartupSignal(company_name="Native Co", source_name=self.source_name)]
+
+    monkeypatch.setattr(
+        "startup_watch.pipeline.build_adapters",
+        lambda *_args: [_NativeAdapter({}), _SyncAdapter({})],
+    )
+
+    signals = collect_signals({"pipeline": {"engine": "asyncio", "adapter_workers": 4}})
+
+    assert [s.company_name for s in signals] == ["Native Co", "Sync Co"]
@@ -1,5 +1,6 @@
 from types import SimpleNamespace
 
+from startup_watch.outcomes import OK, TRANSIENT_ERROR
 from startup_watch.pipeline import fetch_with_resilience
 from startup_watch.schema import StartupSignal
 
@@ -38,9 +39,10 @@ def test_fetch_with_resilience_retries_and_succeeds(monkeypatch) -> None:
     adapter = _FlakyAdapter()
     logger = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None)
 
-    signals = fetch_with_resilience(adapter, logger, retries=2, backoff_seconds=0.1)
+    result = fetch_with_resilience(adapter, logger, retries=2, backoff_seconds=0.1)
 
-    assert len(signals) == 1
+    assert len(result.signals) == 1
+    assert result.outcome == OK
     assert adapter.calls == 2
 
 
@@ -49,6 +51,7 @@ def test_fetch_with_resilience_returns_empty_after_failures(monkeypatch) -> None
     adapter = _BrokenAdapter()
     logger = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None)
 
-    signals = fetch_with_resilience(adapter, logger, retries=2, backoff_seconds=0.1)
+    result = fetch_with_resilience(adapter, logger, retries=2, backoff_seconds=0.1)
 
-    assert signals == []
+    assert result.signals == []
+    assert result.outcome == TRANSIENT_ERROR
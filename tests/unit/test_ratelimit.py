@@ -0,0 +1,84 @@
+from startup_watch.ratelimit import HostRateLimiter, TokenBucket
+from startup_watch.urls import registrable_domain, site_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    clock.now = 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_limiter_only_delays_the_busy_host() -> None:
+    waits: list[float] = []
+    limiter = HostRateLimiter(rate_per_second=1.0, burst=1, sleep=waits.append)
+
+    limiter.acquire("https://sifted.eu/feed")
+    limiter.acquire("https://www.eu-startups.com/feed/")
+    limiter.acquire("https://sifted.eu/feed/")
+
+    assert len(waits) == 1
+    assert 0.9 < waits[0] <= 1.0
+
+
+def test_limiter_domain_scope_and_overrides() -> None:
+    waits: list[float] = []
+    limiter = HostRateLimiter(scope="domain", sleep=waits.append)
+
+    limiter.acquire("https://www.example.co.uk/a")
+    assert limiter._buckets == {}
+    limiter.acquire("https://news.example.co.uk/b", rate=0.5)
+    limiter.acquire("https://www.example.co.uk/c")
+
+    assert list(limiter._buckets) == ["example.co.uk"]
+    assert len(waits) == 1
+
+
+def test_stricter_override_throttles_a_shared_host() -> None:
+    waits: list[float] = []
+    limiter = HostRateLimiter(sleep=waits.append)
+
+    limiter.acquire("https://news.example.com/feed", rate=10.0)
+    limiter.acquire("https://news.example.com/page", rate=0.5)
+    limiter.acquire("https://news.example.com/feed", rate=10.0)
+
+    assert len(waits) == 2
+    assert waits[0] > 1.0
+    assert waits[1] > 3.0
+
+
+def test_registrable_domain() -> None:
+    assert registrable_domain("https://news.sifted.eu/feed") == "sifted.eu"
+    assert registrable_domain("https://www.example.co.uk") == "example.co.uk"
+    assert registrable_domain("Example.COM") == "example.com"
+
+
+def test_site_key_keeps_shared_hosts_apart() -> None:
+    assert site_key("https://www.acme.com/about") == "acme.com"
+    assert site_key("https://acme.github.io/") == "acme.github.io"
+    assert site_key("https://acme.vercel.app") == "acme.vercel.app"
+    assert site_key("https://sites.google.com/view/Acme/home") == "sites.google.com/view/acme"
+
+
+def test_limiter_defer_pauses_only_that_host() -> None:
+    waits: list[float] = []
+    limiter = HostRateLimiter(sleep=waits.append)
+
+    limiter.defer("https://sifted.eu/feed", 30)
+    limiter.acquire("https://www.eu-startups.com/feed/")
+    limiter.acquire("https://sifted.eu/other")
+
+    assert len(waits) == 1
+    assert 29 < waits[0] <= 30
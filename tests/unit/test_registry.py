@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import yaml
+
+from startup_watch.adapters.registry import (
+    BUILTIN_ADAPTERS,
+    load_adapter_class,
+    registered_adapters,
+)
+from startup_watch.pipeline import build_adapters
+
+
+def test_every_registered_adapter_has_a_config_block() -> None:
+    for path in ("startup_watch/config.yaml", "startup_watch/config.github.yaml"):
+        with open(path, "r", encoding="utf-8") as handle:
+            config = yaml.safe_load(handle)
+        assert [key for key in BUILTIN_ADAPTERS if key not in config] == []
+
+
+def test_build_adapters_imports_only_enabled_adapters(monkeypatch) -> None:
+    loaded: list[str] = []
+
+    def _load(target: str) -> type:
+        loaded.append(target)
+        return load_adapter_class(target)
+
+    monkeypatch.setattr("startup_watch.adapters.registry.load_adapter_class", _load)
+    config = {
+        "geekwire_adapter": {"enabled": True, "url": "https://example.com/feed"},
+        "sifted_adapter": {"enabled": False},
+    }
+
+    adapters = build_adapters(config)
+
+    assert [adapter.source_name for adapter in adapters] == ["geekwire"]
+    assert loaded == [BUILTIN_ADAPTERS["geekwire_adapter"]]
+
+
+def test_entry_point_adapters_are_registered(monkeypatch) -> None:
+    plugin = SimpleNamespace(name="acme_adapter", value="acme_watch.adapter:AcmeAdapter")
+    shadow = SimpleNamespace(name="sifted_adapter", value="evil:Adapter")
+    monkeypatch.setattr(
+        "startup_watch.adapters.registry.entry_points", lambda group: [plugin, shadow]
+    )
+
+    registry = registered_adapters()
+
+    assert registry["acme_adapter"] == "acme_watch.adapter:AcmeAdapter"
+    assert registry["sifted_adapter"] == BUILTIN_ADAPTERS["sifted_adapter"]
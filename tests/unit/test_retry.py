@@ -0,0 +1,107 @@
+import threading
+import time
+
+from startup_watch.retry import RetryPolicy, iter_with_retries, parse_retry_after
+
+
+def test_policy_exponential_full_jitter_with_cap() -> None:
+    policy = RetryPolicy(retries=5, base_seconds=1.0, max_seconds=3.0, rng=lambda: 1.0)
+
+    assert [policy.next_delay(n) for n in range(1, 5)] == [1.0, 2.0, 3.0, 3.0]
+    assert policy.next_delay(6) is None
+    assert RetryPolicy(2, 1.0, rng=lambda: 0.25).next_delay(2) == 0.5
+
+
+def test_policy_honours_retry_after_and_budget() -> None:
+    policy = RetryPolicy(retries=3, base_seconds=1.0, max_seconds=60, budget=2)
+
+    assert policy.next_delay(1, retry_after=7.0) == 7.0
+    assert policy.next_delay(1) is not None
+    assert policy.next_delay(1) is None
+
+
+def test_policy_from_config() -> None:
+    policy = RetryPolicy.from_config(
+        {"pipeline": {"adapter_retries": 2, "adapter_backoff_max_seconds": 5, "retry_budget": 9}}
+    )
+
+    assert (policy.retries, policy.max_seconds, policy.budget) == (2, 5.0, 9)
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_scheduler_backoff_does_not_block_other_tasks() -> None:
+    policy = RetryPolicy(retries=1, base_seconds=0.3, rng=lambda: 1.0)
+    calls: dict[str, int] = {"flaky": 0}
+    finished: dict[str, float] = {}
+    lock = threading.Lock()
+    started = time.monotonic()
+
+    def attempt(task: str, number: int) -> str:
+        if task == "flaky" and number == 1:
+            calls["flaky"] += 1
+            raise RuntimeError("boom")
+        time.sleep(0.05)
+        with lock:
+            finished[task] = time.monotonic() - started
+        return f"{task}:{number}"
+
+    results = dict(
+        iter_with_retries(
+            ["flaky", "a", "b", "c"],
+            attempt,
+            retries_for=lambda _task: 1,
+            policy=policy,
+            workers=1,
+        )
+    )
+
+    assert [results[index] for index in range(4)] == ["flaky:2", "a:1", "b:1", "c:1"]
+    assert calls == {"flaky": 1}
+    # With one worker the healthy tasks ran while "flaky" was backing off.
+    assert finished["c"] < finished["flaky"]
+
+
+def test_scheduler_returns_last_error_and_respects_per_task_retries() -> None:
+    policy = RetryPolicy(retries=3, base_seconds=0.0)
+    attempts: list[tuple[str, int]] = []
+
+    def attempt(task: str, number: int) -> str:
+        attempts.append((task, number))
+        raise ValueError(task)
+
+    results = dict(
+        iter_with_retries(
+            ["probe", "normal"],
+            attempt,
+            retries_for=lambda task: 0 if task == "probe" else 2,
+            policy=policy,
+            workers=2,
+        )
+    )
+
+    assert all(isinstance(result, ValueError) for result in results.values())
+    assert sorted(attempts) == [("normal", 1), ("normal", 2), ("normal", 3), ("probe", 1)]
+
+
+def test_scheduler_honours_an_errors_retry_after() -> None:
+    class _Throttled(Exception):
+        retry_after = 0.2
+
+    policy = RetryPolicy(retries=1, base_seconds=0.0)
+    started = time.monotonic()
+
+    def attempt(task: str, number: int) -> int:
+        if number == 1:
+            raise _Throttled(task)
+        return number
+
+    results = dict(iter_with_retries(["a"], attempt, lambda _task: 1, policy, workers=1))
+
+    assert results == {0: 2}
+    assert time.monotonic() - started >= 0.2
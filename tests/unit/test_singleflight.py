@@ -0,0 +1,82 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from startup_watch.adapters.feeds import SiftedAdapter
+from startup_watch.adapters.feeds import SiftedNewsAdapter
+from startup_watch.singleflight import SingleFlight
+from startup_watch.transport import HttpTransport, TransportResponse
+
+_RSS = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><title>Acme raises seed</title><link>https://example.com/acme</link></item>
+</channel></rss>"""
+
+
+def test_concurrent_callers_share_one_call() -> None:
+    flights = SingleFlight()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def _slow() -> str:
+        calls.append(1)
+        release.wait(2)
+        return "body"
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flights.do, "u", _slow, f"a{i}") for i in range(3)]
+        while flights.hits < 2:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["body"] * 3
+    assert len(calls) == 1
+    assert flights.shared_keys() == {"u": ["a0", "a1", "a2"]}
+
+
+def test_retained_results_errors_and_repeat_callers() -> None:
+    flights = SingleFlight()
+    calls: list[str] = []
+
+    def _fetch() -> str:
+        calls.append("x")
+        return f"v{len(calls)}"
+
+    assert flights.do("u", _fetch, "a") == "v1"
+    assert flights.do("u", _fetch, "b") == "v1"
+    # "a" asking again is a retry or a new run, so it fetches afresh.
+    assert flights.do("u", _fetch, "a") == "v2"
+
+    def _boom() -> str:
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        flights.do("e", _boom, "a")
+    assert flights.do("e", _fetch, "b") == "v3"
+    assert flights.do("t", _fetch, "a", keep=lambda _r: False) == "v4"
+    assert flights.do("t", _fetch, "b") == "v5"
+
+
+def test_adapters_sharing_a_feed_fetch_it_once(monkeypatch) -> None:
+    requested: list[str] = []
+
+    def _get(self, url: str, **_kwargs: object) -> TransportResponse:
+        requested.append(url)
+        return TransportResponse(url=url, status_code=200, content=_RSS)
+
+    monkeypatch.setattr("startup_watch.transport.HttpTransport.get", _get)
+    transport = HttpTransport()
+    config = {"enabled": True, "url": "https://sifted.eu/feed"}
+    mirror = {"enabled": True, "url": "https://sifted.eu/feed/"}
+
+    first = SiftedAdapter(config, transport).fetch()
+    second = SiftedNewsAdapter(config, transport).fetch()
+    SiftedNewsAdapter(mirror, transport).fetch()
+
+    assert len(first) == len(second) == 1
+    assert requested == ["https://sifted.eu/feed", "https://sifted.eu/feed/"]
+    assert transport.flights.duplicate_content() == [
+        ["https://sifted.eu/feed", "https://sifted.eu/feed/"]
+    ]
@@ -0,0 +1,98 @@
+from startup_watch.enrichment import enrich_from_website
+from startup_watch.schema import StartupSignal
+from startup_watch.sitemeta import FEED_CHUNK, extract_site_meta
+from startup_watch.transport import TransportResponse
+
+_PAGE = b"""<!doctype html><html><head>
+<title> Acme
+  Robotics </title>
+<meta property="og:description" content="Robots for warehouses">
+<meta name="description" content="Warehouse robotics for mid-size 3PLs">
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [
+  {"@type": "WebSite", "name": "Acme"},
+  {"@type": ["Organization"], "name": "Acme Robotics",
+   "sameAs": ["https://x.com/acme", "https://www.linkedin.com/company/acme-robotics"],
+   "address": {"addressLocality": "Austin", "addressCountry": {"name": "US"}},
+   "numberOfEmployees": {"minValue": 11, "maxValue": 50},
+   "founder": [{"name": "Ada Park"}, "Lin Wu"]}
+]}
+</script>
+</head><body>
+<script>var teaser = "$90M";</script>
+<p>Acme raised <b>$4.5</b> million in seed funding.</p>
+</body></html>"""
+
+
+def test_extracts_head_metadata_and_organization() -> None:
+    meta = extract_site_meta(_PAGE, "utf-8")
+
+    assert meta == {
+        "title": "Acme Robotics",
+        "description": "Warehouse robotics for mid-size 3PLs",
+        "funding_amount": "$4.5 million",
+        "linkedin_url": "https://www.linkedin.com/company/acme-robotics",
+        "location": "Austin, US",
+        "headcount_range": "11-50",
+        "founders": ["Ada Park", "Lin Wu"],
+    }
+
+
+def test_head_only_skips_body_text() -> None:
+    assert extract_site_meta(_PAGE, "utf-8", scan_body=False)["funding_amount"] == ""
+
+
+def test_stops_at_element_budget() -> None:
+    filler = b"<p>filler</p>" * (FEED_CHUNK // 4)
+    page = b"<html><head><title>Big</title></head><body>" + filler + b"<p>$7M</p></body></html>"
+
+    assert extract_site_meta(page, "utf-8", max_elements=100)["funding_amount"] == ""
+    assert extract_site_meta(page, "utf-8", max_elements=10**6)["funding_amount"] == "$7M"
+
+
+def test_tolerates_broken_markup_and_json() -> None:
+    page = b"<title>Beta<meta name=description content=Tools><script type='application/ld+json'>{"
+
+    meta = extract_site_meta(page, None)
+
+    assert meta["title"].startswith("Beta")
+    assert meta["linkedin_url"] == ""
+    assert extract_site_meta(b"", None)["title"] == ""
+
+
+def test_decodes_codecs_unknown_to_libxml2() -> None:
+    page = "<title>café</title>".encode("euc_jp")
+
+    assert extract_site_meta(page, "euc_jp")["title"] == "café"
+
+
+def test_enrichment_fills_richer_fields() -> None:
+    class _Site:
+        def get(self, url: str, **_kwargs: object) -> TransportResponse:
+            return TransportResponse(url=url, status_code=200, content=_PAGE)
+
+    signal = StartupSignal(company_name="Acme", website="https://acme.example")
+
+    enriched = enrich_from_website(signal, transport=_Site())
+
+    assert enriched.description == "Warehouse robotics for mid-size 3PLs"
+    assert enriched.funding_amount == "$4.5 million"
+    assert enriched.location == "Austin, US"
+    assert enriched.headcount_range == "11-50"
+    assert enriched.founders == ["Ada Park", "Lin Wu"]
+    assert enriched.linkedin_url.endswith("/acme-robotics")
+
+
+def test_invalid_bytes_for_the_charset_are_replaced() -> None:
+    page = b"<html><head><title>Caf\xe9 Co</title></head><body><p>Hi</p></body></html>"
+
+    assert extract_site_meta(page, "utf-8")["title"] == "Caf� Co"
+
+
+def test_only_the_head_title_is_used() -> None:
+    page = b"""<html><head><title>Acme Robotics</title></head><body>
+<a href="https://x.com/acme"><svg><title>Twitter</title><path d="M0"/></svg></a>
+</body></html>"""
+
+    assert extract_site_meta(page, "utf-8")["title"] == "Acme Robotics"
+    assert extract_site_meta(b"<body><svg><title>Logo</title></svg></body>")["title"] == ""
@@ -0,0 +1,83 @@
+from startup_watch.pipeline import pipeline_stages, process_signals
+from startup_watch.schema import StartupSignal
+from startup_watch.stages import CHEAP, NETWORK, Stage, plan_stages, run_stages
+
+
+def _passthrough(signals):
+    return iter(signals)
+
+
+def _names(stages: list[Stage]) -> list[str]:
+    return [stage.name for stage in stages]
+
+
+def test_pipeline_plan_dedups_and_filters_before_enrichment() -> None:
+    planned = plan_stages(pipeline_stages({}))
+
+    assert _names(planned) == [
+        "filter_excluded",
+        "filter_category",
+        "annotate",
+        "filter_stage",
+        "dedup",
+        "enrich",
+    ]
+
+
+def test_stage_reading_enriched_fields_stays_after_enrichment() -> None:
+    stages = [
+        Stage("enrich", _passthrough, cost=NETWORK, writes=frozenset({"funding_amount"})),
+        Stage("has_funding", _passthrough, selective=True, reads=frozenset({"funding_amount"})),
+        Stage("by_name", _passthrough, selective=True),
+    ]
+
+    assert _names(plan_stages(stages)) == ["by_name", "enrich", "has_funding"]
+
+
+def test_stateful_stage_keeps_its_place_among_selective_stages() -> None:
+    stages = [
+        Stage("dedup", _passthrough, selective=True, stateful=True),
+        Stage("expensive", _passthrough, cost=NETWORK),
+        Stage("filter", _passthrough, cost=CHEAP, selective=True),
+    ]
+
+    assert _names(plan_stages(stages)) == ["dedup", "filter", "expensive"]
+
+
+def test_planned_order_fetches_less_and_yields_the_same_rows(monkeypatch) -> None:
+    fetched: list[str] = []
+
+    def _enrich(signals, **_kwargs):
+        for signal in signals:
+            fetched.append(signal.company_name)
+            signal.description = signal.description or f"About {signal.company_name}"
+            yield signal
+
+    monkeypatch.setattr("startup_watch.pipeline.iter_enrich", _enrich)
+    config = {"categories": ["logistics"], "stages": ["seed"]}
+
+    def _signals() -> list[StartupSignal]:
+        return [
+            StartupSignal(company_name="Acme", website="https://acme.example",
+                          stage="seed", categories=["logistics"]),
+            StartupSignal(company_name="ACME", website="https://acme.example/about",
+                          stage="seed", categories=["logistics"]),
+            StartupSignal(company_name="Other", website="https://other.example",
+                          stage="series_c", categories=["logistics"]),
+            StartupSignal(company_name="Beta", website="https://beta.example",
+                          stage="seed", categories=["retail"]),
+            StartupSignal(company_name="Gamma", website="https://gamma.example",
+                          stage="seed", categories=["logistics"], description="Known"),
+        ]
+
+    declared = [s.normalize() for s in run_stages(_signals(), pipeline_stages(config))]
+    declared_fetches = len(fetched)
+    fetched.clear()
+
+    planned = list(process_signals(_signals(), config))
+
+    assert [(s.company_name, s.description) for s in planned] == [
+        (s.company_name, s.description) for s in declared
+    ]
+    assert fetched == ["Acme", "Gamma"]
+    assert declared_fetches == 3
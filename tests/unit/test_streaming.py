@@ -0,0 +1,60 @@
+import time
+
+from startup_watch.dedup import iter_deduplicate
+from startup_watch.pipeline import iter_signals, stream_csv
+from startup_watch.schema import StartupSignal
+
+
+def _signal(name: str) -> StartupSignal:
+    return StartupSignal(
+        company_name=name,
+        description="desc",
+        stage="seed",
+        categories=["logistics"],
+        source_name="test",
+        source_url=f"https://example.com/{name}",
+    )
+
+
+class _Adapter:
+    def __init__(self, name: str, delay: float) -> None:
+        self.source_name = name
+        self.delay = delay
+
+    def fetch(self) -> list[StartupSignal]:
+        time.sleep(self.delay)
+        return [_signal(self.source_name)]
+
+
+def test_iter_signals_keeps_adapter_order(monkeypatch) -> None:
+    adapters = [_Adapter("slow", 0.1), _Adapter("fast", 0.0), _Adapter("quick", 0.0)]
+    monkeypatch.setattr("startup_watch.pipeline.build_adapters", lambda *_args: adapters)
+
+    names = [s.company_name for s in iter_signals({"pipeline": {"adapter_workers": 3}})]
+
+    assert names == ["slow", "fast", "quick"]
+
+
+def test_iter_deduplicate_is_lazy() -> None:
+    def _source():
+        yield _signal("Acme")
+        yield _signal("ACME")
+        raise AssertionError("read past the first unique signal")
+
+    assert next(iter_deduplicate(_source())).company_name == "Acme"
+
+
+def test_stream_csv_flushes_rows_before_the_run_ends(tmp_path) -> None:
+    seen_on_disk: list[int] = []
+
+    def _source():
+        yield _signal("Acme")
+        path = next(tmp_path.iterdir())
+        seen_on_disk.append(len(path.read_text(encoding="utf-8").splitlines()))
+        yield _signal("Beta")
+
+    path, rows = stream_csv(_source(), str(tmp_path))
+
+    assert rows == 2
+    assert seen_on_disk == [2]
+    assert len(open(path, encoding="utf-8").read().splitlines()) == 3
@@ -0,0 +1,82 @@
+import pytest
+
+from startup_watch.adapters.utils import extract_amount, infer_stage_from_text
+from startup_watch.schema import StartupSignal
+from startup_watch.textsignals import annotate_signals, extract_many, extract_text_signals
+
+
+def test_one_pass_finds_stage_amount_round_and_investors() -> None:
+    found = extract_text_signals(
+        "Acme raises $4.5 million Series A led by Sequoia Capital, Accel and Y Combinator."
+    )
+
+    assert found.stage == "series-a"
+    assert found.round_type == "series-a"
+    assert found.amount == "$4.5 million"
+    assert found.amount_value == 4_500_000
+    assert found.currency == "USD"
+    assert found.investors == ["Sequoia Capital", "Accel", "Y Combinator"]
+
+
+@pytest.mark.parametrize(
+    ("text", "value", "currency"),
+    [
+        ("a €2M pre-seed", 2_000_000, "EUR"),
+        ("£750k bridge", 750_000, "GBP"),
+        ("USD 1.2 bn", 1_200_000_000, "USD"),
+        ("raised $3B", 3_000_000_000, "USD"),
+    ],
+)
+def test_amounts_are_normalised(text: str, value: float, currency: str) -> None:
+    found = extract_text_signals(text)
+
+    assert (found.amount_value, found.currency) == (value, currency)
+
+
+@pytest.mark.parametrize(
+    ("text", "stage"),
+    [
+        ("Preseed and seed funds", "pre-seed"),
+        ("seed extension after a Series B", "series-b"),
+        ("stealth, seed-stage robotics", "seed"),
+        ("Stealth mode", "stealth"),
+        ("SeedInvest lists Series Alpha", "unknown"),
+        ("", "unknown"),
+    ],
+)
+def test_stage_precedence_matches_the_old_substring_rules(text: str, stage: str) -> None:
+    assert infer_stage_from_text(text) == stage
+
+
+def test_investor_names_stop_at_sentence_end() -> None:
+    found = extract_text_signals("The round was led by Sequoia. The team, backed by Point Nine & Co, grew.")
+
+    assert found.investors == ["Sequoia", "Point Nine & Co"]
+
+
+@pytest.mark.parametrize(
+    "text", ["Lawsuit filed by Apple Inc", "Startup scaled by Google", "Unveiled by Tesla"]
+)
+def test_investor_phrases_match_whole_words_only(text: str) -> None:
+    assert extract_text_signals(text).investors == []
+
+
+def test_no_amount_without_a_unit() -> None:
+    assert extract_amount("plans from $4 per month, $4 more") == ""
+    assert extract_many(["$5M seed", "nothing"])[1].amount_value is None
+
+
+def test_annotate_fills_fields_and_prefers_stated_stage() -> None:
+    signals = [
+        StartupSignal(company_name="Acme raises $6M Series A led by Accel", stage="seed"),
+        StartupSignal(company_name="Beta", description="Robots", stage="seed",
+                      funding_amount="$1M", investor_names=["Known"]),
+    ]
+
+    annotated = annotate_signals(signals)
+
+    assert annotated[0].stage == "series-a"
+    assert annotated[0].funding_amount == "$6M"
+    assert annotated[0].investor_names == ["Accel"]
+    assert (annotated[1].stage, annotated[1].funding_amount) == ("seed", "$1M")
+    assert annotated[1].investor_names == ["Known"]
@@ -0,0 +1,197 @@
+import pytest
+
+from startup_watch.adapters.feeds import GeekwireAdapter
+from startup_watch.enrichment import enrich_from_website
+from startup_watch.schema import StartupSignal
+from startup_watch.outcomes import PERMANENT_ERROR
+from startup_watch.transport import (
+    FEED_TYPES,
+    HttpTransport,
+    ResponseTooLarge,
+    TransportResponse,
+    UnsupportedContentType,
+    content_type_allowed,
+)
+
+_RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Acme raises seed</title><link>https://example.com/acme</link>
+<description>Warehouse robotics.</description></item>
+</channel></rss>"""
+
+
+def test_from_config_reads_transport_block() -> None:
+    transport = HttpTransport.from_config(
+        {"transport": {"user_agent": "probe/2.0", "timeout_seconds": 5, "pool_maxsize": 4}}
+    )
+
+    assert transport.timeout == 5.0
+    assert transport.session.headers["User-Agent"] == "probe/2.0"
+    pooled = transport.session.get_adapter("https://sifted.eu/feed")
+    assert pooled is transport.session.get_adapter("https://www.eu-startups.com/feed/")
+    assert pooled._pool_maxsize == 4
+
+
+def test_get_uses_connect_and_read_timeouts(monkeypatch, fake_response) -> None:
+    transport = HttpTransport(timeout=7, connect_timeout=2)
+    seen: dict = {}
+
+    def _get(url, timeout=None, headers=None, stream=False):
+        seen.update(url=url, timeout=timeout, stream=stream)
+        return fake_response(200, b"ok")
+
+    monkeypatch.setattr(transport.session, "get", _get)
+
+    response = transport.get("https://example.com")
+
+    assert seen == {"url": "https://example.com", "timeout": (2, 7), "stream": True}
+    assert response.content == b"ok"
+
+
+def test_get_enforces_byte_cap(monkeypatch, fake_response) -> None:
+    transport = HttpTransport(max_bytes=10)
+    monkeypatch.setattr(transport.session, "get", lambda *a, **k: fake_response(200, b"x" * 11))
+
+    with pytest.raises(ResponseTooLarge):
+        transport.get("https://example.com")
+
+
+def test_get_per_request_cap_overrides_transport_cap(monkeypatch, fake_response) -> None:
+    transport = HttpTransport(max_bytes=100)
+    monkeypatch.setattr(transport.session, "get", lambda *a, **k: fake_response(200, b"x" * 11))
+
+    with pytest.raises(ResponseTooLarge):
+        transport.get("https://example.com", max_bytes=10)
+
+
+def test_get_truncates_instead_of_raising(monkeypatch, fake_response) -> None:
+    transport = HttpTransport()
+    monkeypatch.setattr(transport.session, "get", lambda *a, **k: fake_response(200, b"x" * 100))
+
+    response = transport.get("https://example.com", max_bytes=10, truncate=True)
+
+    assert response.content == b"x" * 10
+    assert response.truncated
+
+
+def test_get_stops_at_marker_split_across_chunks(monkeypatch, fake_response) -> None:
+    transport = HttpTransport()
+    body = b"<head>" + b"a" * (64 * 1024 - 9) + b"</HEAD><body>" + b"b" * 200_000
+    monkeypatch.setattr(transport.session, "get", lambda *a, **k: fake_response(200, body))
+
+    response = transport.get("https://example.com", stop_at=b"</head>")
+
+    assert response.content.endswith(b"</HEAD>")
+    assert len(response.content) == body.index(b"</HEAD>") + len(b"</HEAD>")
+    assert response.truncated
+
+
+def test_get_rejects_disallowed_content_type_before_reading(monkeypatch, fake_response) -> None:
+    transport = HttpTransport()
+    raw = fake_response(200, b"%PDF", {"Content-Type": "application/pdf"})
+    raw.iter_content = None
+    monkeypatch.setattr(transport.session, "get", lambda *a, **k: raw)
+
+    with pytest.raises(UnsupportedContentType):
+        transport.get("https://example.com", content_types=("text/html",))
+
+
+def test_content_type_allowlist_matching() -> None:
+    assert content_type_allowed({"content-type": "text/xml; charset=utf-8"}, FEED_TYPES)
+    assert content_type_allowed({"Content-Type": "application/rss+xml"}, FEED_TYPES)
+    assert not content_type_allowed({"Content-Type": "application/zip"}, FEED_TYPES)
+    assert content_type_allowed({}, ("text/html",))
+    assert content_type_allowed({"Content-Type": "image/png"}, None)
+
+
+def test_adapter_block_sets_byte_cap_and_allowlist() -> None:
+    adapter = GeekwireAdapter(
+        {"enabled": True, "max_response_bytes": 2048, "allowed_content_types": ["text/xml"]}
+    )
+
+    options = adapter.request_options(content_types=FEED_TYPES)
+
+    assert options["max_bytes"] == 2048
+    assert options["content_types"] == ("text/xml",)
+
+
+def test_feed_with_binary_content_type_is_permanent_error(monkeypatch, fake_response) -> None:
+    transport = HttpTransport()
+    monkeypatch.setattr(
+        transport.session,
+        "get",
+        lambda *a, **k: fake_response(200, _RSS, {"Content-Type": "application/octet-stream"}),
+    )
+    adapter = GeekwireAdapter({"enabled": True, "url": "https://example.com/feed"}, transport)
+
+    result = adapter.fetch_result()
+
+    assert result.outcome == PERMANENT_ERROR
+    assert "UnsupportedContentType" in result.error
+
+
+def test_fetch_feed_parses_transport_bytes(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "startup_watch.transport.HttpTransport.get",
+        lambda *a, **k: TransportResponse(url="https://example.com/feed", status_code=200, content=_RSS),
+    )
+    adapter = GeekwireAdapter({"enabled": True, "url": "https://example.com/feed"})
+
+    signals = adapter.fetch()
+
+    assert [s.company_name for s in signals] == ["Acme raises seed"]
+    assert signals[0].source_url == "https://example.com/acme"
+
+
+def test_fetch_feed_non_200_is_empty(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "startup_watch.transport.HttpTransport.get",
+        lambda *a, **k: TransportResponse(url="https://example.com/feed", status_code=503),
+    )
+    adapter = GeekwireAdapter({"enabled": True, "url": "https://example.com/feed"})
+
+    assert adapter.fetch() == []
+
+
+def test_enrich_from_website_uses_injected_transport(monkeypatch, fake_response) -> None:
+    transport = HttpTransport()
+    monkeypatch.setattr(
+        transport.session,
+        "get",
+        lambda *a, **k: fake_response(200, b"<title>Acme Robotics</title><p>Raised $4M seed</p>"),
+    )
+    signal = StartupSignal(company_name="Acme", website="https://acme.example")
+
+    enriched = enrich_from_website(signal, transport=transport)
+
+    assert enriched.description == "Acme Robotics"
+    assert enriched.funding_amount == "$4M"
+
+
+def test_enrich_stops_at_head_when_only_title_missing(monkeypatch) -> None:
+    transport = HttpTransport()
+    seen: dict = {}
+
+    def _get(*args, **kwargs):
+        seen.update(kwargs)
+        return TransportResponse(url="https://acme.example", status_code=200,
+                                 content=b"<head><title>Acme</title></head>")
+
+    monkeypatch.setattr(transport, "get", _get)
+    signal = StartupSignal(company_name="Acme", website="https://acme.example",
+                           funding_amount="$4M")
+
+    enriched = enrich_from_website(signal, transport=transport)
+
+    assert enriched.description == "Acme"
+    assert seen["stop_at"] == b"</head>"
+    assert seen["truncate"] and seen["max_bytes"] == 256 * 1024
+
+
+def test_enrich_skips_fetch_when_nothing_missing(monkeypatch) -> None:
+    transport = HttpTransport()
+    monkeypatch.setattr(transport, "get", lambda *a, **k: pytest.fail("fetched"))
+    signal = StartupSignal(company_name="Acme", website="https://acme.example",
+                           description="Robots", funding_amount="$4M")
+
+    assert enrich_from_website(signal, transport=transport) is signal